@@ -0,0 +1 @@
+# 食物分類遊戲：各版本共用模組
@@ -0,0 +1,285 @@
+# ══════════════════════════════════════════════
+# 遊戲數據：放牌與批改事件寫進輪替的 Arrow IPC 串流檔（events/events-日期-時間-pid.arrows）
+# 請求路徑上只把事件丟進佇列，由背景執行緒整批轉成 RecordBatch 追加寫入；
+# 串流格式即使行程被砍，已寫出的批次也讀得回來
+#   FOOD_GAME_EVENTS_DIR：輸出目錄（預設 events）　FOOD_GAME_ANALYTICS=0：關閉
+# 批次報表：python -m food_game.analytics [--dir events] [--top 15] [--csv 輸出目錄]
+# ══════════════════════════════════════════════
+import logging
+import os
+import queue
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+EVENTS_DIR   = os.environ.get("FOOD_GAME_EVENTS_DIR", "events")
+ENABLED      = os.environ.get("FOOD_GAME_ANALYTICS", "1") != "0"
+FLUSH_S      = 2.0                  # 最久多久寫一次
+BATCH_MAX    = 2000                 # 累積這麼多列就提早寫
+ROTATE_BYTES = 64 * 2**20           # 檔案超過就換新檔
+ROTATE_S     = 3600                 # 每小時換新檔（換日也會換）
+
+_LOGGER = logging.getLogger(__name__)
+
+# kind：place＝放入、judge＝提交批改（只記新鎖定的正確與新出現的錯誤，已鎖定、沒退回的錯卡不重複記）
+COLUMNS = ("ts", "variant", "session", "round", "submit_no", "kind", "card", "category", "correct")
+
+
+def _schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("ts",        pa.timestamp("ms")),
+        ("variant",   pa.dictionary(pa.int32(), pa.string())),   # 版本×租戶，數量沒有上限
+        ("session",   pa.string()),
+        ("round",     pa.string()),
+        ("submit_no", pa.int16()),
+        ("kind",      pa.dictionary(pa.int8(), pa.string())),
+        ("card",      pa.dictionary(pa.int16(), pa.string())),
+        ("category",  pa.dictionary(pa.int16(), pa.string())),   # 租戶可自訂類別
+        ("correct",   pa.bool_()),
+    ])
+
+
+class EventLog:
+    def __init__(self, directory: str = EVENTS_DIR):
+        import pyarrow as pa
+
+        self.pa = pa
+        self.schema = _schema()
+        self.directory = directory
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = None
+        self._sink = None
+        self._opened = 0.0
+        self._day = ""
+        self.path = ""
+        self.rows_written = 0
+        threading.Thread(target=self._run, name="analytics-writer", daemon=True).start()
+
+    # ── 請求路徑：只進佇列 ──
+    def put(self, kind: str, variant: str, session: str, round_id: str, submit_no: int,
+            rows: list[tuple[str, str, bool]]):
+        self._queue.put((time.time(), kind, variant, session, round_id, submit_no, rows))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    # ── 背景寫入 ──
+    def _run(self):
+        while True:
+            items, events = [], []
+            item = self._queue.get()
+            deadline = time.monotonic() + FLUSH_S
+            n = 0
+            while True:
+                if isinstance(item, threading.Event):
+                    events.append(item)
+                    break
+                items.append(item)
+                n += len(item[-1])
+                if n >= BATCH_MAX:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if items:
+                try:
+                    self._write(items)
+                except Exception:
+                    _LOGGER.exception("事件寫入失敗，丟棄 %d 筆", n)
+                    self._close()
+            for ev in events:
+                ev.set()
+
+    def _write(self, items: list[tuple]):
+        cols = {c: [] for c in COLUMNS}
+        for ts, kind, variant, session, round_id, submit_no, rows in items:
+            ms = int(ts * 1000)
+            for card, category, correct in rows:
+                cols["ts"].append(ms)
+                cols["variant"].append(variant)
+                cols["session"].append(session)
+                cols["round"].append(round_id)
+                cols["submit_no"].append(submit_no)
+                cols["kind"].append(kind)
+                cols["card"].append(card)
+                cols["category"].append(category)
+                cols["correct"].append(correct)
+        pa = self.pa
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(cols[f.name], type=f.type) for f in self.schema], schema=self.schema,
+        )
+        self._maybe_rotate()
+        self._writer.write_batch(batch)
+        self._sink.flush()
+        self.rows_written += batch.num_rows
+
+    def _maybe_rotate(self):
+        now = time.time()
+        day = time.strftime("%Y%m%d", time.localtime(now))
+        if (self._writer is not None and day == self._day and now - self._opened < ROTATE_S
+                and self._sink.tell() < ROTATE_BYTES):
+            return
+        self._close()
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(
+            self.directory, time.strftime(f"events-%Y%m%d-%H%M%S-{os.getpid()}.arrows", time.localtime(now))
+        )
+        self._sink = self.pa.OSFile(self.path, "wb")
+        self._writer = self.pa.ipc.new_stream(self._sink, self.schema)
+        self._opened, self._day = now, day
+
+    def _close(self):
+        if self._writer is not None:
+            try:
+                self._writer.close()
+                self._sink.close()
+            except Exception:
+                _LOGGER.exception("事件檔關閉失敗：%s", self.path)
+        self._writer = self._sink = None
+
+
+@st.cache_resource
+def get_event_log() -> EventLog | None:
+    if not ENABLED:
+        return None
+    try:
+        return EventLog(EVENTS_DIR)
+    except ImportError:
+        _LOGGER.warning("沒有安裝 pyarrow，不記錄遊戲數據")
+        return None
+
+
+def track(kind: str, rows: list[tuple[str, str, bool]], *, variant: str):
+    """rows：[(卡片, 類別, 是否正確)]；在 callback 或腳本中呼叫皆可"""
+    if not rows:
+        return
+    log = get_event_log()
+    if log is None:
+        return
+    ctx = get_script_run_ctx()
+    ss = st.session_state
+    log.put(kind, variant, ctx.session_id if ctx else "", ss.get("round_id", ""),
+            ss.get("submit_count", 0), rows)
+
+
+# ══════════════════════════════════════════════
+# 批次報表（向量化）：每張卡、每個類別的錯誤率，與最常見的錯放
+# ══════════════════════════════════════════════
+def load_events(directory: str = EVENTS_DIR):
+    import glob
+
+    import pandas as pd
+    import pyarrow as pa
+
+    tables = []
+    for path in sorted(glob.glob(os.path.join(directory, "events-*.arrows"))):
+        try:
+            with pa.OSFile(path, "rb") as f:
+                reader = pa.ipc.open_stream(f)
+                batches = []
+                try:
+                    for b in reader:
+                        batches.append(b)
+                except pa.ArrowInvalid:
+                    pass            # 寫到一半被中斷的最後一批
+                if batches:
+                    tables.append(pa.Table.from_batches(batches))
+        except (OSError, pa.ArrowInvalid):
+            _LOGGER.warning("略過無法讀取的事件檔：%s", path)
+    if not tables:
+        return pd.DataFrame(columns=list(COLUMNS))
+    table = pa.concat_tables(tables, promote_options="permissive")
+    return table.to_pandas()
+
+
+def _wilson_low(errors, n, z: float = 1.96):
+    """錯誤率 95% 信賴下界：樣本少的卡不會因為一兩次失誤就排到最前面"""
+    import numpy as np
+
+    n = np.asarray(n, dtype=float)
+    p = np.divide(errors, n, out=np.zeros_like(n), where=n > 0)
+    denom = 1 + z * z / n.clip(min=1)
+    centre = p + z * z / (2 * n.clip(min=1))
+    margin = z * np.sqrt((p * (1 - p) + z * z / (4 * n.clip(min=1))) / n.clip(min=1))
+    return np.where(n > 0, (centre - margin) / denom, 0.0)
+
+
+def error_report(df) -> dict:
+    """回傳 {"cards", "categories", "confusions", "summary"} 四張 DataFrame"""
+    import numpy as np
+    import pandas as pd
+
+    judge = df[df["kind"] == "judge"]
+    for c in ("card", "category", "variant"):
+        if c in judge and isinstance(judge[c].dtype, pd.CategoricalDtype):
+            judge = judge.assign(**{c: judge[c].astype(str)})
+    # 同一局同一張卡放在同一類只算一次（舊版紀錄裡，沒退回的錯卡每次提交都會再記一筆）
+    judge = judge.sort_values("ts", kind="stable").drop_duplicates(["round", "card", "category"])
+    wrong = ~judge["correct"].astype(bool).to_numpy()
+
+    def rates(keys: list[str]):
+        g = judge.assign(wrong=wrong).groupby(keys, observed=True)["wrong"].agg(["size", "sum"])
+        g.columns = ["judged", "errors"]
+        g["error_rate"] = (g["errors"] / g["judged"]).round(4)
+        g["error_low95"] = np.round(_wilson_low(g["errors"].to_numpy(), g["judged"].to_numpy()), 4)
+        return g.sort_values(["error_low95", "errors"], ascending=False)
+
+    cards = rates(["card"])
+    # 第一次提交就放錯的比例：每局每張卡只看最早的一次批改
+    first = judge.assign(wrong=wrong).sort_values("ts").drop_duplicates(["round", "card"])
+    cards["first_try_error_rate"] = (
+        first.groupby("card", observed=True)["wrong"].mean().reindex(cards.index).round(4)
+    )
+    categories = rates(["category"])     # 被錯放進這一類的比例
+    confusions = (
+        judge[wrong].groupby(["card", "category"], observed=True).size()
+        .rename("errors").sort_values(ascending=False).reset_index()
+    )
+    summary = pd.DataFrame({
+        "events":   [len(df)],
+        "rounds":   [df["round"].nunique()],
+        "sessions": [df["session"].nunique()],
+        "judged":   [len(judge)],
+        "error_rate": [round(float(wrong.mean()), 4) if len(judge) else 0.0],
+    })
+    return {"cards": cards, "categories": categories, "confusions": confusions, "summary": summary}
+
+
+def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="遊戲數據批次報表：每張卡與每個類別的錯誤率")
+    ap.add_argument("--dir", default=EVENTS_DIR)
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--variant", help="只看某個版本")
+    ap.add_argument("--csv", help="把各表另存成 CSV 到這個目錄")
+    a = ap.parse_args()
+    df = load_events(a.dir)
+    if a.variant:
+        df = df[df["variant"].astype(str) == a.variant]
+    if df.empty:
+        print(f"{a.dir} 沒有事件資料")
+        return
+    rep = error_report(df)
+    print(rep["summary"].to_string(index=False))
+    print(f"\n── 最常放錯的卡（依錯誤率 95% 下界）前 {a.top} ──")
+    print(rep["cards"].head(a.top).to_string())
+    print("\n── 各類別被錯放的比例 ──")
+    print(rep["categories"].to_string())
+    print(f"\n── 最常見的錯放 前 {a.top} ──")
+    print(rep["confusions"].head(a.top).to_string(index=False))
+    if a.csv:
+        os.makedirs(a.csv, exist_ok=True)
+        for name, frame in rep.items():
+            frame.to_csv(os.path.join(a.csv, f"{name}.csv"), encoding="utf-8-sig")
+
+
+if __name__ == "__main__":
+    main()
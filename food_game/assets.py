@@ -0,0 +1,23 @@
+# ══════════════════════════════════════════════
+# 靜態資源的位置：卡片圖（食物圖）、注音圖、彩蛋圖與字型
+# 平常圖片從 GitHub、字型從 Google Fonts 載入；離線包（python -m food_game.bundle）
+# 會產生 food_game/bundle_data.py，改由 Streamlit 的靜態檔服務（/app/static/）提供，完全不連外
+#   FOOD_GAME_ASSET_BASE=https://intranet.example/food/   自己指定圖片前綴（底下放三個資料夾）
+# ══════════════════════════════════════════════
+import os
+
+REPO_BASE    = "https://raw.githubusercontent.com/HLH2000/Food_Game/main/"
+IMG_DIR      = "食物圖"
+PHONETIC_DIR = "注音圖"
+EGG_DIR      = "egg"
+FONT_FAMILY  = "Noto Sans TC"
+WEB_FONT_CSS = "@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+TC:wght@400;600;700;900&display=swap');"
+
+try:
+    from food_game import bundle_data as _bundle
+except ImportError:
+    _bundle = None
+
+ASSET_BASE = os.environ.get("FOOD_GAME_ASSET_BASE") or getattr(_bundle, "ASSET_BASE", REPO_BASE)
+# 頁面 <style> 開頭的字型宣告：線上版 @import Google Fonts，離線包是本機子集字型的 @font-face
+FONT_CSS   = getattr(_bundle, "FONT_CSS", WEB_FONT_CSS)
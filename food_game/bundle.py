@@ -0,0 +1,558 @@
+# ══════════════════════════════════════════════
+# 離線包：沒有網路的學校也能玩。指定一個版本，產生可以直接複製過去的資料夾（或 zip）：
+#   <版本腳本>.py、food_game/        遊戲本體（開發工具與快照不用帶）
+#   static/食物圖、注音圖、egg/      本機圖片：縮到畫面用得到的大小、重新壓縮（需要 Pillow，沒有就原檔照搬）
+#   static/fonts/                   Noto Sans TC 子集：只留程式裡出現過的字（需要 fontTools＋brotli）
+#   food_game/bundle_data.py        讓圖片與字型改走 Streamlit 靜態檔服務 /app/static/（見 food_game/assets.py）
+#   .streamlit/config.toml          開靜態檔服務、關使用統計；也不印歡迎訊息（它會去查對外 IP）
+#   requirements.txt                依本機已安裝的版本釘住，含所有相依套件
+#   wheels/                         --wheels 時先下載好安裝檔，學校電腦不必連網就能 pip install
+#   run.sh／run.bat                 啟動器：缺套件時從 wheels/ 安裝，再 streamlit run
+# 做完會在「擋掉所有對外連線」的子行程裡實際啟動一次：伺服器起得來、畫面渲染得出來、
+# 畫面與前端檔案裡沒有外部網址、每個圖片網址都有對應的檔案，任何一項不過結束碼就是 1
+#   python -m food_game.bundle with_eggs
+#   python -m food_game.bundle v8 --zip --wheels --font ~/Downloads/NotoSansTC[wght].ttf
+#   python -m food_game.bundle with_eggs --tenants tenants.json     ← 連同租戶設定與它們的牌組
+#   python -m food_game.bundle --verify dist/food-game-with_eggs    ← 只重跑離線檢查
+# 字型子集只含程式裡的字；學生輸入的名字若有其他字，會退回系統字型顯示
+# ══════════════════════════════════════════════
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import quote, unquote
+
+from food_game.assets import EGG_DIR, FONT_FAMILY, IMG_DIR, PHONETIC_DIR
+
+ROOT         = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PKG_DIR      = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR      = "dist"
+STATIC_BASE  = "/app/static/"       # Streamlit 的靜態檔服務（server.enableStaticServing）
+CARD_PX      = 360      # 卡片圖最長邊：畫面上最大約 180px，留兩倍給高解析螢幕
+PHONETIC_PX  = 480      # 注音圖是橫長條，高度只顯示 36～40px
+EGG_PX       = 1280     # 彩蛋照片原檔 3000～4000px，對話框裡用不到
+JPEG_QUALITY = 80
+FONT_URL     = "https://github.com/google/fonts/raw/main/ofl/notosanstc/NotoSansTC%5Bwght%5D.ttf"
+FONT_NAME    = "NotoSansTC-subset"
+SKIP         = {"__pycache__", "snapshots", "catalog_data.py", "bundle_data.py"}
+NET_LOG_ENV  = "FOOD_GAME_NETGUARD_LOG"
+STARTUP_S    = 60
+
+_FONT_IMPORT_RE = re.compile(r"@import url\('https://fonts\.googleapis\.com/[^']*'\);")
+_EXTERNAL_RE    = re.compile(r"(?:https?|wss?)://(?!localhost[:/]|127\.0\.0\.1[:/]|www\.w3\.org/)[^\s\"'<>)\\]+")
+
+# 離線檢查用的 sitecustomize：子行程（含它再起的 streamlit）一啟動就擋下並記錄所有非本機連線與 DNS 查詢
+_NETGUARD = '''\
+# 自動產生（python -m food_game.bundle 的離線檢查）：擋下並記錄所有非本機的連線與 DNS 查詢
+import os
+import socket
+
+_LOG = os.environ.get("FOOD_GAME_NETGUARD_LOG")
+_LOCAL = {"", "localhost", "::1", "0.0.0.0", "::"}
+
+
+def _check(host, what):
+    host = host.decode() if isinstance(host, bytes) else str(host or "")
+    if host in _LOCAL or host.startswith("127."):
+        return
+    if _LOG:
+        with open(_LOG, "a", encoding="utf-8") as f:
+            f.write(f"{os.getpid()} {what} {host}\\n")
+    raise OSError(101, f"離線檢查：不允許連線到 {host}")
+
+
+_getaddrinfo = socket.getaddrinfo
+_connect, _connect_ex = socket.socket.connect, socket.socket.connect_ex
+
+
+def getaddrinfo(host, *args, **kwargs):
+    _check(host, "dns")
+    return _getaddrinfo(host, *args, **kwargs)
+
+
+def connect(self, address):
+    if self.family in (socket.AF_INET, socket.AF_INET6):
+        _check(address[0], "connect")
+    return _connect(self, address)
+
+
+def connect_ex(self, address):
+    if self.family in (socket.AF_INET, socket.AF_INET6):
+        _check(address[0], "connect")
+    return _connect_ex(self, address)
+
+
+socket.getaddrinfo = getaddrinfo
+socket.socket.connect = connect
+socket.socket.connect_ex = connect_ex
+'''
+
+_CONFIG = '''\
+# 離線包設定（python -m food_game.bundle 產生）
+[server]
+headless = true
+enableStaticServing = true      # static/ 底下的圖片與字型走 /app/static/
+fileWatcherType = "none"
+
+[browser]
+gatherUsageStats = false        # 不送使用統計
+
+[logger]
+hideWelcomeMessage = true       # 歡迎訊息會查本機與對外 IP（連外），網址改由啟動器印
+'''
+
+_RUN_SH = '''\
+#!/bin/sh
+# 食物分類遊戲（{variant}）離線版：python -m food_game.bundle 產生
+cd "$(dirname "$0")" || exit 1
+PY="${{PYTHON:-python3}}"
+if ! "$PY" -c "import streamlit" 2>/dev/null; then
+  if [ -d wheels ]; then
+    "$PY" -m pip install --no-index --find-links wheels -r requirements.txt || exit 1
+  else
+    "$PY" -m pip install -r requirements.txt || exit 1
+  fi
+fi
+echo "開啟瀏覽器：http://localhost:8501（同一個網路的學生改用這台電腦的 IP）"
+exec "$PY" -m streamlit run "{script}" "$@"
+'''
+
+_RUN_BAT = '''\
+@echo off
+rem 食物分類遊戲（{variant}）離線版：python -m food_game.bundle 產生
+chcp 65001 >nul
+cd /d "%~dp0"
+python -c "import streamlit" 2>nul
+if errorlevel 1 (
+  if exist wheels (
+    python -m pip install --no-index --find-links wheels -r requirements.txt || exit /b 1
+  ) else (
+    python -m pip install -r requirements.txt || exit /b 1
+  )
+)
+echo 開啟瀏覽器：http://localhost:8501（同一個網路的學生改用這台電腦的 IP）
+python -m streamlit run "{script}" %*
+'''
+
+
+# ─────────────── 遊戲本體 ───────────────
+def copy_app(variant, out: str, tenants: str | None):
+    shutil.copy2(os.path.join(ROOT, variant.file), os.path.join(out, variant.file))
+    shutil.copytree(PKG_DIR, os.path.join(out, "food_game"), ignore=lambda d, names: SKIP & set(names))
+    if tenants:
+        shutil.copy2(tenants, os.path.join(out, "tenants.json"))
+
+
+def pinned_requirements() -> list[str]:
+    """repo 的 requirements.txt 加上所有相依套件，釘成本機已安裝的版本；
+    平台條件依建置這台電腦判斷，要給 Windows 用就在 Windows 上建"""
+    from importlib import metadata
+
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+
+    with open(os.path.join(ROOT, "requirements.txt"), encoding="utf-8") as f:
+        top = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    pins: dict[str, str] = {}
+    todo = [(Requirement(r), True) for r in top]
+    while todo:
+        req, required = todo.pop()
+        key = canonicalize_name(req.name)
+        if key in pins:
+            continue
+        try:
+            dist = metadata.distribution(req.name)
+        except metadata.PackageNotFoundError:
+            if required:
+                raise SystemExit(f"本機沒有安裝 {req.name}，無法釘版本（pip install -r requirements.txt）")
+            continue
+        pins[key] = f"{dist.metadata['Name']}=={dist.version}"
+        for r in dist.requires or []:
+            dep = Requirement(r)
+            if dep.marker is None or dep.marker.evaluate({"extra": ""}):
+                todo.append((dep, False))
+    tops = {canonicalize_name(Requirement(r).name) for r in top}
+    return [pins[k] for k in sorted(pins, key=lambda k: (k not in tops, k))]
+
+
+def write_requirements(out: str, wheels: bool) -> int:
+    pins = pinned_requirements()
+    path = os.path.join(out, "requirements.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# python -m food_game.bundle 依建置電腦已安裝的版本釘住\n")
+        f.write("\n".join(pins) + "\n")
+    if wheels:
+        subprocess.run([sys.executable, "-m", "pip", "download", "--no-deps", "-q",
+                        "-r", path, "-d", os.path.join(out, "wheels")], check=True)
+    return len(pins)
+
+
+# ─────────────── 圖片 ───────────────
+def reachable_decks(variant, tenants: str | None) -> set[str]:
+    """這個版本與各租戶可能用到的牌組；租戶只能排除卡片，所以整副牌的圖都帶上"""
+    decks = {variant.deck}
+    if tenants:
+        with open(tenants, encoding="utf-8") as f:
+            decks |= {spec.get("deck", variant.deck) for spec in json.load(f).values()}
+    return decks
+
+
+def asset_files(decks: set[str]) -> list[tuple[str, int]]:
+    """要帶的圖片（static/ 底下的相對路徑, 最長邊）；注音與彩蛋可能被網址 ?ff= 打開，一律帶上"""
+    from food_game.catalog import DECK_SPECS, EGG_URLS, WIN_EGG_URL, _base_name
+
+    names = sorted({_base_name(n) for d in decks for n in DECK_SPECS[d][1]})
+    files = [(f"{IMG_DIR}/{n}.jpg", CARD_PX) for n in names]
+    files += [(f"{PHONETIC_DIR}/{n}.jpg", PHONETIC_PX) for n in names]
+    files += [(f"{EGG_DIR}/{unquote(url.rsplit('/', 1)[1])}", EGG_PX) for url in (*EGG_URLS.values(), WIN_EGG_URL)]
+    return files
+
+
+def optimize_image(src: str, dst: str, max_px: int):
+    """縮到 max_px 以內、重新壓成漸進式 JPEG；變大就留原檔。手機照片先依 EXIF 轉正（EXIF 會被拿掉）"""
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        shutil.copy2(src, dst)
+        return
+    with Image.open(src) as im:
+        resized = max(im.size) > max_px
+        out = ImageOps.exif_transpose(im)
+        out.thumbnail((max_px, max_px), Image.LANCZOS)
+        out.convert("RGB").save(dst, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    if not resized and os.path.getsize(dst) >= os.path.getsize(src):
+        shutil.copy2(src, dst)
+
+
+def copy_assets(out: str, files: list[tuple[str, int]]) -> tuple[int, int, list[str]]:
+    """回傳（原始位元組, 輸出位元組, 找不到的檔案）"""
+    before = after = 0
+    missing = []
+    for rel, max_px in files:
+        src = os.path.join(ROOT, rel)
+        if not os.path.exists(src):
+            missing.append(rel)
+            continue
+        dst = os.path.join(out, "static", rel)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        optimize_image(src, dst, max_px)
+        before += os.path.getsize(src)
+        after += os.path.getsize(dst)
+    return before, after, missing
+
+
+# ─────────────── 字型 ───────────────
+def _used_text(out: str) -> str:
+    """離線包裡所有程式、前端檔與租戶設定出現過的字，加上可列印的 ASCII"""
+    chars = set(map(chr, range(0x20, 0x7F))) | set("　，。、：；！？「」（）【】《》…—～✓✗★")
+    for base, _, names in os.walk(out):
+        if "static" in os.path.relpath(base, out).split(os.sep):
+            continue
+        for name in names:
+            if name.endswith((".py", ".html", ".js", ".css", ".json")):
+                with open(os.path.join(base, name), encoding="utf-8", errors="ignore") as f:
+                    chars |= set(f.read())
+    return "".join(sorted(c for c in chars if c.isprintable()))
+
+
+def _fetch_font(source: str, tmp: str) -> str:
+    if not source.startswith(("http://", "https://")):
+        return os.path.expanduser(source)
+    import urllib.request
+
+    path = os.path.join(tmp, "font.ttf")
+    print(f"下載字型：{source}")
+    with urllib.request.urlopen(source, timeout=60) as resp, open(path, "wb") as f:
+        shutil.copyfileobj(resp, f)
+    return path
+
+
+def subset_font(source: str, out: str) -> tuple[str, int] | None:
+    """產生子集字型到 static/fonts/，回傳（static 底下的相對路徑, 位元組）；拿不到字型時回傳 None"""
+    try:
+        from fontTools import subset
+    except ImportError:
+        raise SystemExit("字型子集需要 fontTools：pip install fonttools brotli（或加 --no-font 改用系統字型）")
+    try:
+        import brotli  # noqa: F401
+        flavor, ext = "woff2", ".woff2"
+    except ImportError:
+        flavor, ext = None, ".ttf"
+    with tempfile.TemporaryDirectory(prefix="fg-font-") as tmp:
+        try:
+            src = _fetch_font(source, tmp)
+        except OSError as e:
+            print(f"⚠️ 取不到字型（{e}），改用系統字型；可以先下載再用 --font 指定檔案", file=sys.stderr)
+            return None
+        opts = subset.Options()
+        opts.flavor = flavor
+        opts.layout_features = ["*"]
+        font = subset.load_font(src, opts)
+        subsetter = subset.Subsetter(opts)
+        subsetter.populate(text=_used_text(out))
+        subsetter.subset(font)
+        rel = f"fonts/{FONT_NAME}{ext}"
+        dst = os.path.join(out, "static", rel)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        subset.save_font(font, dst, opts)
+    return rel, os.path.getsize(dst)
+
+
+def font_face_css(rel: str | None) -> str:
+    """取代 Google Fonts @import 的字型宣告；沒有字型時是空字串（CSS 退回 sans-serif）"""
+    if rel is None:
+        return ""
+    fmt = "woff2" if rel.endswith(".woff2") else "truetype"
+    return (f"@font-face {{ font-family: '{FONT_FAMILY}'; src: url('{STATIC_BASE}{rel}') format('{fmt}'); "
+            f"font-weight: 100 900; font-display: swap; }}")
+
+
+# ─────────────── 設定與啟動器 ───────────────
+def write_config(out: str, variant, font_css: str, missing: list[str]):
+    with open(os.path.join(out, "food_game", "bundle_data.py"), "w", encoding="utf-8") as f:
+        f.write("# 自動產生，請勿手改：python -m food_game.bundle（離線包設定，見 food_game/assets.py）\n")
+        f.write(f"VARIANT    = {variant.name!r}\n")
+        f.write(f"BUILT_AT   = {time.strftime('%Y-%m-%dT%H:%M:%S')!r}\n")
+        f.write(f"ASSET_BASE = {STATIC_BASE!r}\n")
+        f.write(f"FONT_CSS   = {font_css!r}\n")
+        f.write(f"MISSING    = {tuple(missing)!r}   # repo 本來就沒有的圖（線上版一樣是破圖）\n")
+    # 前端元件的 iframe 也是同一個伺服器，直接用 /app/static/ 的字型
+    web = os.path.join(out, "food_game", "web")
+    for name in os.listdir(web):
+        if name.endswith((".html", ".css")):
+            path = os.path.join(web, name)
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+            if _FONT_IMPORT_RE.search(text):
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(_FONT_IMPORT_RE.sub(font_css, text))
+    # 網址表依本機前綴重新產生（food_game/catalog_data.py），載入時不必現算
+    subprocess.run([sys.executable, "-m", "food_game.catalog"], cwd=out, check=True,
+                   stdout=subprocess.DEVNULL, env={**os.environ, "PYTHONPATH": ""})
+    os.makedirs(os.path.join(out, ".streamlit"), exist_ok=True)
+    with open(os.path.join(out, ".streamlit", "config.toml"), "w", encoding="utf-8") as f:
+        f.write(_CONFIG)
+    for name, template in (("run.sh", _RUN_SH), ("run.bat", _RUN_BAT)):
+        path = os.path.join(out, name)
+        with open(path, "w", encoding="utf-8", newline="\r\n" if name.endswith(".bat") else "\n") as f:
+            f.write(template.format(variant=variant.name, script=variant.file))
+    os.chmod(os.path.join(out, "run.sh"), 0o755)
+
+
+# ─────────────── 離線檢查 ───────────────
+def _external_urls(text: str) -> list[str]:
+    return sorted(set(_EXTERNAL_RE.findall(text)))
+
+
+def _check_files(variant) -> list[str]:
+    """前端檔案裡的外部網址，以及這個版本（與租戶）會用到的每個圖片網址都有對應的本機檔案"""
+    from food_game.bundle_data import MISSING
+    from food_game.catalog import DECK_SPECS, EGG_URLS, WIN_EGG_URL, img_url, phonetic_url
+    from food_game.component import WEB_DIR
+
+    problems = []
+    for name in sorted(os.listdir(WEB_DIR)):
+        with open(os.path.join(WEB_DIR, name), encoding="utf-8", errors="ignore") as f:
+            problems += [f"web/{name} 有外部網址：{u}" for u in _external_urls(f.read())]
+    urls = [*EGG_URLS.values(), WIN_EGG_URL]
+    for deck in reachable_decks(variant, "tenants.json" if os.path.exists("tenants.json") else None):
+        urls += [fn(n) for n in DECK_SPECS[deck][1] for fn in (img_url, phonetic_url)]
+    for url in dict.fromkeys(urls):
+        rel = unquote(url[len(STATIC_BASE):])
+        if not url.startswith(STATIC_BASE):
+            problems.append(f"圖片不是本機網址：{url}")
+        elif not os.path.exists(os.path.join("static", rel)) and rel not in MISSING:
+            problems.append(f"static/ 裡沒有：{rel}")
+    return problems
+
+
+def _check_render(variant) -> list[str]:
+    """AppTest 渲染每個代表性盤面（food_game/snapshot.py），畫面裡不能有外部網址"""
+    from food_game.flags import resolve_flags
+    from food_game.snapshot import SCENES, render
+
+    queries = [{}, {"ff": "+phonetic"}]
+    if resolve_flags(variant).engine == "with_eggs":
+        queries.append({"hand": "buttons"})
+    problems = []
+    for query in queries:
+        for scene in SCENES:
+            try:
+                tree, _, _ = render(os.path.abspath(variant.file), query, scene, 1)
+            except RuntimeError as e:
+                problems.append(str(e))
+                continue
+            problems += [f"{scene} {query or ''} 畫面有外部網址：{u}"
+                         for u in _external_urls(json.dumps(tree, ensure_ascii=False))]
+    return list(dict.fromkeys(problems))
+
+
+def _check_server(variant) -> list[str]:
+    """照啟動器的方式起伺服器，開一個 session 跑完第一次 rerun，再抓首頁、一張圖與字型"""
+    import asyncio
+    import urllib.request
+
+    import websockets
+
+    from food_game.loadtest import _free_port, _WsSession
+
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, "-m", "streamlit", "run", variant.file, "--server.port", str(port)],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    base = f"http://127.0.0.1:{port}"
+    problems = []
+    try:
+        deadline = time.monotonic() + STARTUP_S
+        while True:
+            try:
+                with urllib.request.urlopen(f"{base}/_stcore/health", timeout=1):
+                    break
+            except OSError:
+                if proc.poll() is not None or time.monotonic() > deadline:
+                    return [f"伺服器沒有起來：{proc.stderr.read().decode(errors='replace')[-500:]}"]
+                time.sleep(0.2)
+
+        async def first_rerun():
+            async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream",
+                                          subprotocols=["streamlit"], max_size=None) as ws:
+                sess = _WsSession(ws, {})
+                ok = await asyncio.wait_for(sess.rerun(), STARTUP_S)
+                return ok, sess.view()
+
+        ok, view = asyncio.run(first_rerun())
+        if not ok or "__exception__" in view.buttons:
+            problems.append(f"第一次 rerun 失敗：{view.buttons.get('__exception__', {}).get('label', '')}")
+        paths = ["/"]
+        static = os.path.join("static", IMG_DIR)
+        if os.path.isdir(static):
+            paths.append(f"{STATIC_BASE}{quote(IMG_DIR)}/{quote(sorted(os.listdir(static))[0])}")
+        fonts = os.path.join("static", "fonts")
+        if os.path.isdir(fonts):
+            paths += [f"{STATIC_BASE}fonts/{name}" for name in os.listdir(fonts)]
+        for path in paths:
+            try:
+                with urllib.request.urlopen(base + path, timeout=10) as resp:
+                    resp.read()
+            except OSError as e:
+                problems.append(f"{unquote(path)} 抓不到：{e}")
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    return problems
+
+
+def self_check(variant_name: str) -> int:
+    """在離線包目錄、擋掉對外連線的子行程裡執行"""
+    from food_game.variants import VARIANTS
+
+    variant = VARIANTS[variant_name]
+    problems = _check_files(variant) + _check_render(variant) + _check_server(variant)
+    for p in problems:
+        print(p)
+    return 1 if problems else 0
+
+
+def verify(out: str, variant_name: str) -> list[str]:
+    """子行程與它起的 streamlit 都載入擋網路的 sitecustomize；有連外嘗試或檢查不過就回報"""
+    with tempfile.TemporaryDirectory(prefix="fg-offline-") as tmp:
+        with open(os.path.join(tmp, "sitecustomize.py"), "w", encoding="utf-8") as f:
+            f.write(_NETGUARD)
+        log = os.path.join(tmp, "blocked.log")
+        env = {k: v for k, v in os.environ.items() if not k.startswith("FOOD_GAME_")}
+        env.update({
+            "PYTHONPATH":          tmp,
+            NET_LOG_ENV:           log,
+            # 排行榜、事件、存檔寫到暫存目錄，不弄髒離線包
+            "FOOD_GAME_DB":        os.path.join(tmp, "lb.db"),
+            "FOOD_GAME_EVENTS_DIR": os.path.join(tmp, "events"),
+            "FOOD_GAME_STATE":     f"disk:{os.path.join(tmp, 'checkpoints')}",
+        })
+        res = subprocess.run([sys.executable, "-m", "food_game.bundle", "--self-check", variant_name],
+                             cwd=out, env=env, capture_output=True, text=True)
+        problems = [line for line in res.stdout.splitlines() if line.strip()]
+        if res.returncode and not problems:
+            problems.append(f"離線檢查異常結束：{res.stderr.strip()[-500:]}")
+        if os.path.exists(log):
+            with open(log, encoding="utf-8") as f:
+                problems += [f"嘗試連外：{line.strip()}" for line in dict.fromkeys(f)]
+    return problems
+
+
+# ─────────────── 主程式 ───────────────
+def _dir_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(b, n)) for b, _, names in os.walk(path) for n in names)
+
+
+def build(args) -> str:
+    from food_game.variants import VARIANTS
+
+    variant = VARIANTS[args.variant]
+    out = os.path.abspath(args.out or os.path.join(OUT_DIR, f"food-game-{variant.name}"))
+    if os.path.exists(out):
+        if not os.path.exists(os.path.join(out, "food_game", "bundle_data.py")):
+            raise SystemExit(f"{out} 已存在且不是之前產生的離線包，不覆寫")
+        shutil.rmtree(out)
+    os.makedirs(out)
+
+    copy_app(variant, out, args.tenants)
+    n_pins = write_requirements(out, args.wheels)
+    before, after, missing = copy_assets(out, asset_files(reachable_decks(variant, args.tenants)))
+    font = None if args.no_font else subset_font(args.font, out)
+    write_config(out, variant, font_face_css(font[0] if font else None), missing)
+
+    print(f"離線包：{out}")
+    print(f"  圖片      {before / 1024:,.0f} KB → {after / 1024:,.0f} KB"
+          + (f"（repo 裡沒有 {len(missing)} 張：{'、'.join(missing[:5])}）" if missing else ""))
+    print(f"  字型      {f'{font[1] / 1024:,.0f} KB（{font[0]}）' if font else '系統字型'}")
+    print(f"  套件      {n_pins} 個釘住版本" + ("，安裝檔在 wheels/" if args.wheels else ""))
+    print(f"  總大小    {_dir_size(out) / 1024 / 1024:.1f} MB")
+    return out
+
+
+def main(argv: list[str] | None = None):
+    from food_game.variants import VARIANTS
+
+    ap = argparse.ArgumentParser(description="產生不需要網路的離線包（本機圖片、子集字型、釘住的套件與啟動器）")
+    ap.add_argument("variant", nargs="?", default="with_eggs", choices=list(VARIANTS),
+                    help="版本（python -m food_game.variants 列出全部）")
+    ap.add_argument("--out", help=f"輸出資料夾，預設 {OUT_DIR}/food-game-<版本>")
+    ap.add_argument("--zip", action="store_true", help="另外打包成 zip")
+    ap.add_argument("--font", default=FONT_URL, help="Noto Sans TC 字型檔或網址（TTF／OTF）")
+    ap.add_argument("--no-font", action="store_true", help="不帶字型，改用系統字型")
+    ap.add_argument("--tenants", help="一起帶上的租戶設定檔（tenants.json）")
+    ap.add_argument("--wheels", action="store_true", help="下載套件安裝檔到 wheels/，離線安裝用")
+    ap.add_argument("--no-verify", action="store_true", help="不跑離線檢查")
+    ap.add_argument("--verify", metavar="DIR", help="只對已產生的離線包跑離線檢查")
+    ap.add_argument("--self-check", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.self_check:
+        sys.exit(self_check(args.variant))
+    if args.verify:
+        import runpy
+
+        out = os.path.abspath(args.verify)
+        variant_name = runpy.run_path(os.path.join(out, "food_game", "bundle_data.py"))["VARIANT"]
+    else:
+        out = build(args)
+        variant_name = args.variant
+
+    if not args.no_verify:
+        problems = verify(out, variant_name)
+        print("離線檢查：" + ("✓ 啟動與渲染都沒有連外" if not problems else f"✗ {len(problems)} 個問題"))
+        for p in problems:
+            print(f"  {p}")
+        if problems:
+            sys.exit(1)
+    if args.zip:
+        archive = shutil.make_archive(out, "zip", os.path.dirname(out), os.path.basename(out))
+        print(f"zip：{archive}（{os.path.getsize(archive) / 1024 / 1024:.1f} MB）")
+
+
+if __name__ == "__main__":
+    main()
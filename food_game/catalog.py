@@ -0,0 +1,396 @@
+# ══════════════════════════════════════════════
+# 牌組目錄與多租戶：卡片、類別配色、圖片 URL、預先渲染的卡片 HTML
+# 都是整個行程共用的唯讀資料——模組載入時建一次，不再隨每次 rerun 重建；
+# 一副牌（Catalog）依「基本牌組＋排除的卡」由 cache_resource 共用，
+# 每個租戶（學校／班級）只保存自己跟預設值不同的設定
+#   租戶設定檔：FOOD_GAME_TENANTS（預設 tenants.json，修改後自動重新載入）
+#   網址 ?t=<租戶 id> 選用；沒帶參數時用 FOOD_GAME_TENANT，再沒有就是預設牌組
+#   {"school-a": {"title": "🍽️ 仁愛國小", "deck": "classic", "exclude": ["★披薩"],
+#                 "base_score": 30, "hand": "buttons", "flags": {"eggs": false}}}
+#   "flags" 的開關名稱見 food_game/flags.py
+# 圖片網址表預先產生在 food_game/catalog_data.py（改了卡片或網址前綴後重跑
+# python -m food_game.catalog），載入時不必逐張 quote()；檔案不存在或過期就照舊現算
+# ══════════════════════════════════════════════
+import functools
+import html
+import json
+import logging
+import os
+import zlib
+from types import MappingProxyType
+from urllib.parse import quote
+
+import streamlit as st
+
+from food_game.assets import ASSET_BASE, EGG_DIR, IMG_DIR, PHONETIC_DIR
+
+TENANTS_PATH   = os.environ.get("FOOD_GAME_TENANTS", "tenants.json")
+DEFAULT_TENANT = os.environ.get("FOOD_GAME_TENANT", "")
+DEFAULT_TITLE  = "🍽️ 食物分類遊戲"
+DEFAULT_SCORE  = 50
+
+_LOGGER = logging.getLogger(__name__)
+
+# ─────────────── 圖片（預設在 GitHub；離線包改成本機，見 food_game/assets.py）───────────────
+GITHUB_BASE   = ASSET_BASE + quote(IMG_DIR) + "/"
+EGG_BASE      = ASSET_BASE + quote(EGG_DIR) + "/"
+PHONETIC_BASE = ASSET_BASE + quote(PHONETIC_DIR) + "/"
+
+# 彩蛋圖片（第2、3、4次提交）與通關彩蛋
+EGG_URLS = MappingProxyType({
+    2: EGG_BASE + quote("彩蛋1", safe="") + ".jpg",
+    3: EGG_BASE + quote("彩蛋3", safe="") + ".jpg",
+    4: EGG_BASE + quote("彩蛋2", safe="") + ".jpg",
+})
+WIN_EGG_URL = EGG_BASE + "IMG_20260213_213401.jpg"
+
+# ─────────────── 類別與卡片 ───────────────
+# 類別以「欄位」記：各版本的標籤文字不同（蔬菜／蔬菜/五穀澱粉），配色與規則一致
+MEAT, VEG, FRUIT, SWEET = range(4)
+CATEGORIES  = ("🥩 肉類/海鮮", "🥦 蔬菜/五穀澱粉", "🍎 水果", "🧁 甜點/飲料")
+SLOT_COLORS = ("#B91C1C", "#15803D", "#C2410C", "#6D28D9")
+
+# 全部卡片 → 可放入的類別欄位（兩個以上＝特殊卡）
+CARD_SLOTS = MappingProxyType({
+    "培根": (MEAT,), "牛排": (MEAT,), "炸雞": (MEAT,), "烤雞腿": (MEAT,), "熟蝦": (MEAT,),
+    "鮭魚": (MEAT,), "鮪魚": (MEAT,), "龍蝦": (MEAT,), "螃蟹": (MEAT,), "扇貝": (MEAT,),
+    "臘肉": (MEAT,), "雞排": (MEAT,),
+    "南瓜": (VEG,), "大白菜": (VEG,), "彩椒": (VEG,), "玉米": (VEG,), "白蘿蔔": (VEG,),
+    "紫甘藍": (VEG,), "茄子": (VEG,), "蘆筍": (VEG,), "青花菜": (VEG,), "杏鮑菇": (VEG,),
+    "蕈菇": (VEG,),
+    "奇異果": (FRUIT,), "木瓜": (FRUIT,), "橘子": (FRUIT,), "水蜜桃": (FRUIT,), "西瓜": (FRUIT,),
+    "藍莓": (FRUIT,),
+    "切片起司": (SWEET,), "千層派": (SWEET,), "巧克力": (SWEET,), "巧克力豆餅": (SWEET,),
+    "甜甜圈": (SWEET,), "湯圓": (SWEET,), "糖果": (SWEET,), "糖葫蘆": (SWEET,), "鯛魚燒": (SWEET,),
+    "優格": (SWEET,), "優酪乳": (SWEET,), "珍珠奶茶": (SWEET,), "爆米花": (SWEET,),
+    "★藍莓起司蛋糕": (FRUIT, SWEET),
+    "★披薩":         (VEG, SWEET),
+    "★涼拌豆腐":     (VEG, SWEET),
+    "★滷肉飯":       (MEAT, VEG),
+    # 1.0 版的牌
+    "雞腿": (MEAT,), "蝦子": (MEAT,), "青花椰": (VEG,), "紅蘿蔔": (VEG,), "番茄": (VEG,),
+    "蘋果": (FRUIT,), "香蕉": (FRUIT,), "草莓": (FRUIT,),
+    "蛋糕": (SWEET,), "冰淇淋": (SWEET,), "餅乾": (SWEET,),
+    "★草莓蛋糕": (FRUIT, SWEET), "★玉米濃湯": (VEG, MEAT),
+    "★水果冰淇淋": (FRUIT, SWEET), "★番茄炒蛋": (VEG, MEAT),
+})
+
+_WITH_EGGS = (
+    "培根", "牛排", "炸雞", "烤雞腿", "熟蝦", "鮭魚", "鮪魚", "龍蝦", "螃蟹", "扇貝", "臘肉", "雞排",
+    "南瓜", "大白菜", "彩椒", "玉米", "白蘿蔔", "紫甘藍", "茄子", "蘆筍", "青花菜", "杏鮑菇", "蕈菇",
+    "奇異果", "木瓜", "橘子", "水蜜桃", "西瓜", "藍莓",
+    "切片起司", "巧克力", "巧克力豆餅", "甜甜圈", "湯圓", "糖果", "糖葫蘆", "鯛魚燒", "優格", "優酪乳",
+    "珍珠奶茶", "爆米花",
+    "★藍莓起司蛋糕", "★披薩",
+)
+
+# 基本牌組：名稱 →（四個類別標籤, 卡片順序, 與 CARD_SLOTS 不同的規則）
+DECK_SPECS = MappingProxyType({
+    "with_eggs": (CATEGORIES, _WITH_EGGS, {}),
+    "v8": (CATEGORIES, tuple(n for n in _WITH_EGGS if n not in ("湯圓", "★披薩")), {}),
+    # food_game 2～10：「🥦 蔬菜」、千層派取代切片起司、披薩算肉類＋蔬菜，另有兩張特殊卡
+    "classic": (
+        ("🥩 肉類/海鮮", "🥦 蔬菜", "🍎 水果", "🧁 甜點/飲料"),
+        tuple("千層派" if n == "切片起司" else n for n in _WITH_EGGS) + ("★涼拌豆腐", "★滷肉飯"),
+        {"★披薩": (MEAT, VEG)},
+    ),
+    "v1": (
+        ("🥩 肉類", "🥦 蔬菜", "🍎 水果", "🧁 甜點"),
+        ("牛排", "雞腿", "培根", "蝦子", "青花椰", "紅蘿蔔", "玉米", "番茄", "蘋果", "香蕉", "草莓",
+         "西瓜", "蛋糕", "冰淇淋", "餅乾", "★草莓蛋糕", "★玉米濃湯", "★水果冰淇淋", "★番茄炒蛋"),
+        {},
+    ),
+})
+
+# 沒有圖片時的彩色字卡底色：1.0 版原本的配色，其他卡依第一個類別
+CARD_COLORS = MappingProxyType({
+    "牛排": "#FECACA", "雞腿": "#FED7AA", "培根": "#FCA5A5", "蝦子": "#FDBA74",
+    "青花椰": "#86EFAC", "紅蘿蔔": "#FCA5A5", "玉米": "#FDE68A", "番茄": "#FCA5A5",
+    "蘋果": "#FCA5A5", "香蕉": "#FDE68A", "草莓": "#FECDD3", "西瓜": "#BBF7D0",
+    "蛋糕": "#E9D5FF", "冰淇淋": "#BFDBFE", "餅乾": "#FDE68A",
+    "★草莓蛋糕": "#F5D0FE", "★玉米濃湯": "#D1FAE5", "★水果冰淇淋": "#BAE6FD", "★番茄炒蛋": "#FED7AA",
+})
+SLOT_TILES = ("#FECACA", "#BBF7D0", "#FED7AA", "#E9D5FF")
+
+# ══════════════════════════════════════════════
+# 預先建好的查表：圖片 URL 與卡片 HTML（每張卡的每種狀態各一份字串）
+# ══════════════════════════════════════════════
+def _base_name(card_name: str) -> str:
+    return card_name.lstrip("★").strip()
+
+
+def _source_key() -> int:
+    """網址表的來源指紋：卡片或網址前綴改了，預先產生的表就不再沿用"""
+    return zlib.crc32(repr((GITHUB_BASE, PHONETIC_BASE, tuple(CARD_SLOTS))).encode())
+
+
+def _build_urls(base: str) -> dict[str, str]:
+    return {_base_name(n): base + quote(_base_name(n), safe="") + ".jpg" for n in CARD_SLOTS}
+
+
+try:
+    from food_game import catalog_data as _data
+except ImportError:
+    _data = None
+if _data is not None and _data.SOURCE_KEY == _source_key():
+    _IMG_URLS, _PHONETIC_URLS = _data.IMG_URLS, _data.PHONETIC_URLS
+else:
+    _IMG_URLS, _PHONETIC_URLS = _build_urls(GITHUB_BASE), _build_urls(PHONETIC_BASE)
+_IMG_URLS      = MappingProxyType(_IMG_URLS)
+_PHONETIC_URLS = MappingProxyType(_PHONETIC_URLS)
+
+
+def _local_images() -> frozenset[str] | None:
+    """本機有圖的卡（檔名去掉副檔名）：離線包看 static/ 底下，平常看 repo 裡的資料夾；
+    兩邊都沒有（只部署程式、圖片放在別處）時回傳 None，一律當作有圖"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for folder in (os.path.join(root, "static", IMG_DIR), os.path.join(root, IMG_DIR)):
+        try:
+            return frozenset(os.path.splitext(f)[0] for f in os.listdir(folder))
+        except OSError:
+            continue
+    return None
+
+
+_IMAGES = _local_images()
+
+
+def has_image(card_name: str) -> bool:
+    return _IMAGES is None or _base_name(card_name) in _IMAGES
+
+
+def tile_color(card_name: str) -> str:
+    return CARD_COLORS.get(card_name) or SLOT_TILES[CARD_SLOTS.get(card_name, (VEG,))[0]]
+
+
+def card_media(card_name: str) -> dict:
+    """元件用的卡面：{"url": 圖片}；沒有圖時 {"url": None, "tile": 底色}，前端改畫彩色字卡"""
+    if has_image(card_name):
+        return {"url": img_url(card_name)}
+    return {"url": None, "tile": tile_color(card_name)}
+
+
+def img_url(card_name: str) -> str:
+    """查表，O(1)；不在目錄內的卡照規則組出 URL"""
+    base = _base_name(card_name)
+    return _IMG_URLS.get(base) or GITHUB_BASE + quote(base, safe="") + ".jpg"
+
+
+def phonetic_url(card_name: str) -> str:
+    """注音標籤圖（只有開啟注音的版本會用到）"""
+    base = _base_name(card_name)
+    return _PHONETIC_URLS.get(base) or PHONETIC_BASE + quote(base, safe="") + ".jpg"
+
+
+def _img_html(name: str, cls: str) -> str:
+    if has_image(name):
+        return f'<img src="{img_url(name)}" class="{cls}" loading="lazy">'
+    # repo 裡沒有這張卡的圖：跟最早的 1.0 版一樣改用彩色字卡，而不是破圖
+    return (
+        f'<div class="{cls}" style="background:{tile_color(name)};display:flex;align-items:center;'
+        f'justify-content:center;text-align:center;font-weight:900;color:#111827;padding:4px;">'
+        f'{html.escape(_base_name(name))}</div>'
+    )
+
+
+def _label_html(name: str, text: str, phonetic: bool) -> str:
+    if phonetic:
+        return f'<img src="{phonetic_url(name)}" alt="{_base_name(name)}" loading="lazy">'
+    return text
+
+
+def _render_hand(name: str, selected: bool, phonetic: bool) -> str:
+    special = len(CARD_SLOTS.get(name, ())) > 1
+    sel_c = "sel" if selected else ""
+    sp_c  = "sp" if special else ""
+    nm_c  = "sp-name" if special else ""
+    chk   = '<div class="badge-sel">✓</div>' if selected else ""
+    star  = '<div class="badge-star">★特殊</div>' if special else ""
+    return (
+        f'<div class="card-visual {sel_c} {sp_c}">{chk}{star}'
+        f'{_img_html(name, "card-img")}'
+        f'<div class="card-name {nm_c}">{_label_html(name, name, phonetic)}</div></div>'
+    )
+
+
+# 已放置卡片的三種狀態："c"＝正確／已鎖定、"w"＝錯誤、""＝尚未批改
+_PLACED_STYLE = {
+    "c": ("pc", '<div class="pcard-ov c">✓</div>', "lc"),
+    "w": ("pw", '<div class="pcard-ov w">✗</div>', "lw"),
+    "":  ("", "", ""),
+}
+
+
+def _render_placed(name: str, state: str, phonetic: bool) -> str:
+    pw, ov_html, lc = _PLACED_STYLE[state]
+    return (
+        f'<div class="pcard {pw}">{ov_html}'
+        f'{_img_html(name, "pcard-img")}'
+        f'<div class="pcard-lbl {lc}">{_label_html(name, _base_name(name), phonetic)}</div></div>'
+    )
+
+
+@functools.cache
+def hand_card_html(name: str, selected: bool, phonetic: bool = False) -> str:
+    """每張卡、每種狀態只組一次字串，之後所有 session 共用"""
+    return _render_hand(name, selected, phonetic)
+
+
+def placed_state(is_locked: bool, result: str | None) -> str:
+    if is_locked or result == "correct":
+        return "c"
+    return "w" if result == "wrong" else ""
+
+
+@functools.cache
+def placed_card_html(name: str, state: str, phonetic: bool = False) -> str:
+    return _render_placed(name, state, phonetic)
+
+
+# ══════════════════════════════════════════════
+# 牌組與租戶
+# ══════════════════════════════════════════════
+class Catalog:
+    """一副牌的唯讀檢視：類別標籤、配色、卡片規則與出牌前的順序"""
+    __slots__ = ("categories", "cat_style", "deck", "cards", "total_needed")
+
+    def __init__(self, categories: tuple[str, ...], deck: tuple[str, ...],
+                 slots: dict[str, tuple[int, ...]]):
+        self.categories = categories
+        self.cat_style = MappingProxyType({
+            label: MappingProxyType({"hdr": color, "border": color})
+            for label, color in zip(categories, SLOT_COLORS)
+        })
+        self.deck = deck
+        self.cards = MappingProxyType({
+            n: MappingProxyType({
+                "valid":   tuple(categories[i] for i in slots[n]),
+                "special": len(slots[n]) > 1,
+            })
+            for n in deck
+        })
+        self.total_needed = sum(len(slots[n]) for n in deck)
+
+
+# 牌組與租戶都是純資料：用模組層的 functools 快取（每次 rerun 查表約 1 µs），
+# 不用 st.cache_resource（每次呼叫要雜湊參數，約 30～250 µs，啟動時還要讀原始碼算函式 key）
+@functools.cache
+def get_catalog(deck: str, exclude: frozenset[str] = frozenset()) -> Catalog:
+    """同樣的（基本牌組, 排除名單）在整個行程只有一份"""
+    categories, names, overrides = DECK_SPECS[deck]
+    slots = {**CARD_SLOTS, **overrides}
+    return Catalog(categories, tuple(n for n in names if n not in exclude), slots)
+
+
+class Tenant:
+    """租戶＝版本預設值＋差異；沒寫的欄位沿用版本預設"""
+    __slots__ = ("id", "title", "catalog", "base_score", "hand_mode", "flags")
+
+    def __init__(self, tenant_id: str, catalog: Catalog, *, title: str = DEFAULT_TITLE,
+                 base_score: int = DEFAULT_SCORE, hand_mode: str | None = None,
+                 flags: dict[str, bool] | None = None):
+        self.id = tenant_id
+        self.title = title
+        self.catalog = catalog
+        self.base_score = base_score
+        self.hand_mode = hand_mode
+        self.flags = MappingProxyType(dict(flags or {}))
+
+    @property
+    def title_html(self) -> str:
+        return html.escape(self.title)
+
+    def tag(self, variant: str) -> str:
+        """排行榜／統計用的版本代號：各租戶分開計算"""
+        return f"{variant}@{self.id}" if self.id else variant
+
+    def scope(self, room: str | None) -> str | None:
+        """課堂／競賽房間名稱加上租戶前綴，不同學校的「3A」不會撞在一起"""
+        return f"{self.id}/{room}" if self.id and room else room
+
+
+def _tenant_from_spec(tenant_id: str, spec: dict, deck: str, exclude: frozenset[str]) -> Tenant:
+    """沒指定牌組就沿用版本的牌組與排除名單，再加上租戶自己的排除"""
+    if spec.get("deck") is not None:
+        if spec["deck"] in DECK_SPECS:
+            deck, exclude = spec["deck"], frozenset()
+        else:
+            _LOGGER.warning("租戶 %s 的牌組 %r 不存在，改用 %s", tenant_id, spec["deck"], deck)
+    names = DECK_SPECS[deck][1]
+    extra = (exclude | frozenset(spec.get("exclude") or ())) & frozenset(names)
+    if len(extra) >= len(names):
+        _LOGGER.warning("租戶 %s 排除了全部卡片，忽略排除名單", tenant_id)
+        extra = exclude
+    return Tenant(
+        tenant_id, get_catalog(deck, extra),
+        title=str(spec.get("title") or DEFAULT_TITLE),
+        base_score=int(spec.get("base_score") or DEFAULT_SCORE),
+        hand_mode=spec.get("hand"),
+        flags=spec.get("flags") if isinstance(spec.get("flags"), dict) else None,
+    )
+
+
+def _specs_mtime() -> float:
+    try:
+        return os.stat(TENANTS_PATH).st_mtime
+    except OSError:
+        return 0.0
+
+
+@functools.lru_cache(maxsize=4)
+def _load_tenant_specs(path: str, mtime: float) -> MappingProxyType:
+    """設定檔依修改時間快取：改了檔案，下一次 rerun 就會用新的設定"""
+    if not mtime:
+        return MappingProxyType({})
+    try:
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError) as e:
+        _LOGGER.warning("讀不到租戶設定 %s：%s", path, e)
+        return MappingProxyType({})
+    if not isinstance(raw, dict):
+        _LOGGER.warning("租戶設定 %s 應為物件 {租戶 id: 設定}", path)
+        return MappingProxyType({})
+    return MappingProxyType({str(k): v for k, v in raw.items() if isinstance(v, dict)})
+
+
+@functools.lru_cache(maxsize=256)
+def _tenant(tenant_id: str, deck: str, exclude: frozenset[str], mtime: float) -> Tenant:
+    spec = _load_tenant_specs(TENANTS_PATH, mtime).get(tenant_id)
+    if spec is None:
+        return Tenant("", get_catalog(deck, exclude))
+    return _tenant_from_spec(tenant_id, spec, deck, exclude)
+
+
+def current_tenant(deck: str, exclude: frozenset[str] = frozenset()) -> Tenant:
+    """依網址 ?t= 取得租戶；不認識的 id 一律回到版本預設的牌組"""
+    tenant_id = st.query_params.get("t") or DEFAULT_TENANT
+    mtime = _specs_mtime()
+    if tenant_id not in _load_tenant_specs(TENANTS_PATH, mtime):
+        tenant_id = ""
+    return _tenant(tenant_id, deck, exclude, mtime)
+
+
+# ══════════════════════════════════════════════
+# 預先產生網址表：python -m food_game.catalog
+# ══════════════════════════════════════════════
+def _write_table(f, name: str, table: dict[str, str]):
+    f.write(f"{name} = {{\n")
+    for k, v in table.items():
+        f.write(f"    {k!r}: {v!r},\n")
+    f.write("}\n")
+
+
+def main():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog_data.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# 自動產生，請勿手改：python -m food_game.catalog（來源見 food_game/catalog.py）\n")
+        f.write(f"SOURCE_KEY = {_source_key()}\n\n")
+        _write_table(f, "IMG_URLS", _build_urls(GITHUB_BASE))
+        f.write("\n")
+        _write_table(f, "PHONETIC_URLS", _build_urls(PHONETIC_BASE))
+    print(f"已寫入 {path}（{len(CARD_SLOTS)} 張卡）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# 自動產生，請勿手改：python -m food_game.catalog（來源見 food_game/catalog.py）
+SOURCE_KEY = 2500525447
+
+IMG_URLS = {
+    '培根': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%9F%B9%E6%A0%B9.jpg',
+    '牛排': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%89%9B%E6%8E%92.jpg',
+    '炸雞': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%82%B8%E9%9B%9E.jpg',
+    '烤雞腿': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%83%A4%E9%9B%9E%E8%85%BF.jpg',
+    '熟蝦': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%86%9F%E8%9D%A6.jpg',
+    '鮭魚': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%AE%AD%E9%AD%9A.jpg',
+    '鮪魚': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%AE%AA%E9%AD%9A.jpg',
+    '龍蝦': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%BE%8D%E8%9D%A6.jpg',
+    '螃蟹': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%9E%83%E8%9F%B9.jpg',
+    '扇貝': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%89%87%E8%B2%9D.jpg',
+    '臘肉': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%87%98%E8%82%89.jpg',
+    '雞排': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%9B%9E%E6%8E%92.jpg',
+    '南瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%8D%97%E7%93%9C.jpg',
+    '大白菜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%A4%A7%E7%99%BD%E8%8F%9C.jpg',
+    '彩椒': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%BD%A9%E6%A4%92.jpg',
+    '玉米': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%8E%89%E7%B1%B3.jpg',
+    '白蘿蔔': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%99%BD%E8%98%BF%E8%94%94.jpg',
+    '紫甘藍': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%B4%AB%E7%94%98%E8%97%8D.jpg',
+    '茄子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%8C%84%E5%AD%90.jpg',
+    '蘆筍': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%98%86%E7%AD%8D.jpg',
+    '青花菜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%9D%92%E8%8A%B1%E8%8F%9C.jpg',
+    '杏鮑菇': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%9D%8F%E9%AE%91%E8%8F%87.jpg',
+    '蕈菇': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%95%88%E8%8F%87.jpg',
+    '奇異果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%A5%87%E7%95%B0%E6%9E%9C.jpg',
+    '木瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%9C%A8%E7%93%9C.jpg',
+    '橘子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%A9%98%E5%AD%90.jpg',
+    '水蜜桃': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%B0%B4%E8%9C%9C%E6%A1%83.jpg',
+    '西瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%A5%BF%E7%93%9C.jpg',
+    '藍莓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%97%8D%E8%8E%93.jpg',
+    '切片起司': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%88%87%E7%89%87%E8%B5%B7%E5%8F%B8.jpg',
+    '千層派': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%8D%83%E5%B1%A4%E6%B4%BE.jpg',
+    '巧克力': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%B7%A7%E5%85%8B%E5%8A%9B.jpg',
+    '巧克力豆餅': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%B7%A7%E5%85%8B%E5%8A%9B%E8%B1%86%E9%A4%85.jpg',
+    '甜甜圈': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%94%9C%E7%94%9C%E5%9C%88.jpg',
+    '湯圓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%B9%AF%E5%9C%93.jpg',
+    '糖果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%B3%96%E6%9E%9C.jpg',
+    '糖葫蘆': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%B3%96%E8%91%AB%E8%98%86.jpg',
+    '鯛魚燒': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%AF%9B%E9%AD%9A%E7%87%92.jpg',
+    '優格': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%84%AA%E6%A0%BC.jpg',
+    '優酪乳': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%84%AA%E9%85%AA%E4%B9%B3.jpg',
+    '珍珠奶茶': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%8F%8D%E7%8F%A0%E5%A5%B6%E8%8C%B6.jpg',
+    '爆米花': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%88%86%E7%B1%B3%E8%8A%B1.jpg',
+    '藍莓起司蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%97%8D%E8%8E%93%E8%B5%B7%E5%8F%B8%E8%9B%8B%E7%B3%95.jpg',
+    '披薩': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%8A%AB%E8%96%A9.jpg',
+    '涼拌豆腐': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%B6%BC%E6%8B%8C%E8%B1%86%E8%85%90.jpg',
+    '滷肉飯': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%BB%B7%E8%82%89%E9%A3%AF.jpg',
+    '雞腿': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%9B%9E%E8%85%BF.jpg',
+    '蝦子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%9D%A6%E5%AD%90.jpg',
+    '青花椰': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%9D%92%E8%8A%B1%E6%A4%B0.jpg',
+    '紅蘿蔔': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%B4%85%E8%98%BF%E8%94%94.jpg',
+    '番茄': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%95%AA%E8%8C%84.jpg',
+    '蘋果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%98%8B%E6%9E%9C.jpg',
+    '香蕉': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%A6%99%E8%95%89.jpg',
+    '草莓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%8D%89%E8%8E%93.jpg',
+    '蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%9B%8B%E7%B3%95.jpg',
+    '冰淇淋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E5%86%B0%E6%B7%87%E6%B7%8B.jpg',
+    '餅乾': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E9%A4%85%E4%B9%BE.jpg',
+    '草莓蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E8%8D%89%E8%8E%93%E8%9B%8B%E7%B3%95.jpg',
+    '玉米濃湯': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%8E%89%E7%B1%B3%E6%BF%83%E6%B9%AF.jpg',
+    '水果冰淇淋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E6%B0%B4%E6%9E%9C%E5%86%B0%E6%B7%87%E6%B7%8B.jpg',
+    '番茄炒蛋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E9%A3%9F%E7%89%A9%E5%9C%96/%E7%95%AA%E8%8C%84%E7%82%92%E8%9B%8B.jpg',
+}
+
+PHONETIC_URLS = {
+    '培根': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%9F%B9%E6%A0%B9.jpg',
+    '牛排': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%89%9B%E6%8E%92.jpg',
+    '炸雞': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%82%B8%E9%9B%9E.jpg',
+    '烤雞腿': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%83%A4%E9%9B%9E%E8%85%BF.jpg',
+    '熟蝦': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%86%9F%E8%9D%A6.jpg',
+    '鮭魚': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%AE%AD%E9%AD%9A.jpg',
+    '鮪魚': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%AE%AA%E9%AD%9A.jpg',
+    '龍蝦': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%BE%8D%E8%9D%A6.jpg',
+    '螃蟹': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%9E%83%E8%9F%B9.jpg',
+    '扇貝': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%89%87%E8%B2%9D.jpg',
+    '臘肉': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%87%98%E8%82%89.jpg',
+    '雞排': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%9B%9E%E6%8E%92.jpg',
+    '南瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%8D%97%E7%93%9C.jpg',
+    '大白菜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%A4%A7%E7%99%BD%E8%8F%9C.jpg',
+    '彩椒': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%BD%A9%E6%A4%92.jpg',
+    '玉米': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%8E%89%E7%B1%B3.jpg',
+    '白蘿蔔': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%99%BD%E8%98%BF%E8%94%94.jpg',
+    '紫甘藍': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%B4%AB%E7%94%98%E8%97%8D.jpg',
+    '茄子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%8C%84%E5%AD%90.jpg',
+    '蘆筍': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%98%86%E7%AD%8D.jpg',
+    '青花菜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%9D%92%E8%8A%B1%E8%8F%9C.jpg',
+    '杏鮑菇': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%9D%8F%E9%AE%91%E8%8F%87.jpg',
+    '蕈菇': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%95%88%E8%8F%87.jpg',
+    '奇異果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%A5%87%E7%95%B0%E6%9E%9C.jpg',
+    '木瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%9C%A8%E7%93%9C.jpg',
+    '橘子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%A9%98%E5%AD%90.jpg',
+    '水蜜桃': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%B0%B4%E8%9C%9C%E6%A1%83.jpg',
+    '西瓜': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%A5%BF%E7%93%9C.jpg',
+    '藍莓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%97%8D%E8%8E%93.jpg',
+    '切片起司': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%88%87%E7%89%87%E8%B5%B7%E5%8F%B8.jpg',
+    '千層派': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%8D%83%E5%B1%A4%E6%B4%BE.jpg',
+    '巧克力': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%B7%A7%E5%85%8B%E5%8A%9B.jpg',
+    '巧克力豆餅': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%B7%A7%E5%85%8B%E5%8A%9B%E8%B1%86%E9%A4%85.jpg',
+    '甜甜圈': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%94%9C%E7%94%9C%E5%9C%88.jpg',
+    '湯圓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%B9%AF%E5%9C%93.jpg',
+    '糖果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%B3%96%E6%9E%9C.jpg',
+    '糖葫蘆': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%B3%96%E8%91%AB%E8%98%86.jpg',
+    '鯛魚燒': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%AF%9B%E9%AD%9A%E7%87%92.jpg',
+    '優格': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%84%AA%E6%A0%BC.jpg',
+    '優酪乳': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%84%AA%E9%85%AA%E4%B9%B3.jpg',
+    '珍珠奶茶': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%8F%8D%E7%8F%A0%E5%A5%B6%E8%8C%B6.jpg',
+    '爆米花': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%88%86%E7%B1%B3%E8%8A%B1.jpg',
+    '藍莓起司蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%97%8D%E8%8E%93%E8%B5%B7%E5%8F%B8%E8%9B%8B%E7%B3%95.jpg',
+    '披薩': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%8A%AB%E8%96%A9.jpg',
+    '涼拌豆腐': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%B6%BC%E6%8B%8C%E8%B1%86%E8%85%90.jpg',
+    '滷肉飯': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%BB%B7%E8%82%89%E9%A3%AF.jpg',
+    '雞腿': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%9B%9E%E8%85%BF.jpg',
+    '蝦子': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%9D%A6%E5%AD%90.jpg',
+    '青花椰': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%9D%92%E8%8A%B1%E6%A4%B0.jpg',
+    '紅蘿蔔': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%B4%85%E8%98%BF%E8%94%94.jpg',
+    '番茄': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%95%AA%E8%8C%84.jpg',
+    '蘋果': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%98%8B%E6%9E%9C.jpg',
+    '香蕉': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%A6%99%E8%95%89.jpg',
+    '草莓': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%8D%89%E8%8E%93.jpg',
+    '蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%9B%8B%E7%B3%95.jpg',
+    '冰淇淋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E5%86%B0%E6%B7%87%E6%B7%8B.jpg',
+    '餅乾': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E9%A4%85%E4%B9%BE.jpg',
+    '草莓蛋糕': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E8%8D%89%E8%8E%93%E8%9B%8B%E7%B3%95.jpg',
+    '玉米濃湯': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%8E%89%E7%B1%B3%E6%BF%83%E6%B9%AF.jpg',
+    '水果冰淇淋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E6%B0%B4%E6%9E%9C%E5%86%B0%E6%B7%87%E6%B7%8B.jpg',
+    '番茄炒蛋': 'https://raw.githubusercontent.com/HLH2000/Food_Game/main/%E6%B3%A8%E9%9F%B3%E5%9C%96/%E7%95%AA%E8%8C%84%E7%82%92%E8%9B%8B.jpg',
+}
@@ -0,0 +1,189 @@
+# ══════════════════════════════════════════════
+# 課堂模式：每個學生 session 把精簡進度寫進同一個行程內的共享 store，
+# 教師頁以 fragment 定時輪詢（run_every），200 人同時作答也不會觸發整頁 rerun
+#   學生：?class=3A&name=小明        教師：?class=3A&teacher=1
+# 教師頁要先輸入密碼（環境變數 FOOD_GAME_TEACHER_PASS）；沒設定密碼時不開放教師頁
+# ══════════════════════════════════════════════
+import hmac
+import html
+import os
+import threading
+import time
+
+import streamlit as st
+
+from food_game.coalesce import stats_caption
+from food_game.sessions import totals_caption, track_session
+
+DASHBOARD_REFRESH_S = 2      # 教師頁更新間隔
+HEARTBEAT_S         = 15     # 進度沒變時，多久才更新一次「最後上線」
+IDLE_S              = 90     # 超過這麼久沒動靜，格子變灰
+FORGET_S            = 4 * 3600
+TEACHER_PASS        = os.environ.get("FOOD_GAME_TEACHER_PASS", "")
+WRONG_PASS_DELAY_S  = 1.0    # 密碼打錯時拖慢一下，避免被暴力猜
+
+
+class ClassroomStore:
+    """執行緒安全；每班每人只保留最新一筆，寫入自然合併"""
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._rooms: dict[str, dict[str, dict]] = {}
+        self._version: dict[str, int] = {}
+
+    def publish(self, room: str, player: str, progress: dict, now: float):
+        with self._lock:
+            players = self._rooms.setdefault(room, {})
+            players[player] = dict(progress, ts=now)
+            self._version[room] = self._version.get(room, 0) + 1
+
+    def touch(self, room: str, player: str, now: float):
+        with self._lock:
+            entry = self._rooms.get(room, {}).get(player)
+            if entry is not None:
+                entry["ts"] = now
+
+    def snapshot(self, room: str, now: float) -> tuple[int, list[dict]]:
+        """回傳（版本, 依名字排序的進度複本）；順手清掉很久沒出現的學生"""
+        with self._lock:
+            players = self._rooms.get(room, {})
+            stale = [p for p, e in players.items() if now - e["ts"] > FORGET_S]
+            for p in stale:
+                del players[p]
+            if stale:
+                self._version[room] = self._version.get(room, 0) + 1
+            rows = [dict(e, name=p) for p, e in players.items()]
+            version = self._version.get(room, 0)
+        rows.sort(key=lambda r: r["name"])
+        return version, rows
+
+
+@st.cache_resource
+def get_classroom_store() -> ClassroomStore:
+    return ClassroomStore()
+
+
+def classroom_params() -> tuple[str | None, str | None, bool]:
+    """（班級, 學生名字, 是否為教師頁）"""
+    qp = st.query_params
+    room = qp.get("class") or None
+    return room, (qp.get("name") or "").strip() or None, qp.get("teacher") == "1"
+
+
+def ask_player_name() -> bool:
+    """有班級但還沒有名字：先請學生輸入名字，寫回網址；
+    回傳 True 時呼叫端收尾後 st.rerun()，否則收尾後 st.stop()"""
+    st.markdown('<div class="panel-title">👋 加入課堂</div>', unsafe_allow_html=True)
+    name = st.text_input("請輸入你的名字", max_chars=20, key="cls_name")
+    if st.button("開始遊戲", type="primary", disabled=not name.strip()):
+        st.query_params["name"] = name.strip()
+        return True
+    return False
+
+
+def teacher_login() -> bool:
+    """教師頁的密碼檢查；通過後整個 session 有效。沒通過時畫出輸入框並回傳 False；
+    通過的那一次直接清掉輸入框，不另外 st.rerun()"""
+    if st.session_state.get("cls_teacher_ok"):
+        return True
+    box = st.empty()
+    with box.container():
+        st.markdown('<div class="panel-title">🧑‍🏫 教師登入</div>', unsafe_allow_html=True)
+        if not TEACHER_PASS:
+            st.error("教師頁未開放：伺服器沒有設定 FOOD_GAME_TEACHER_PASS")
+            return False
+        code = st.text_input("教師密碼", type="password", key="cls_pass")
+        if not st.button("進入教師頁", type="primary", disabled=not code):
+            return False
+        if not hmac.compare_digest(code.encode(), TEACHER_PASS.encode()):
+            time.sleep(WRONG_PASS_DELAY_S)
+            st.error("密碼錯誤")
+            return False
+    box.empty()
+    st.session_state.cls_teacher_ok = True
+    return True
+
+
+def publish_progress(room: str, player: str, *, scored: int, total: int,
+                     submits: int, score: int, done: bool):
+    """只有進度真的改變才寫入；沒變時每 HEARTBEAT_S 秒更新一次上線時間"""
+    progress = {"s": scored, "t": total, "k": submits, "p": score, "d": done}
+    now  = time.time()
+    last = st.session_state.get("cls_last")
+    store = get_classroom_store()
+    if last is None or last[0] != (room, player) or last[1] != progress:
+        store.publish(room, player, progress, now)
+        st.session_state.cls_last = ((room, player), progress, now)
+    elif now - last[2] > HEARTBEAT_S:
+        store.touch(room, player, now)
+        st.session_state.cls_last = (last[0], progress, now)
+
+
+EMPTY_HTML = '<div class="cat-empty">還沒有學生加入</div>'
+
+
+def _grid_html(rows: list[dict], now: float) -> str:
+    done = sum(1 for r in rows if r["d"])
+    avg  = round(sum(r["s"] / r["t"] for r in rows) / len(rows) * 100) if rows else 0
+    cells = []
+    for r in rows:
+        pct  = round(r["s"] / r["t"] * 100) if r["t"] else 0
+        idle = " idle" if now - r["ts"] > IDLE_S else ""
+        fin  = " done" if r["d"] else ""
+        cells.append(
+            f'<div class="cls-cell{idle}{fin}">'
+            f'<div class="cls-name">{"🏆 " if r["d"] else ""}{html.escape(r["name"])}</div>'
+            f'<div class="prog-wrap"><div class="prog-fill" style="width:{pct}%"></div></div>'
+            f'<div class="cls-meta">{r["s"]}/{r["t"]}　提交 {r["k"]} 次　⭐ {r["p"]}</div>'
+            f'</div>'
+        )
+    return (
+        f'<div class="stat-row cls-sum">'
+        f'<div class="stat-pill">👥 <b>{len(rows)}</b> 人</div>'
+        f'<div class="stat-pill">🏆 完成 <b>{done}</b> 人</div>'
+        f'<div class="stat-pill">📈 平均進度 <b>{avg}%</b></div></div>'
+        f'<div class="cls-grid">{"".join(cells) or EMPTY_HTML}</div>'
+    )
+
+
+DASHBOARD_CSS = """
+<style>
+.cls-sum { margin: 4px 0 12px; }
+.cls-sum .stat-pill { background: #1F2937; }
+.cls-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(170px, 1fr)); gap: 10px; }
+.cls-cell {
+    background: white; border-radius: 14px; padding: 10px 12px;
+    border: 2px solid #D1D5DB; box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+}
+.cls-cell.done { border-color: #15803D; }
+.cls-cell.idle { opacity: 0.45; }
+.cls-name { font-weight: 800; font-size: 0.9rem; color: #111827; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.cls-meta { font-size: 0.74rem; font-weight: 600; color: #374151; }
+</style>
+"""
+
+
+@st.fragment(run_every=DASHBOARD_REFRESH_S)
+def _live_grid(room: str):
+    # fragment 的 rerun 不會跑到引擎頂層：自己記活動時間，教師頁開著就不會被當成閒置回收
+    track_session()
+    now = time.time()
+    version, rows = get_classroom_store().snapshot(room, now)
+    # 班級版本沒變就沿用上次的 HTML（上線/閒置狀態每分鐘重算一次即可）
+    cache = st.session_state.setdefault("cls_grid_cache", {})
+    key = (room, version, int(now // 60))
+    if cache.get("key") != key:
+        cache["key"]  = key
+        cache["html"] = _grid_html(rows, now)
+    st.markdown(cache["html"], unsafe_allow_html=True)
+    st.caption(f"{totals_caption()}；{stats_caption()}")
+
+
+def render_dashboard(room: str):
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="game-header"><div class="game-title">🧑‍🏫 課堂即時進度</div>'
+        f'<div class="stat-row"><div class="stat-pill">班級 <b>{html.escape(room)}</b></div></div></div>',
+        unsafe_allow_html=True,
+    )
+    _live_grid(room)
@@ -0,0 +1,122 @@
+# ══════════════════════════════════════════════
+# 重複點擊合併：小朋友常對「選取」「放入此類別」「提交答案」連點兩三下，
+# 每一下都是一次完整 rerun，慢的 Chromebook 上還會把前一次 rerun 打斷重跑。
+# 在 session 收到 rerun 請求的入口（AppSession.request_rerun）把關：
+# 同一個 session 在 COALESCE_MS 內送來「同一組按鈕觸發、其他元件值完全相同」的請求，
+# 視為同一次操作直接丟掉——狀態只轉移一次、也只跑一次 rerun
+#   FOOD_GAME_COALESCE_MS：合併窗口（預設 400，0＝關閉）
+# ══════════════════════════════════════════════
+import hashlib
+import os
+import threading
+import time
+
+from streamlit.runtime import Runtime
+from streamlit.runtime.app_session import AppSession
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from food_game.compat import supported
+
+COALESCE_MS = int(os.environ.get("FOOD_GAME_COALESCE_MS", 400))
+REPEATABLE  = frozenset({"hand_prev", "hand_next"})   # 連點翻頁是有意的，不合併
+
+_stats_lock = threading.Lock()
+_stats = {"accepted": 0, "dropped": 0, "sessions": 0}
+
+
+def _widget_key(widget_id: str) -> str:
+    return widget_id.split("-", 2)[2] if widget_id.count("-") >= 2 else ""
+
+
+def _fingerprint(client_state) -> tuple[frozenset, bytes] | None:
+    """（被觸發的按鈕 id, 其餘狀態摘要）；含其他一次性觸發（聊天輸入等）時回傳 None＝不合併"""
+    triggers = set()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(client_state.query_string.encode())
+    h.update(client_state.page_script_hash.encode())
+    h.update(client_state.fragment_id.encode())
+    for w in sorted(client_state.widget_states.widgets, key=lambda w: w.id):
+        kind = w.WhichOneof("value")
+        if kind == "trigger_value":
+            if w.trigger_value:
+                triggers.add(w.id)
+            continue
+        if kind in ("string_trigger_value", "json_trigger_value", "chat_input_value"):
+            return None
+        h.update(w.SerializeToString())
+    return frozenset(triggers), h.digest()
+
+
+class _Coalescer:
+    """包住單一 AppSession 的 request_rerun；只在 event loop 執行緒上被呼叫"""
+
+    def __init__(self, inner, window_s: float):
+        self.inner = inner
+        self.window_s = window_s
+        self.last: tuple[float, frozenset, bytes] | None = None
+        self.accepted = self.dropped = 0
+
+    def __call__(self, client_state):
+        fp = _fingerprint(client_state) if client_state is not None else None
+        now = time.monotonic()
+        if fp is not None and fp[0] and self.last is not None:
+            t, triggers, digest = self.last
+            if (now - t < self.window_s and fp[0] == triggers and fp[1] == digest
+                    and not any(_widget_key(w) in REPEATABLE for w in triggers)):
+                # 連點中的每一下都延長窗口：三連點也只算一次
+                self.last = (now, triggers, digest)
+                self.dropped += 1
+                with _stats_lock:
+                    _stats["dropped"] += 1
+                return None
+        self.last = (now, *fp) if fp is not None else None
+        self.accepted += 1
+        with _stats_lock:
+            _stats["accepted"] += 1
+        return self.inner(client_state)
+
+
+def _app_session() -> AppSession | None:
+    ctx = get_script_run_ctx()
+    if ctx is None or not Runtime.exists():
+        return None
+    mgr = getattr(Runtime.instance(), "_session_mgr", None)     # AppTest 的 Runtime 是 Mock
+    info = mgr.get_active_session_info(ctx.session_id) if mgr is not None else None
+    session = getattr(info, "session", None)
+    return session if isinstance(session, AppSession) else None
+
+
+def install_coalescer():
+    """每次 rerun 呼叫；每個 session 只裝一次。AppTest 等沒有真正 AppSession 的環境、
+    或 Streamlit 版本對不上內部結構時（food_game/compat.py）直接略過"""
+    if COALESCE_MS <= 0 or not supported("coalesce"):
+        return
+    session = _app_session()
+    if session is None or isinstance(session.request_rerun, _Coalescer):
+        return
+    session.request_rerun = _Coalescer(session.request_rerun, COALESCE_MS / 1000)
+    with _stats_lock:
+        _stats["sessions"] += 1
+
+
+def session_coalesce_stats() -> dict | None:
+    """目前 session 的計數（沒有裝合併層時為 None）"""
+    c = getattr(_app_session(), "request_rerun", None)
+    if not isinstance(c, _Coalescer):
+        return None
+    return {"accepted": c.accepted, "dropped": c.dropped}
+
+
+def coalesce_stats() -> dict:
+    """全行程計數：accepted＝實際執行的 rerun 請求、dropped＝被合併掉（省下）的 rerun"""
+    with _stats_lock:
+        s = dict(_stats)
+    total = s["accepted"] + s["dropped"]
+    s["saved_ratio"] = round(s["dropped"] / total, 4) if total else 0.0
+    s["window_ms"] = COALESCE_MS
+    return s
+
+
+def stats_caption() -> str:
+    s = coalesce_stats()
+    return f"重複點擊合併：省下 {s['dropped']} 次 rerun（佔 {s['saved_ratio']:.1%}）"
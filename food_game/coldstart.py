@@ -0,0 +1,403 @@
+# ══════════════════════════════════════════════
+# 冷啟動基準測試：第一次打開遊戲到底慢在哪——streamlit 的 import、引擎頂層、CSS、
+# Google 字型還是 43 張遠端圖片。每個版本分項量，每一輪都用全新的行程，重複取中位數：
+#   imports ：python -X importtime 載入引擎頂層 import 的模組（總時間與最慢的幾個）
+#   server  ：streamlit run 起到 /_stcore/health 有回應
+#   first   ：第一個 session 從送出 rerun 到 script_finished（行程內快取都是空的）
+#   warm    ：第二個 session 的同一件事（版本目錄、引擎編譯都已快取）
+#             兩者都記錄送出的 ForwardMsg 位元組、元素數、HTML／CSS 位元組、圖片與外部字型數
+#   toplevel：同一個 session 連續 rerun（?profile=1），取剖析紀錄的中位數：
+#             launch＝啟動器到引擎頂層 import 完、setup＝畫出第一個元素前的頂層程式、rerun＝整次
+#   browser ：有安裝 Playwright＋Chromium 時，無頭瀏覽器量 FCP、標題出現、頁面圖片載完的時間；
+#             在 first／warm 之後才開，量的是瀏覽器端（字型、圖片、前端 bundle）的成本
+# 結果寫成 JSON（benchmarks/coldstart-日期-時間.json），之後用 --compare 對照舊檔看回歸
+#   python -m food_game.coldstart                         ← 預設兩個維護中的版本
+#   python -m food_game.coldstart --variant all --repeat 5
+#   python -m food_game.coldstart --flags=-eggs,-phonetic  ← 功能開關 A/B（同網址 ?ff=）
+#   python -m food_game.coldstart --compare benchmarks/coldstart-20261001-090000.json
+# ══════════════════════════════════════════════
+import argparse
+import ast
+import asyncio
+import glob
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlencode
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from food_game.loadtest import start_server
+
+ROOT      = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.environ.get("FOOD_GAME_BENCH_DIR", "benchmarks")
+TOP_N     = 8
+TIMEOUT_S = 60
+RERUNS    = 20        # toplevel 階段同一個 session 的 rerun 次數
+
+_IMG_RE  = re.compile(r"https?://[^\s\"'<>()]+?\.(?:png|jpe?g|gif|webp|svg)", re.I)
+_FONT_RE = re.compile(r"@import\s+url\(['\"]?https?://fonts\.", re.I)
+
+
+# ─────────────── import 時間 ───────────────
+def engine_imports(engine: str) -> list[str]:
+    """引擎檔頂層 import 的模組（開關關掉就不載入的延後 import 不算）"""
+    from food_game.variants import ENGINE_DIR
+
+    with open(os.path.join(ENGINE_DIR, f"{engine}.py"), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    mods = ["streamlit", "food_game.variants"]      # streamlit 先載入，才看得出它自己佔多少
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            mods += [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            mods.append(node.module)
+    return list(dict.fromkeys(mods))
+
+
+def parse_importtime(text: str) -> list[tuple[str, int]]:
+    """-X importtime 輸出中最外層的模組與累計微秒（巢狀的已含在上層裡）"""
+    rows = []
+    for line in text.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit() or len(name) - len(name.lstrip()) != 1:
+            continue
+        rows.append((name.strip(), int(cumulative)))
+    return rows
+
+
+def measure_imports(modules: list[str], env: dict) -> dict:
+    code = "; ".join(f"import {m}" for m in modules)
+    t = time.perf_counter()
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         capture_output=True, text=True, env=env, cwd=ROOT, timeout=TIMEOUT_S)
+    process_ms = (time.perf_counter() - t) * 1000
+    if out.returncode:
+        raise RuntimeError(f"import 失敗：{out.stderr.strip().splitlines()[-1:]}")
+    rows = parse_importtime(out.stderr)
+    top = sorted(rows, key=lambda r: r[1], reverse=True)[:TOP_N]
+    return {
+        "process_ms": round(process_ms, 1),
+        "import_ms":  round(sum(us for _, us in rows) / 1000, 1),
+        "streamlit_ms": round(sum(us for n, us in rows if n.split(".")[0] == "streamlit") / 1000, 1),
+        "food_game_ms": round(sum(us for n, us in rows if n.split(".")[0] == "food_game") / 1000, 1),
+        "top": [[n, round(us / 1000, 1)] for n, us in top],
+    }
+
+
+# ─────────────── 第一次 rerun：時間與傳輸量 ───────────────
+def _payload_stats(elements: list) -> dict:
+    html_bytes = css_bytes = fonts = 0
+    images = set()
+    for el in elements:
+        kind = el.WhichOneof("type")
+        if kind == "markdown":
+            body = el.markdown.body
+        elif kind == "html":
+            body = el.html.body
+        elif kind == "component_instance":
+            body = el.component_instance.json_args
+        elif kind == "imgs":
+            images.update(img.url for img in el.imgs.imgs)
+            continue
+        else:
+            continue
+        if kind != "component_instance":
+            size = len(body.encode())
+            html_bytes += size
+            if "<style" in body:
+                css_bytes += size
+        fonts += len(_FONT_RE.findall(body))
+        images.update(_IMG_RE.findall(body))
+    return {"html_bytes": html_bytes, "css_bytes": css_bytes, "images": len(images), "fonts": fonts}
+
+
+async def _first_render(url: str, query: dict) -> dict:
+    """開一個新 session、跑一次 rerun，量到 script_finished 為止"""
+    import websockets
+
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        m = BackMsg()
+        m.rerun_script.query_string = urlencode(query)
+        m.rerun_script.page_script_hash = ""
+        t0 = time.perf_counter()
+        await ws.send(m.SerializeToString())
+        total = delta = msgs = 0
+        first_delta_ms = None
+        elements = []
+        while True:
+            raw = await asyncio.wait_for(ws.recv(), TIMEOUT_S)
+            now = time.perf_counter()
+            msg = ForwardMsg()
+            msg.ParseFromString(raw)
+            total += len(raw)
+            msgs += 1
+            kind = msg.WhichOneof("type")
+            if kind == "delta":
+                delta += len(raw)
+                if first_delta_ms is None:
+                    first_delta_ms = (now - t0) * 1000
+                if msg.delta.HasField("new_element"):
+                    elements.append(msg.delta.new_element)
+            elif kind == "script_finished" and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        return {
+            "ms":             round((now - t0) * 1000, 1),
+            "first_delta_ms": round(first_delta_ms or 0.0, 1),
+            "bytes":          total,
+            "delta_bytes":    delta,
+            "messages":       msgs,
+            "elements":       len(elements),
+            **_payload_stats(elements),
+        }
+
+
+async def _profiled_reruns(url: str, query: dict, n: int):
+    """同一個 session 連續 rerun n 次，每次等到 script_finished"""
+    import websockets
+
+    qs = urlencode({**query, "profile": "1"})
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        for _ in range(n):
+            m = BackMsg()
+            m.rerun_script.query_string = qs
+            m.rerun_script.page_script_hash = ""
+            await ws.send(m.SerializeToString())
+            while True:
+                msg = ForwardMsg()
+                msg.ParseFromString(await asyncio.wait_for(ws.recv(), TIMEOUT_S))
+                if (msg.WhichOneof("type") == "script_finished"
+                        and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN):
+                    break
+
+
+def measure_toplevel(url: str, query: dict, profile_dir: str) -> dict:
+    """頂層程式每次 rerun 的成本；第一次是新局面（init_game）不算"""
+    asyncio.run(_profiled_reruns(url, query, RERUNS + 1))
+    records = []
+    for path in glob.glob(os.path.join(profile_dir, "trace-*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            records += [json.loads(line) for line in f]
+    records = sorted(records, key=lambda r: r["ts"])[1:]
+
+    def section(r: dict, name: str) -> float:
+        return next((s["ms"] for s in r["sections"] if s["name"] == name), 0.0)
+    return {
+        "launch_ms": round(statistics.median(section(r, "launch") for r in records), 2),
+        "setup_ms":  round(statistics.median(section(r, "setup") for r in records), 2),
+        "rerun_ms":  round(statistics.median(r["total_ms"] for r in records), 2),
+    }
+
+
+def measure_browser(http_url: str) -> dict:
+    """無頭瀏覽器首次開啟；沒有 Playwright 或 Chromium 時回傳 skipped 與原因"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        return {"skipped": "沒有安裝 playwright（pip install playwright && playwright install chromium）"}
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch()
+            try:
+                page = browser.new_context().new_page()
+                page.goto(http_url, wait_until="commit", timeout=TIMEOUT_S * 1000)
+                page.wait_for_selector(".game-header", timeout=TIMEOUT_S * 1000)
+                header_ms = page.evaluate("performance.now()")
+                page.wait_for_function("Array.from(document.images).every(i => i.complete)",
+                                       timeout=TIMEOUT_S * 1000)
+                images_ms = page.evaluate("performance.now()")
+                fcp = page.evaluate(
+                    "(performance.getEntriesByName('first-contentful-paint')[0] || {}).startTime || null")
+                resources = page.evaluate(
+                    "performance.getEntriesByType('resource').map(r => [r.initiatorType, r.transferSize])")
+            finally:
+                browser.close()
+    except Exception as e:      # 瀏覽器沒裝好等，整項略過即可
+        return {"skipped": f"{type(e).__name__}: {str(e).strip().splitlines()[0]}"}
+    by_type: dict[str, list[int]] = {}
+    for kind, size in resources:
+        by_type.setdefault(kind, [0, 0])
+        by_type[kind][0] += 1
+        by_type[kind][1] += size or 0
+    return {
+        "fcp_ms":        round(fcp, 1) if fcp is not None else None,
+        "header_ms":     round(header_ms, 1),
+        "images_ms":     round(images_ms, 1),
+        "resources":     {k: {"count": c, "bytes": b} for k, (c, b) in sorted(by_type.items())},
+    }
+
+
+def measure_server(script: str, query: dict, env: dict, browser: bool) -> dict:
+    profile_dir = tempfile.mkdtemp(prefix="fg-prof-")
+    # 只有帶 ?profile=1 的 rerun 才剖析，第一次載入照常量
+    env = {**env, "FOOD_GAME_PROFILE_DIR": profile_dir, "FOOD_GAME_PROFILE": "url"}
+    t = time.perf_counter()
+    proc, port = start_server(script, env, poll_s=0.02)
+    out = {"server_ms": round((time.perf_counter() - t) * 1000, 1)}
+    try:
+        url = f"ws://127.0.0.1:{port}/_stcore/stream"
+        out["first"] = asyncio.run(_first_render(url, query))
+        out["warm"] = asyncio.run(_first_render(url, query))
+        if browser:
+            qs = f"?{urlencode(query)}" if query else ""
+            out["browser"] = measure_browser(f"http://127.0.0.1:{port}/{qs}")
+        out["toplevel"] = measure_toplevel(url, query, profile_dir)
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    return out
+
+
+# ─────────────── 彙整 ───────────────
+def _median(samples: list):
+    """多輪結果逐欄取中位數；非數值欄位（前幾名模組、略過原因）沿用第一輪"""
+    first = samples[0]
+    if isinstance(first, dict):
+        return {k: _median([s[k] for s in samples if isinstance(s, dict) and k in s]) for k in first}
+    if isinstance(first, (int, float)) and not isinstance(first, bool) and all(
+            isinstance(s, (int, float)) for s in samples):
+        m = statistics.median(samples)
+        return round(m, 1) if any(isinstance(s, float) for s in samples) else round(m)
+    return first
+
+
+def bench_variant(name: str, args, env: dict) -> dict:
+    from food_game.flags import resolve_flags
+    from food_game.variants import VARIANTS
+
+    variant = VARIANTS[name]
+    engine = resolve_flags(variant, url=args.flags).engine
+    script = os.path.join(ROOT, variant.file)
+    query = {"ff": args.flags} if args.flags else {}
+    modules = engine_imports(engine)
+    rounds = []
+    for i in range(args.repeat):
+        r = {"imports": measure_imports(modules, env)}
+        r.update(measure_server(script, query, env, browser=not args.no_browser))
+        rounds.append(r)
+        print(f"  {name} 第 {i + 1} 輪：import {r['imports']['import_ms']} ms，"
+              f"首次 rerun {r['first']['ms']} ms／{r['first']['bytes']} B", file=sys.stderr)
+    return {"engine": engine, "script": variant.file, **_median(rounds)}
+
+
+def _flatten(d: dict, prefix: str = "") -> dict[str, float]:
+    out = {}
+    for k, v in d.items():
+        key = f"{prefix}{k}"
+        if isinstance(v, dict):
+            out.update(_flatten(v, key + "."))
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[key] = v
+    return out
+
+
+def compare(old: dict, new: dict, threshold: float) -> int:
+    """逐版本逐欄對照；變大超過 threshold（%）的標成回歸，回傳回歸數"""
+    regressions = 0
+    for name, res in new["results"].items():
+        before = old.get("results", {}).get(name)
+        if before is None:
+            continue
+        print(f"\n── {name}：{old.get('ts', '?')} → {new['ts']} ──")
+        a, b = _flatten(before), _flatten(res)
+        for key in sorted(a.keys() & b.keys()):
+            if not a[key]:
+                continue
+            pct = (b[key] - a[key]) / a[key] * 100
+            flag = "⚠️" if pct > threshold else "  "
+            regressions += pct > threshold
+            print(f"{flag} {key:<32}{a[key]:>12}{b[key]:>12}{pct:>+9.1f}%")
+    return regressions
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main(argv: list[str] | None = None):
+    import streamlit
+
+    from food_game.variants import VARIANTS
+
+    ap = argparse.ArgumentParser(description="食物分類遊戲：冷啟動與首次渲染基準測試")
+    ap.add_argument("--variant", action="append",
+                    help="要測的版本（food_game/variants.py），可重複；all＝全部；預設 with_eggs 與 v8")
+    ap.add_argument("--repeat", type=int, default=3, help="每個版本跑幾輪（取中位數）")
+    ap.add_argument("--flags", default="", help="功能開關覆寫，同網址 ?ff=")
+    ap.add_argument("--no-browser", action="store_true", help="不跑無頭瀏覽器")
+    ap.add_argument("--out", help=f"結果 JSON 路徑（預設 {BENCH_DIR}/coldstart-日期-時間.json）")
+    ap.add_argument("--compare", help="和之前的結果 JSON 對照")
+    ap.add_argument("--threshold", type=float, default=10.0, help="對照時超過幾 %% 算回歸")
+    args = ap.parse_args(argv)
+
+    names = args.variant or ["with_eggs", "v8"]
+    if "all" in names:
+        names = list(VARIANTS)
+    unknown = [n for n in names if n not in VARIANTS]
+    if unknown:
+        raise SystemExit(f"沒有這些版本：{', '.join(unknown)}（python -m food_game.variants 列出全部）")
+
+    # 排行榜、事件、存檔寫到暫存目錄：不污染工作目錄，也保證每輪都是空的
+    tmp = tempfile.mkdtemp(prefix="fg-cold-")
+    env = dict(os.environ)
+    env.setdefault("FOOD_GAME_DB", os.path.join(tmp, "lb.db"))
+    env.setdefault("FOOD_GAME_EVENTS_DIR", os.path.join(tmp, "events"))
+    env.setdefault("FOOD_GAME_STATE", f"disk:{os.path.join(tmp, 'checkpoints')}")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+
+    report = {
+        "ts":        time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git":       _git_rev(),
+        "python":    sys.version.split()[0],
+        "streamlit": streamlit.__version__,
+        "platform":  platform.platform(),
+        "cpus":      os.cpu_count(),
+        "repeat":    args.repeat,
+        "flags":     args.flags,
+        "results":   {},
+    }
+    for name in names:
+        print(f"▶ {name}", file=sys.stderr)
+        report["results"][name] = res = bench_variant(name, args, env)
+        first, warm = res["first"], res["warm"]
+        print(f"{name:<14}import {res['imports']['import_ms']:>7} ms  server {res['server_ms']:>7} ms  "
+              f"first {first['ms']:>7} ms  warm {warm['ms']:>7} ms  "
+              f"payload {first['bytes']:>8} B（CSS {first['css_bytes']} B，圖片 {first['images']}）")
+        top = res["toplevel"]
+        print(f"{'':<14}每次 rerun 頂層：launch {top['launch_ms']} ms＋setup {top['setup_ms']} ms"
+              f"（整次 {top['rerun_ms']} ms）")
+        br = res.get("browser")
+        if br and "skipped" in br:
+            print(f"{'':<14}browser 略過：{br['skipped']}")
+        elif br:
+            print(f"{'':<14}browser FCP {br['fcp_ms']} ms  標題 {br['header_ms']} ms  圖片載完 {br['images_ms']} ms")
+
+    path = args.out or os.path.join(BENCH_DIR, time.strftime("coldstart-%Y%m%d-%H%M%S.json"))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n結果：{path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        n = compare(old, report, args.threshold)
+        print(f"\n{n} 項變慢／變大超過 {args.threshold:g}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# ══════════════════════════════════════════════
+# Streamlit 內部結構相容性：幾個效能工具掛在非公開的屬性上，
+#   enqueue       ScriptRunContext._enqueue                          剖析與位元組計量（profiler.tap_context）
+#   coalesce      Runtime._session_mgr、AppSession.request_rerun、ClientState 欄位   重複點擊合併（coalesce）
+#   evict         Runtime._get_async_objs、Runtime._session_mgr       閒置 session 回收（sessions）
+#   widget_state  SessionState._old_state／_new_widget_state／_key_id_mapper、ctx.shared
+#                                                                    記憶體剖析的 widget 統計（memprof）
+# requirements.txt 釘在測過的版本（STREAMLIT_TESTED）；換了版本、某一項不見時只關掉那一項並記一次 warning，
+# 遊戲本身照常
+#   python -m food_game.compat     ← 列出目前安裝的 Streamlit 每一項是否可用
+# ══════════════════════════════════════════════
+import dataclasses
+import functools
+import logging
+
+STREAMLIT_TESTED = "1.66"
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _fields(cls) -> set[str]:
+    return {f.name for f in dataclasses.fields(cls)} if dataclasses.is_dataclass(cls) else set()
+
+
+def _init_attrs(cls) -> set[str]:
+    """__init__ 裡指定的屬性名稱（self.x = … 會出現在 co_names）"""
+    code = getattr(getattr(cls, "__init__", None), "__code__", None)
+    return set(code.co_names) if code else set()
+
+
+def _check() -> dict[str, bool]:
+    from streamlit.proto.ClientState_pb2 import ClientState
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.app_session import AppSession
+    from streamlit.runtime.scriptrunner import ScriptRunContext
+    from streamlit.runtime.state.session_state import SessionState
+
+    session_mgr = "_session_mgr" in _init_attrs(Runtime)
+    client = set(ClientState.DESCRIPTOR.fields_by_name)
+    return {
+        "enqueue":      "_enqueue" in _fields(ScriptRunContext),
+        "coalesce":     session_mgr and callable(getattr(AppSession, "request_rerun", None))
+                        and {"query_string", "widget_states", "page_script_hash", "fragment_id"} <= client,
+        "evict":        session_mgr and callable(getattr(Runtime, "_get_async_objs", None)),
+        "widget_state": {"_old_state", "_new_widget_state", "_key_id_mapper"} <= _fields(SessionState)
+                        and "shared" in _fields(ScriptRunContext),
+    }
+
+
+@functools.cache
+def internals() -> dict[str, bool]:
+    """各項內部結構是否可用；第一次呼叫時檢查，版本不同或有缺項時記一次 warning"""
+    import streamlit
+
+    try:
+        ok = _check()
+    except (ImportError, AttributeError, TypeError):
+        _LOGGER.warning("Streamlit %s 的內部結構無法檢查，效能工具的內部掛鉤全部關閉",
+                        streamlit.__version__, exc_info=True)
+        return {"enqueue": False, "coalesce": False, "evict": False, "widget_state": False}
+    missing = [name for name, good in ok.items() if not good]
+    if missing:
+        _LOGGER.warning("Streamlit %s 缺少內部結構，關閉：%s（測過的版本是 %s.*）",
+                        streamlit.__version__, "、".join(missing), STREAMLIT_TESTED)
+    elif not streamlit.__version__.startswith(STREAMLIT_TESTED + "."):
+        _LOGGER.warning("Streamlit %s 不是測過的版本（%s.*），內部掛鉤仍可用但未驗證",
+                        streamlit.__version__, STREAMLIT_TESTED)
+    return ok
+
+
+def supported(feature: str) -> bool:
+    return internals().get(feature, False)
+
+
+if __name__ == "__main__":
+    import streamlit
+
+    print(f"Streamlit {streamlit.__version__}（測過 {STREAMLIT_TESTED}.*）")
+    for name, good in internals().items():
+        print(f"  {'✓' if good else '✗'} {name}")
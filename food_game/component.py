@@ -0,0 +1,20 @@
+# ══════════════════════════════════════════════
+# 共用前端元件：food_game/web/ 只宣告一次，
+# 各畫面（拖放手牌、選取手牌…）以 view 參數區分，共用同一套協定與高度同步
+# ══════════════════════════════════════════════
+import os
+
+import streamlit.components.v1 as components
+
+WEB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web")
+_component = components.declare_component("food_game", path=WEB_DIR)
+
+
+def web_view(view: str, *, key: str, default=None, on_change=None, **args):
+    """渲染 web/{view}.js；args 原樣傳給前端"""
+    return _component(view=view, key=key, default=default, on_change=on_change, **args)
+
+
+def select_hand(cards: list[dict], *, locked: bool, sep: str, key: str):
+    """cards：[{name, url, special, selected}]；選取狀態由前端寫入網址 ?sel="""
+    return web_view("hand", cards=cards, locked=locked, sep=sep, key=key)
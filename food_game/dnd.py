@@ -0,0 +1,28 @@
+# ══════════════════════════════════════════════
+# 拖放手牌：選取與拖放都在瀏覽器端完成，
+# 只有「一批移動」送回 Python，一次 rerun 放入多張
+# ══════════════════════════════════════════════
+from food_game.component import web_view
+
+DND_DEBOUNCE_MS = 1500   # 停手多久後自動送出
+
+
+def dnd_hand(cards: list[dict], categories: list[dict], *, locked: bool,
+             ack: str | None, round_id: str, key: str, on_change=None):
+    """cards：[{name, url, special, need, placed_in}]；categories：[{name, color, count}]"""
+    return web_view(
+        "dnd", cards=cards, categories=categories, locked=locked, ack=ack,
+        round=round_id, debounce_ms=DND_DEBOUNCE_MS, key=key, on_change=on_change,
+    )
+
+
+def batch_moves(batch, categories: list[str]) -> list[tuple[str, list[str]]]:
+    """把一批 [name, cat] 依類別分組（保留先後順序），丟掉格式不對的項目"""
+    groups: dict[str, list[str]] = {}
+    for move in (batch or {}).get("moves") or []:
+        if not isinstance(move, (list, tuple)) or len(move) != 2:
+            continue
+        name, cat = move
+        if cat in categories and isinstance(name, str):
+            groups.setdefault(cat, []).append(name)
+    return list(groups.items())
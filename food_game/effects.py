@@ -0,0 +1,28 @@
+# ══════════════════════════════════════════════
+# 一次性特效：由遊戲事件觸發（fire），只在下一次 rerun 送出一次，
+# 之後的 rerun 不會重播，也不再有額外的網路與 DOM 成本
+# ══════════════════════════════════════════════
+import secrets
+
+import streamlit as st
+
+from food_game.component import web_view
+
+
+def fire(event: str, kind: str = "confetti"):
+    """登記特效；同一事件（例如 "win"）在一局內只會播放一次"""
+    played = st.session_state.setdefault("effects_played", set())
+    if event in played:
+        return
+    played.add(event)
+    # 前端以 id 去重；加上亂數，重新開始後同名事件仍會播放
+    st.session_state.setdefault("effects_queue", []).append(
+        {"id": f"{event}-{secrets.token_hex(4)}", "kind": kind}
+    )
+
+
+def render_effects():
+    """每次 rerun 都渲染（高度 0，iframe 保持掛載），送出後清空佇列"""
+    queue = st.session_state.get("effects_queue") or []
+    web_view("effects", key="effects", effects=queue)
+    st.session_state.effects_queue = []
@@ -0,0 +1,58 @@
+# ══════════════════════════════════════════════
+# 彩蛋：第 2、3、4 次提交與全對通關時的彈窗
+# 引擎只在 eggs／win_egg 開關打開時才 import 這個模組（見 food_game/flags.py），
+# 關掉時不送彈窗樣式、不定義對話框
+# ══════════════════════════════════════════════
+import streamlit as st
+
+from food_game.catalog import EGG_URLS, WIN_EGG_URL
+
+EGG_LABELS = {2: "第一顆彩蛋", 3: "第二顆彩蛋", 4: "第三顆彩蛋"}
+EGG_CSS    = """
+/* ── 彩蛋 Dialog 樣式 ── */
+[data-testid="stDialog"] [data-testid="stImage"] img {
+    border-radius: 16px;
+    box-shadow: 0 8px 32px rgba(109,40,217,0.3);
+}
+"""
+
+
+# 對話框裡的按鈕只重跑對話框本身（fragment），引擎這次沒有開計量與剖析，關閉時直接 st.rerun()
+@st.dialog("🎉 彩蛋出現！")
+def show_egg_dialog(egg_url: str, submit_count: int):
+    label = EGG_LABELS.get(submit_count, "彩蛋")
+    st.markdown(
+        f"""
+        <div style="text-align:center;">
+            <div style="font-size:1.1rem;font-weight:800;color:#7C3AED;margin-bottom:12px;">
+                ✨ 恭喜發現{label}！✨
+            </div>
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+    st.image(egg_url, use_container_width=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    if st.button("🙈 關閉彩蛋", use_container_width=True, type="primary"):
+        st.session_state.show_egg = False
+        st.rerun()
+
+
+@st.dialog("🏆 恭喜通關！")
+def show_win_egg_dialog():
+    st.markdown('<div style="text-align:center;"><div style="font-size:1.5rem;font-weight:900;color:#B45309;margin-bottom:4px;">🌟 全部答對！完美通關！🌟</div><div style="font-size:0.9rem;color:#6B7280;margin-bottom:14px;">你是食物分類小達人 🍽️</div></div>', unsafe_allow_html=True)
+    st.image(WIN_EGG_URL, use_container_width=True)
+    st.markdown("<br>", unsafe_allow_html=True)
+    if st.button("🎊 太棒了！", use_container_width=True, type="primary"):
+        st.session_state.show_win_egg = False
+        st.rerun()
+
+
+def render_eggs():
+    """依 session 狀態開彈窗；必須在主體渲染前呼叫"""
+    if st.session_state.get("show_win_egg", False):
+        show_win_egg_dialog()
+    elif st.session_state.get("show_egg", False):
+        egg_count = st.session_state.get("egg_submit_count", 0)
+        if egg_count in EGG_URLS:
+            show_egg_dialog(EGG_URLS[egg_count], egg_count)
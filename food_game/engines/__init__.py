@@ -0,0 +1 @@
+# 遊戲引擎：由 food_game.variants.run() 依版本執行，不直接 import
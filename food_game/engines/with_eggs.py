@@ -0,0 +1,871 @@
+import streamlit as st
+import random
+import time
+
+from food_game.analytics import track
+from food_game.assets import FONT_CSS
+from food_game.catalog import (
+    EGG_URLS, card_media, current_tenant, hand_card_html, placed_card_html, placed_state,
+)
+from food_game.coalesce import install_coalescer
+from food_game.classroom import (
+    ask_player_name, classroom_params, publish_progress, render_dashboard, teacher_login,
+)
+from food_game.effects import fire, render_effects
+from food_game.flags import current_flags
+from food_game.memprof import start_memprof
+from food_game.metrics import begin_rerun, traced
+from food_game.payload import start_meter
+from food_game.profiler import start_profiler
+from food_game.race import race_deck, race_panel, race_params
+from food_game.sessions import track_session
+from food_game.state_store import forget_state, restore_state, save_state
+from food_game.hand import remaining_cards
+from food_game.variants import current_variant
+
+# ══════════════════════════════════════════════
+# 頁面設定
+# ══════════════════════════════════════════════
+st.set_page_config(
+    page_title="食物分類遊戲 🍽️",
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+prof = start_profiler()
+prof.mark("setup")      # 頂層：租戶、開關、函式定義、狀態初始化與 action 處理
+install_coalescer()
+
+# ─────────────── 遊戲資料（行程共用的唯讀目錄；租戶只帶自己的差異）───────────────
+variant      = current_variant("with_eggs")     # 由啟動器指定；牌組與功能見 food_game/variants.py
+tenant       = current_tenant(variant.deck, variant.exclude)
+flags        = current_flags(variant, tenant)   # 彩蛋／注音／手牌模式，關掉的功能不載入
+CATEGORIES   = tenant.catalog.categories
+CAT_STYLE    = tenant.catalog.cat_style
+CARDS        = tenant.catalog.cards
+TOTAL_NEEDED = tenant.catalog.total_needed
+BASE_SCORE   = tenant.base_score
+VARIANT      = tenant.tag(variant.name)   # 排行榜／統計用的版本代號
+ENGINE       = "with_eggs"
+prof.annotate(flags=flags.key)
+rerun_timer = begin_rerun(VARIANT)   # 互動延遲指標（food_game/metrics.py）
+meter       = start_meter(VARIANT)   # 每次 rerun 送出的位元組與預算（food_game/payload.py）
+mem         = start_memprof()        # session_state 記憶體剖析（FOOD_GAME_MEMPROF）
+
+def finish_rerun(expect=None):
+    """本次 rerun 收尾：計量、延遲、剖析、記憶體；提早 st.stop()／st.rerun() 的路徑也要先呼叫"""
+    meter.finish()
+    rerun_timer.end()
+    prof.finish()
+    mem.finish(expect=expect)
+
+# 手牌模式："dnd"=拖放元件（選取零 rerun，整批送出）、"buttons"=逐張按鈕
+HAND_MODE = "dnd" if flags.dnd_hand else "buttons"
+
+# ─────────────── 初始化 ───────────────
+def init_game():
+    st.session_state.update({
+        "game_init":           True,
+        "started_at":          time.time(),
+        "score":               0,
+        "submit_count":        0,
+        "locked":              False,
+        "scored_keys":         set(),
+        "selected":            set(),
+        "result":              {},
+        "placed":              {cat: [] for cat in CATEGORIES},
+        "message":             "",
+        "message_type":        "info",
+        "return_wrong_avail":  None,  # None=未批改, True=可用, False=已用
+        "show_egg":            False,  # 是否顯示彩蛋彈窗
+        "egg_submit_count":    0,      # 觸發彩蛋時的提交次數
+        "show_win_egg":        False,  # 是否顯示通關彩蛋
+        "hand_page":           0,      # 手牌目前頁碼
+        "hand_filter":         None,   # 手牌類別篩選（None=全部）
+        "dnd_ack":             None,   # 最後一批已套用的拖放批次 id
+        "round_id":            f"{random.getrandbits(32):08x}",
+        "tenant":              tenant.id,
+        "engine":              ENGINE,
+    })
+    deck = list(tenant.catalog.deck)
+    if race_params():
+        deck = race_deck(deck, tenant.scope(race_params()))   # 競賽：同房間同一副牌
+    else:
+        random.shuffle(deck)
+    st.session_state.deck = deck
+
+# 外部 store 要保存的遊戲狀態（不含元件/按鈕的 widget 狀態）
+GAME_KEYS = (
+    "game_init", "started_at", "score", "submit_count", "locked", "scored_keys",
+    "selected", "result", "placed", "message", "message_type", "return_wrong_avail",
+    "show_egg", "egg_submit_count", "show_win_egg", "hand_page", "hand_filter", "dnd_ack",
+    "round_id", "tenant", "engine", "deck",
+)
+
+if "game_init" not in st.session_state and not restore_state(GAME_KEYS):
+    init_game()
+elif (st.session_state.get("tenant", "") != tenant.id
+      or st.session_state.get("engine", ENGINE) != ENGINE):
+    init_game()     # 換了租戶（牌組不同）或手牌開關換了引擎，舊局面不能沿用
+track_session()
+
+# ─────────────── 輔助（快取結果避免重複計算）───────────────
+def get_remaining_cards() -> list[str]:
+    return remaining_cards(st.session_state.deck, st.session_state.placed, CARDS)
+
+def get_pts() -> int:
+    return max(1, round(BASE_SCORE / (2 ** st.session_state.submit_count)))
+
+def get_wrong_pairs() -> list[tuple[str, str]]:
+    res = st.session_state.result
+    return [
+        (name, cat)
+        for cat in CATEGORIES
+        for name in st.session_state.placed[cat]
+        if res.get(f"{name}|{cat}") == "wrong"
+    ]
+
+# ─────────────── Callbacks（純狀態操作，不觸碰 UI）───────────────
+@traced
+def toggle_select(name: str):
+    if st.session_state.locked:
+        return
+    sel = st.session_state.selected
+    sel.discard(name) if name in sel else sel.add(name)
+
+def place_cards(names: list[str], target_cat: str) -> list[str]:
+    """放入規則（按鈕與拖放共用）；回傳實際放入的卡片"""
+    placed = st.session_state.placed
+    scored = st.session_state.scored_keys
+    result = st.session_state.result
+    done = []
+    for name in names:
+        info = CARDS.get(name)
+        if info is None or name in placed[target_cat]:
+            continue
+        if not info["special"]:
+            old_cat = next((c for c in CATEGORIES if name in placed[c]), None)
+            if old_cat:
+                old_key = f"{name}|{old_cat}"
+                if old_key in scored:
+                    continue
+                placed[old_cat].remove(name)
+                result.pop(old_key, None)
+        placed[target_cat].append(name)
+        result.pop(f"{name}|{target_cat}", None)
+        done.append(name)
+    track("place", [(n, target_cat, target_cat in CARDS[n]["valid"]) for n in done], variant=VARIANT)
+    return done
+
+@traced
+def place_selected(target_cat: str):
+    if st.session_state.locked:
+        return
+    sel = st.session_state.selected
+    if not sel:
+        st.session_state.message = "⚠️ 請先點選手牌卡片！"
+        st.session_state.message_type = "warning"
+        return
+    done = place_cards(list(sel), target_cat)
+    sel.difference_update(done)
+    if done:
+        st.session_state.message = f"✅ 成功放入 {len(done)} 張至【{target_cat}】"
+        st.session_state.message_type = "success"
+    else:
+        st.session_state.message = "⚠️ 所選卡片已在此類別或已鎖定"
+        st.session_state.message_type = "warning"
+
+@traced
+def apply_dnd_batch():
+    """拖放元件送回一整批移動，逐類別套用與 place_selected 相同的規則"""
+    from food_game.dnd import batch_moves
+
+    batch = st.session_state.get("dnd_hand")
+    if not batch or batch.get("id") == st.session_state.dnd_ack:
+        return
+    st.session_state.dnd_ack = batch["id"]
+    if st.session_state.locked:
+        return
+    total = skipped = 0
+    for cat, names in batch_moves(batch, CATEGORIES):
+        done = place_cards(names, cat)
+        total   += len(done)
+        skipped += len(names) - len(done)
+    st.session_state.selected.clear()
+    if total:
+        st.session_state.message = f"✅ 成功放入 {total} 張" + (f"（{skipped} 張無法放入）" if skipped else "")
+        st.session_state.message_type = "success"
+    else:
+        st.session_state.message = "⚠️ 所選卡片已在此類別或已鎖定"
+        st.session_state.message_type = "warning"
+
+@traced
+def remove_card(name: str, from_cat: str):
+    if st.session_state.locked:
+        return
+    key = f"{name}|{from_cat}"
+    if key in st.session_state.scored_keys:
+        return
+    st.session_state.placed[from_cat].remove(name)
+    st.session_state.result.pop(key, None)
+    st.session_state.selected.discard(name)
+
+@traced
+def submit_answers():
+    if st.session_state.locked:
+        return
+    rem = get_remaining_cards()
+    if rem:
+        st.session_state.message = f"⚠️ 還有 {len(rem)} 張在手牌，請全部放入後再提交！"
+        st.session_state.message_type = "warning"
+        return
+    placed  = st.session_state.placed
+    scored  = st.session_state.scored_keys
+    result  = st.session_state.result
+    pts     = get_pts()
+    new_correct = wrong = new_pts = 0
+    judged: list[tuple[str, str, bool]] = []
+    for cat in CATEGORIES:
+        for name in placed[cat]:
+            key = f"{name}|{cat}"
+            if cat in CARDS[name]["valid"]:
+                result[key] = "correct"
+                if key not in scored:
+                    scored.add(key)
+                    new_pts += pts
+                    new_correct += 1
+                    judged.append((name, cat, True))
+            else:
+                if result.get(key) != "wrong":      # 沒退回的錯卡每次提交都會重批，只記第一次
+                    judged.append((name, cat, False))
+                result[key] = "wrong"
+                wrong += 1
+    st.session_state.submit_count += 1
+    track("judge", judged, variant=VARIANT)
+    st.session_state.score += new_pts
+
+    # ── 彩蛋觸發：第2、3、4次提交 ──
+    if flags.eggs and st.session_state.submit_count in EGG_URLS:
+        st.session_state.show_egg = True
+        st.session_state.egg_submit_count = st.session_state.submit_count
+
+    if wrong == 0 and len(scored) >= TOTAL_NEEDED:
+        st.session_state.locked = True
+        fire("win")
+        cls_room_cb, cls_player_cb, _ = classroom_params()
+        from food_game.leaderboard import get_leaderboard   # 排行榜（sqlite）過關才載入
+        get_leaderboard().record(
+            variant=VARIANT, score=st.session_state.score,
+            submits=st.session_state.submit_count,
+            duration_s=time.time() - st.session_state.started_at,
+            classroom=tenant.scope(cls_room_cb), player=cls_player_cb,
+        )
+        st.session_state.message = f"🎉 完美全對！本次獲得 {new_pts} 分，總分 {st.session_state.score} 分！"
+        st.session_state.message_type = "success"
+        st.session_state.return_wrong_avail = None
+        st.session_state.show_win_egg = flags.win_egg
+    else:
+        wp = get_wrong_pairs()
+        wrong_names = "、".join(n for n, _ in wp[:6]) + ("…" if len(wp) > 6 else "")
+        st.session_state.message = (
+            f"批改完成：✅ 答對 {new_correct} 題　❌ 答錯 {wrong} 題　＋{new_pts} 分"
+            + (f"\n錯誤：{wrong_names}" if wp else "")
+        )
+        st.session_state.message_type = "info" if wrong == 0 else "warning"
+        st.session_state.return_wrong_avail = True if wrong > 0 else None
+
+@traced
+def return_all_wrong():
+    pairs = get_wrong_pairs()
+    result = st.session_state.result
+    scored = st.session_state.scored_keys
+    count = 0
+    for name, cat in pairs:
+        key = f"{name}|{cat}"
+        if key not in scored:
+            st.session_state.placed[cat].remove(name)
+            result.pop(key, None)
+            count += 1
+    st.session_state.return_wrong_avail = False
+    st.session_state.message = f"↩ 已退回 {count} 張錯誤卡牌至手牌，請重新放置後再提交！"
+    st.session_state.message_type = "info"
+
+@traced
+def turn_hand_page(delta: int):
+    st.session_state.hand_page += delta
+
+@traced
+def set_hand_filter():
+    st.session_state.hand_page = 0
+
+@traced
+def restart_game():
+    forget_state()
+    for k in list(st.session_state.keys()):
+        del st.session_state[k]
+
+# ══════════════════════════════════════════════
+# CSS
+# ══════════════════════════════════════════════
+PHONETIC_CSS = """
+.pcard-lbl img { width: 100%; height: 36px; object-fit: contain; display: block; }
+.card-name img { width: 100%; height: 40px; object-fit: contain; display: block; }
+"""
+
+prof.mark("css")
+# 開著的功能才帶上自己的樣式
+feature_css = ""
+if flags.phonetic:
+    feature_css += PHONETIC_CSS
+if flags.eggs or flags.win_egg:
+    from food_game.eggs import EGG_CSS
+    feature_css += EGG_CSS
+
+st.markdown("""
+<style>
+""" + FONT_CSS + """
+* { font-family: 'Noto Sans TC', sans-serif !important; }
+
+[data-testid="stAppViewContainer"] {
+    background: #F8F7FF;
+    background-image:
+        radial-gradient(ellipse at 0% 0%, rgba(185,28,28,0.07) 0%, transparent 50%),
+        radial-gradient(ellipse at 100% 100%, rgba(109,40,217,0.07) 0%, transparent 50%);
+}
+[data-testid="stHeader"] { background: transparent !important; }
+.block-container { padding-top: 0.5rem !important; padding-bottom: 2rem !important; }
+
+/* ── Header ── */
+.game-header {
+    background: linear-gradient(120deg, #991B1B 0%, #B45309 50%, #5B21B6 100%);
+    border-radius: 22px;
+    padding: 18px 28px;
+    margin-bottom: 10px;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    box-shadow: 0 8px 36px rgba(0,0,0,0.25);
+    flex-wrap: wrap;
+    gap: 10px;
+}
+.game-title { font-size: 1.8rem; font-weight: 900; color: #FFFFFF; letter-spacing: -0.5px; }
+.stat-row { display: flex; gap: 8px; flex-wrap: wrap; }
+.stat-pill {
+    background: rgba(0,0,0,0.35);
+    border: 1.5px solid rgba(255,255,255,0.3);
+    border-radius: 50px;
+    padding: 5px 14px;
+    color: #FFFFFF;
+    font-weight: 700;
+    font-size: 0.82rem;
+    white-space: nowrap;
+}
+.stat-pill b { font-size: 0.95rem; }
+
+/* ── Progress ── */
+.prog-wrap {
+    background: #374151;
+    border-radius: 50px;
+    height: 12px;
+    overflow: hidden;
+    margin: 8px 0 2px;
+}
+.prog-fill {
+    height: 100%;
+    border-radius: 50px;
+    background: #4ADE80;
+    transition: width 0.5s cubic-bezier(.4,0,.2,1);
+}
+.prog-label { font-size: 0.78rem; color: #374151; font-weight: 600; text-align: right; margin-bottom: 8px; }
+
+/* ── Section titles ── */
+.panel-title {
+    font-size: 1rem; font-weight: 800; color: #111827;
+    padding-bottom: 10px;
+    border-bottom: 2px solid #D1D5DB;
+    margin-bottom: 10px;
+}
+
+/* ── Hand card wrapper ── */
+.card-wrap {
+    position: relative;
+    width: 100%;
+    margin-bottom: 0;
+}
+
+/* ── Hand cards ── */
+.card-btn-inner,
+.card-btn-inner,
+.card-inner {
+    border-radius: 12px;
+    overflow: hidden;
+    border: 3px solid #9CA3AF;
+    background: white;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    transition: border-color 0.12s, box-shadow 0.12s;
+    cursor: pointer;
+    position: relative;
+}
+.card-btn-inner.sel,
+.card-inner.sel {
+    border-color: #B91C1C;
+    box-shadow: 0 0 0 3px rgba(185,28,28,0.25), 0 6px 18px rgba(185,28,28,0.2);
+}
+.card-btn-inner.sp,
+.card-inner.sp { border-color: #6D28D9; }
+.card-btn-inner.sp.sel,
+.card-inner.sp.sel { border-color: #B91C1C; }
+.card-img {
+    width: 100%;
+    aspect-ratio: 1;
+    object-fit: cover;
+    display: block;
+    image-rendering: auto;
+}
+.badge-sel {
+    position: absolute; top: -8px; right: -8px; z-index: 10;
+    background: #B91C1C; color: #FFFFFF;
+    border-radius: 50%; width: 26px; height: 26px;
+    display: flex; align-items: center; justify-content: center;
+    font-size: 13px; font-weight: 900;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.3);
+    border: 2px solid white;
+}
+.badge-star {
+    position: absolute; top: 6px; left: 6px; z-index: 10;
+    background: #5B21B6; color: #FFFFFF;
+    border-radius: 6px;
+    padding: 2px 6px; font-size: 9px; font-weight: 900;
+}
+.card-name {
+    text-align: center;
+    padding: 5px 3px 6px;
+    font-size: 0.75rem;
+    font-weight: 700;
+    color: #111827;
+    background: white;
+    border-top: 2px solid #E5E7EB;
+}
+.card-name.sp-name { color: #4C1D95; }
+.hand-page-lbl {
+    text-align: center; padding-top: 8px;
+    font-size: 0.78rem; font-weight: 700; color: #374151;
+    white-space: nowrap;
+}
+
+/* ── Category zones ── */
+.cat-zone {
+    border-radius: 18px;
+    overflow: hidden;
+    box-shadow: 0 4px 18px rgba(0,0,0,0.12);
+    margin-bottom: 14px;
+    border: 2px solid transparent;
+}
+.cat-hdr {
+    padding: 12px 16px;
+    font-weight: 800;
+    font-size: 1rem;
+    color: #FFFFFF;
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    text-shadow: 0 1px 2px rgba(0,0,0,0.2);
+}
+.cat-cnt {
+    background: rgba(0,0,0,0.28);
+    border-radius: 50px;
+    padding: 2px 10px;
+    font-size: 0.78rem;
+    font-weight: 700;
+    color: #FFFFFF;
+}
+.cat-body { background: white; padding: 10px; min-height: 88px; }
+.cat-empty { color: #6B7280; font-size: 0.82rem; font-weight: 600; padding: 18px 0 8px; text-align: center; }
+
+/* ── Placed cards grid ── */
+.pcard-row {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 6px;
+    margin-bottom: 6px;
+}
+.pcard-cell { min-width: 0; }
+.pcard {
+    border-radius: 10px;
+    overflow: hidden;
+    border: 3px solid #9CA3AF;
+    background: white;
+    position: relative;
+}
+.pcard.pc { border-color: #15803D; }
+.pcard.pw { border-color: #B91C1C; }
+.pcard-img {
+    width: 100%;
+    aspect-ratio: 1;
+    object-fit: cover;
+    display: block;
+}
+.pcard-ov {
+    position: absolute; top: 3px; right: 3px;
+    width: 20px; height: 20px;
+    border-radius: 50%;
+    display: flex; align-items: center; justify-content: center;
+    font-size: 10px; font-weight: 900;
+    border: 2px solid white;
+}
+.pcard-ov.c { background: #15803D; color: #FFFFFF; }
+.pcard-ov.w { background: #B91C1C; color: #FFFFFF; }
+.pcard-lbl {
+    font-size: 0.68rem; font-weight: 700;
+    text-align: center; padding: 3px 2px;
+    color: #111827; background: white;
+    border-top: 2px solid #E5E7EB;
+    white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
+}
+.pcard-lbl.lc { color: #FFFFFF; background: #15803D; }
+.pcard-lbl.lw { color: #FFFFFF; background: #B91C1C; }
+
+/* ── Return banner ── */
+.return-banner {
+    background: #7F1D1D;
+    border: 2px solid #991B1B;
+    border-radius: 18px;
+    padding: 16px 20px;
+    margin: 4px 0 14px;
+    display: flex; align-items: center; gap: 16px;
+    box-shadow: 0 4px 20px rgba(127,29,29,0.35);
+    animation: pulseShadow 2.2s ease-in-out infinite;
+}
+@keyframes pulseShadow {
+    0%, 100% { box-shadow: 0 4px 20px rgba(127,29,29,0.3); }
+    50%       { box-shadow: 0 4px 28px rgba(127,29,29,0.55); }
+}
+.return-icon { font-size: 2rem; line-height: 1; }
+.return-info { flex: 1; }
+.return-count { font-size: 1.15rem; font-weight: 900; color: #FEF2F2; }
+.return-desc  { font-size: 0.8rem; color: #FECACA; margin-top: 3px; line-height: 1.5; font-weight: 500; }
+.return-once  { font-size: 0.73rem; color: #FDE68A; font-weight: 700; margin-top: 3px; }
+
+/* ── Buttons ── */
+.stButton > button {
+    border-radius: 12px !important;
+    font-weight: 800 !important;
+    font-size: 0.88rem !important;
+    transition: transform 0.15s ease, box-shadow 0.15s ease !important;
+}
+.stButton > button:hover:not([disabled]) {
+    transform: translateY(-2px) !important;
+    box-shadow: 0 8px 20px rgba(0,0,0,0.15) !important;
+}
+.stButton > button[disabled] { opacity: 0.42 !important; }
+
+/* 手牌按鈕緊貼卡片，去除多餘間距 */
+.card-wrap + div[data-testid="stButton"] {
+    margin-top: 0 !important;
+}
+hr { border-color: #D1D5DB !important; margin: 10px 0 !important; }
+""" + feature_css + "</style>", unsafe_allow_html=True)
+
+# ══════════════════════════════════════════════
+# 課堂模式：教師頁只顯示即時進度；學生要先有名字
+# ══════════════════════════════════════════════
+prof.mark("classroom")
+cls_room, cls_player, cls_teacher = classroom_params()
+cls_room  = tenant.scope(cls_room)
+race_room = tenant.scope(race_params())
+if cls_room and cls_teacher:
+    if teacher_login():
+        render_dashboard(cls_room)
+    finish_rerun()
+    st.stop()
+if (cls_room or race_room) and not cls_player:
+    joined = ask_player_name()
+    finish_rerun()
+    if joined:
+        st.rerun()
+    st.stop()
+
+# ══════════════════════════════════════════════
+# 彩蛋 Dialog 觸發（必須在主體渲染前呼叫）
+# ══════════════════════════════════════════════
+prof.mark("dialogs")
+if flags.eggs or flags.win_egg:
+    from food_game.eggs import render_eggs
+    render_eggs()
+
+# ══════════════════════════════════════════════
+# 讀取狀態（一次性，不重複呼叫）
+# ══════════════════════════════════════════════
+prof.mark("state")
+rem_cards   = get_remaining_cards()
+wrong_pairs = get_wrong_pairs()
+scored      = st.session_state.scored_keys
+scored_cnt  = len(scored)
+prog_pct    = round(scored_cnt / TOTAL_NEEDED * 100)
+
+if cls_room:
+    publish_progress(
+        cls_room, cls_player,
+        scored=scored_cnt, total=TOTAL_NEEDED,
+        submits=st.session_state.submit_count, score=st.session_state.score,
+        done=st.session_state.locked,
+    )
+
+# ══════════════════════════════════════════════
+# Header
+# ══════════════════════════════════════════════
+prof.mark("header")
+st.markdown(f"""
+<div class="game-header">
+  <div class="game-title">{tenant.title_html}</div>
+  <div class="stat-row">
+    <div class="stat-pill">⭐ 總分 <b>{st.session_state.score}</b></div>
+    <div class="stat-pill">🔢 提交 <b>{st.session_state.submit_count}</b> 次</div>
+    <div class="stat-pill">💎 每題 <b>{get_pts()}</b> 分</div>
+    <div class="stat-pill">🎴 手牌 <b>{len(rem_cards)}</b> 張</div>
+  </div>
+</div>
+<div class="prog-wrap"><div class="prog-fill" style="width:{prog_pct}%"></div></div>
+<div class="prog-label">完成進度 {prog_pct}%　({scored_cnt}/{TOTAL_NEEDED} 題已鎖定)</div>
+""", unsafe_allow_html=True)
+
+if race_room:
+    race_panel(
+        race_room, cls_player,
+        scored=scored_cnt, total=TOTAL_NEEDED,
+        submits=st.session_state.submit_count, done=st.session_state.locked,
+    )
+
+# ── 訊息（深底淺字，高對比）──
+if st.session_state.message:
+    _styles = {
+        "success": ("✅", "#14532D", "#FFFFFF", "#4ADE80"),
+        "warning": ("⚠️", "#1F2937", "#F9FAFB", "#F59E0B"),
+        "info":    ("📋", "#1F2937", "#F9FAFB", "#60A5FA"),
+    }
+    icon, bg, text, accent = _styles.get(st.session_state.message_type, _styles["info"])
+    msg_html = st.session_state.message.replace("\n", "<br>")
+    st.markdown(f"""
+    <div style="background:{bg};border-left:5px solid {accent};border-radius:14px;
+        padding:13px 18px;margin:6px 0 4px;font-size:0.88rem;font-weight:500;
+        color:{text};line-height:1.7;display:flex;align-items:flex-start;gap:10px;">
+      <span style="font-size:1.1rem;line-height:1.5;flex-shrink:0;">{icon}</span>
+      <span>{msg_html}</span>
+    </div>""", unsafe_allow_html=True)
+
+prof.mark("effects")
+render_effects()
+if st.session_state.locked:
+    from food_game.leaderboard import render_leaderboard
+    render_leaderboard(VARIANT, cls_room)
+prof.mark("banner")
+
+# ── 一鍵退回 Banner ──
+if st.session_state.return_wrong_avail is True and wrong_pairs:
+    n_wrong = len(wrong_pairs)
+    col_info, col_btn = st.columns([3.5, 1])
+    with col_info:
+        st.markdown(f"""
+        <div class="return-banner">
+          <div class="return-icon">↩️</div>
+          <div class="return-info">
+            <div class="return-count">❌ 發現 {n_wrong} 張錯誤卡牌！</div>
+            <div class="return-desc">可一鍵將所有錯誤卡牌退回手牌，重新放置後再提交。</div>
+            <div class="return-once">⚠️ 每次批改後僅能使用一次，使用後不可復原</div>
+          </div>
+        </div>""", unsafe_allow_html=True)
+    with col_btn:
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.button(f"↩ 一鍵退回 {n_wrong} 張", key="return_wrong_btn",
+                  on_click=return_all_wrong, use_container_width=True, type="primary")
+
+st.divider()
+
+# ══════════════════════════════════════════════
+# 主體
+# ══════════════════════════════════════════════
+prof.mark("columns")
+col_hand, col_board = st.columns([1, 2.5], gap="large")
+
+# ─── 左：手牌 ───────────────────────────────
+prof.mark("hand")
+with col_hand:
+    n_rem = len(rem_cards)
+    st.markdown(
+        f'<div class="panel-title">🎴 手牌區　'
+        f'<span style="color:#6B7280;font-weight:600;font-size:0.82rem;">剩 {n_rem} 張</span></div>',
+        unsafe_allow_html=True,
+    )
+
+    if not rem_cards:
+        st.markdown(
+            '<div style="background:#14532D;color:#FFFFFF;border-radius:12px;'
+            'padding:14px 16px;font-weight:700;font-size:0.9rem;text-align:center;">'
+            '🎉 手牌已清空！請點「提交答案」</div>',
+            unsafe_allow_html=True,
+        )
+    elif HAND_MODE == "dnd":
+        # 所有選取與拖放都留在瀏覽器，一批只觸發一次 rerun
+        from food_game.dnd import dnd_hand
+
+        placed_map = st.session_state.placed
+        hand_data  = []
+        for name in rem_cards:
+            info      = CARDS[name]
+            placed_in = [c for c in CATEGORIES if name in placed_map[c]]
+            hand_data.append({
+                "name":      name,
+                **card_media(name),
+                "special":   info["special"],
+                "need":      (len(info["valid"]) if info["special"] else 1) - len(placed_in),
+                "placed_in": placed_in,
+            })
+        dnd_hand(
+            hand_data,
+            [
+                {"name": cat, "color": CAT_STYLE[cat]["hdr"], "count": len(placed_map[cat])}
+                for cat in CATEGORIES
+            ],
+            locked=st.session_state.locked,
+            ack=st.session_state.dnd_ack,
+            round_id=st.session_state.round_id,
+            key="dnd_hand",
+            on_change=apply_dnd_batch,
+        )
+    else:
+        from food_game.hand import HAND_COLS, filter_by_category, hand_window
+
+        st.markdown(
+            '<p style="color:#111827;font-weight:600;font-size:0.85rem;margin-bottom:8px;">'
+            '點卡片選取（可多選）→ 點右方 📥 放入</p>',
+            unsafe_allow_html=True,
+        )
+
+        selected = st.session_state.selected
+        # 類別篩選（hand_filter 開關）：教師自訂練習牌組用；一般遊戲會直接洩漏答案，預設關閉
+        if flags.hand_filter:
+            st.selectbox(
+                "類別篩選", [None, *CATEGORIES], key="hand_filter",
+                format_func=lambda c: "全部" if c is None else c,
+                on_change=set_hand_filter, label_visibility="collapsed",
+            )
+        hand_cards = filter_by_category(rem_cards, CARDS,
+                                        st.session_state.get("hand_filter") if flags.hand_filter else None)
+        # 只渲染目前這一頁，頁碼在卡片減少時自動夾回範圍內
+        page_cards, page, n_pages = hand_window(hand_cards, st.session_state.hand_page)
+        st.session_state.hand_page = page
+
+        for rs in range(0, len(page_cards), HAND_COLS):
+            row = page_cards[rs:rs + HAND_COLS]
+            cols_ui = st.columns(HAND_COLS, gap="small")
+            for ci, name in enumerate(row):
+                with cols_ui[ci]:
+                    is_sel = name in selected
+                    st.markdown(hand_card_html(name, is_sel, flags.phonetic), unsafe_allow_html=True)
+                    st.button(
+                        "選取中" if is_sel else "選取",
+                        key=f"hand_{name}",
+                        on_click=toggle_select, args=(name,),
+                        use_container_width=True,
+                    )
+
+        # ── 翻頁（只有一頁時不顯示）──
+        if n_pages > 1:
+            nav_prev, nav_lbl, nav_next = st.columns([1, 1.2, 1], gap="small")
+            with nav_prev:
+                st.button("◀ 上一頁", key="hand_prev", disabled=page == 0,
+                          on_click=turn_hand_page, args=(-1,), use_container_width=True)
+            with nav_lbl:
+                st.markdown(
+                    f'<div class="hand-page-lbl">{page + 1} / {n_pages} 頁'
+                    f'{f"　已選 {len(selected)} 張" if selected else ""}</div>',
+                    unsafe_allow_html=True,
+                )
+            with nav_next:
+                st.button("下一頁 ▶", key="hand_next", disabled=page >= n_pages - 1,
+                          on_click=turn_hand_page, args=(1,), use_container_width=True)
+
+# ─── 右：分類區 ─────────────────────────────
+prof.mark("board")
+with col_board:
+    st.markdown('<div class="panel-title">🧺 分類區</div>', unsafe_allow_html=True)
+
+    result = st.session_state.result
+    locked = st.session_state.locked
+
+    for row_cats in [CATEGORIES[:2], CATEGORIES[2:]]:
+        pair_cols = st.columns(2, gap="medium")
+        for ci, cat in enumerate(row_cats):
+            with pair_cols[ci]:
+                s      = CAT_STYLE[cat]
+                placed = st.session_state.placed[cat]
+                cnt    = len(placed)
+
+                st.markdown(
+                    f'<div class="cat-zone" style="border-color:{s["border"]};">'
+                    f'<div class="cat-hdr" style="background:{s["hdr"]};">'
+                    f'<span>{cat}</span>'
+                    f'<span class="cat-cnt">{cnt} 張</span>'
+                    f'</div><div class="cat-body">',
+                    unsafe_allow_html=True,
+                )
+
+                # 拖放模式由元件內的類別區放入，不需要按鈕
+                if HAND_MODE != "dnd":
+                    st.button(f"📥 放入此類別", key=f"put_{cat}",
+                              on_click=place_selected, args=(cat,),
+                              use_container_width=True)
+
+                if not placed:
+                    st.markdown('<div class="cat-empty">尚無卡片</div>', unsafe_allow_html=True)
+                else:
+                    IMG_COLS = 4
+                    for rs2 in range(0, len(placed), IMG_COLS):
+                        row_p = placed[rs2:rs2 + IMG_COLS]
+                        p_cols = st.columns(IMG_COLS, gap="small")
+                        for ci2, pname in enumerate(row_p):
+                            with p_cols[ci2]:
+                                key       = f"{pname}|{cat}"
+                                is_locked = key in scored
+                                res       = result.get(key)
+                                st.markdown(
+                                    placed_card_html(pname, placed_state(is_locked, res), flags.phonetic),
+                                    unsafe_allow_html=True,
+                                )
+
+                                can_remove = (
+                                    not is_locked
+                                    and not locked
+                                    and res not in ("correct", "wrong")
+                                )
+                                if can_remove:
+                                    st.button(
+                                        "↩ 退回",
+                                        key=f"rm_{pname}_{cat}",
+                                        on_click=remove_card, args=(pname, cat),
+                                        use_container_width=True,
+                                    )
+
+                st.markdown("</div></div>", unsafe_allow_html=True)
+
+# ══════════════════════════════════════════════
+# 底部
+# ══════════════════════════════════════════════
+prof.mark("footer")
+st.divider()
+b1, b2 = st.columns([3, 1])
+with b1:
+    st.button("✅ 提交答案", type="primary",
+              disabled=st.session_state.locked,
+              on_click=submit_answers, use_container_width=True)
+with b2:
+    if st.button("🔄 重新開始", use_container_width=True):
+        restart_game()
+        finish_rerun()
+        st.rerun()
+
+save_state(GAME_KEYS)
+# result／scored_keys 的 key 都該對應到盤面上的一張卡，多出來的就是洩漏
+finish_rerun(expect=lambda: dict.fromkeys(
+    ("result", "scored_keys"),
+    {f"{n}|{c}" for c, names in st.session_state.placed.items() for n in names},
+))
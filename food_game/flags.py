@@ -0,0 +1,95 @@
+# ══════════════════════════════════════════════
+# 功能開關：彩蛋、注音卡名、iframe 手牌（選取寫在網址）、拖放手牌、手牌類別篩選
+# 這些功能原本只存在某幾支分支腳本；現在同一份程式碼依開關決定要不要用：
+# 關掉的功能不 import 模組、不送 CSS、不註冊元件，
+# 所以可以直接 A/B 比較每個功能對 rerun 延遲與傳輸量的影響（開關組合會寫進效能剖析紀錄）
+# 優先順序（後者覆寫前者）：
+#   版本預設（food_game/variants.py）→ 租戶設定 "flags" → 環境變數 FOOD_GAME_FLAGS → 網址 ?hand= → 網址 ?ff=
+#   寫法：逗號分隔，「名稱」或「+名稱」開、「-名稱」關，例如 ?ff=-eggs,+phonetic
+#   舊網址 ?hand=buttons|dnd 仍可用（等同 -dnd_hand／+dnd_hand），?hand=iframe 等同 +iframe_hand
+#   FOOD_GAME_FLAGS_URL=0：不接受網址覆寫（正式上課時固定設定）
+# ══════════════════════════════════════════════
+import os
+
+import streamlit as st
+
+FLAGS = (
+    "eggs",          # 第 2、3、4 次提交的彩蛋
+    "win_egg",       # 全對通關彩蛋
+    "phonetic",      # 卡名改用注音圖
+    "iframe_hand",   # 手牌在 iframe 元件、選取存在網址參數（v8 引擎）
+    "dnd_hand",      # 拖放手牌元件（with_eggs 引擎；關閉時逐張按鈕）
+    "hand_filter",   # 逐張按鈕手牌上方的類別篩選下拉選單
+)
+ENV_FLAGS = os.environ.get("FOOD_GAME_FLAGS", "")
+URL_FLAGS = os.environ.get("FOOD_GAME_FLAGS_URL", "1") != "0"
+
+_HAND = {
+    "buttons": {"dnd_hand": False},
+    "dnd":     {"dnd_hand": True},
+    "iframe":  {"iframe_hand": True},
+}
+
+
+class Flags:
+    """一組已決定的開關"""
+    __slots__ = FLAGS
+
+    def __init__(self, **values: bool):
+        for name in FLAGS:
+            setattr(self, name, bool(values.get(name, False)))
+
+    @property
+    def engine(self) -> str:
+        return "v8" if self.iframe_hand else "with_eggs"
+
+    @property
+    def key(self) -> str:
+        """開著的開關，剖析紀錄與壓測據此分組"""
+        return ",".join(f for f in FLAGS if getattr(self, f)) or "-"
+
+    def __repr__(self) -> str:
+        return f"Flags({self.key})"
+
+
+def parse_flags(text: str) -> dict[str, bool]:
+    """"-eggs,+phonetic" → {"eggs": False, "phonetic": True}；不認得的名稱、重複的正負號（"+-eggs"）略過"""
+    values = {}
+    for item in text.split(","):
+        item = item.strip()
+        sign = item[:1] if item[:1] in ("+", "-") else ""
+        name = item[len(sign):]
+        if name in FLAGS:
+            values[name] = sign != "-"
+    return values
+
+
+def variant_defaults(variant) -> dict[str, bool]:
+    return {
+        "eggs":        variant.eggs,
+        "win_egg":     variant.win_egg,
+        "phonetic":    variant.phonetic,
+        "iframe_hand": variant.engine == "v8",
+        "dnd_hand":    variant.hand == "dnd",
+        "hand_filter": variant.hand_filter,
+    }
+
+
+def resolve_flags(variant, tenant=None, *, url: str = "", hand: str | None = None) -> Flags:
+    """依優先順序疊出最後的開關；不讀網址，壓測等離線工具也能用"""
+    values = variant_defaults(variant)
+    if tenant is not None:
+        values.update(_HAND.get(tenant.hand_mode, {}))
+        values.update((k, bool(v)) for k, v in tenant.flags.items() if k in FLAGS)
+    values.update(parse_flags(ENV_FLAGS))
+    values.update(_HAND.get(hand, {}))
+    values.update(parse_flags(url))
+    return Flags(**values)
+
+
+def current_flags(variant, tenant) -> Flags:
+    """目前這次 rerun 的開關（含網址覆寫）"""
+    if not URL_FLAGS:
+        return resolve_flags(variant, tenant)
+    qp = st.query_params
+    return resolve_flags(variant, tenant, url=qp.get("ff", ""), hand=qp.get("hand"))
@@ -0,0 +1,44 @@
+# ══════════════════════════════════════════════
+# 手牌分頁：只渲染目前視窗內的卡片，
+# 渲染成本只跟每頁張數有關，與牌組大小無關
+# ══════════════════════════════════════════════
+from collections import Counter
+
+HAND_COLS      = 3
+HAND_PAGE_SIZE = 12   # 4 列 × 3 欄
+
+
+def remaining_cards(deck: list[str], placed: dict[str, list[str]],
+                    cards: dict[str, dict]) -> list[str]:
+    """一次計數取代逐類別 `name in list`，大牌組下為 O(N) 而非 O(N²)"""
+    cnt = Counter()
+    for names in placed.values():
+        cnt.update(names)
+    out = []
+    for name in deck:
+        info = cards[name]
+        need = len(info["valid"]) if info["special"] else 1
+        if cnt[name] < need:
+            out.append(name)
+    return out
+
+
+def filter_by_category(rem_cards: list[str], cards: dict[str, dict],
+                       category: str | None) -> list[str]:
+    """類別篩選；category 為 None 時原樣回傳"""
+    if not category:
+        return rem_cards
+    return [n for n in rem_cards if category in cards[n]["valid"]]
+
+
+def page_count(n: int, page_size: int = HAND_PAGE_SIZE) -> int:
+    return max(1, -(-n // page_size))
+
+
+def hand_window(rem_cards: list[str], page: int,
+                page_size: int = HAND_PAGE_SIZE) -> tuple[list[str], int, int]:
+    """回傳（本頁卡片, 修正後頁碼, 總頁數）；頁碼超出範圍時自動夾回"""
+    pages = page_count(len(rem_cards), page_size)
+    page  = min(max(page, 0), pages - 1)
+    start = page * page_size
+    return rem_cards[start:start + page_size], page, pages
@@ -0,0 +1,195 @@
+# ══════════════════════════════════════════════
+# 排行榜：完成的回合存進本機 SQLite（WAL 模式）
+# 提交時只把紀錄丟進佇列，由單一背景執行緒整批寫入，提交永遠不會等資料庫鎖；
+# 前 N 名查詢結果快取 TOP_TTL_S 秒，到期才重查；還在佇列、尚未寫入的紀錄會併進查詢結果，
+# 剛過關的人馬上就能在榜上看到自己（新紀錄同時讓該版本的快取失效）
+# 讀取共用一條連線（行程內一條），不必每次快取失效都重開
+# ══════════════════════════════════════════════
+import html
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+import streamlit as st
+
+DB_PATH   = os.environ.get("FOOD_GAME_DB", "food_game.db")
+TOP_TTL_S = 10
+BATCH_MAX = 500
+BATCH_WAIT_S = 0.25     # 收到第一筆後再等一下，把同時段的紀錄湊成一批
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id          INTEGER PRIMARY KEY,
+    finished_at REAL    NOT NULL,
+    variant     TEXT    NOT NULL,
+    classroom   TEXT,
+    player      TEXT,
+    score       INTEGER NOT NULL,
+    submits     INTEGER NOT NULL,
+    duration_s  REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rounds_rank ON rounds (variant, score DESC, submits, duration_s);
+"""
+
+_COLUMNS     = ("finished_at", "variant", "classroom", "player", "score", "submits", "duration_s")
+_TOP_COLUMNS = ("player", "classroom", "score", "submits", "duration_s", "finished_at")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+
+def _row_id(row: dict) -> tuple:
+    return row["finished_at"], row["player"], row["score"]
+
+
+class Leaderboard:
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        with _connect(path) as conn:
+            conn.executescript(_SCHEMA)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._cache: dict[tuple, tuple[float, list[dict]]] = {}
+        self._cache_lock = threading.Lock()
+        self._pending: list[tuple] = []     # 已進佇列、還沒寫入的紀錄（受 _cache_lock 保護）
+        self._generation = 0                # 每筆新紀錄 +1；查詢途中有新紀錄就不寫快取
+        self._read_conn: sqlite3.Connection | None = None
+        self._read_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+
+    # ── 寫入：只進佇列 ──
+    def record(self, *, variant: str, score: int, submits: int, duration_s: float,
+               classroom: str | None = None, player: str | None = None):
+        row = (time.time(), variant, classroom, player, score, submits, round(float(duration_s), 1))
+        with self._cache_lock:
+            self._pending.append(row)
+            self._generation += 1
+            for key in [k for k in self._cache if k[1] in (None, variant)]:
+                del self._cache[key]
+        self._queue.put(row)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """等目前佇列內的紀錄全部寫入（測試與關機用）"""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _run(self):
+        conn = _connect(self.path)
+        while True:
+            batch, events = [], []
+            item = self._queue.get()
+            deadline = time.monotonic() + BATCH_WAIT_S
+            while True:
+                if isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= BATCH_MAX:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    with conn:
+                        conn.executemany(
+                            f"INSERT INTO rounds ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                            batch,
+                        )
+                except sqlite3.Error:
+                    _LOGGER.exception("排行榜寫入失敗，丟棄 %d 筆", len(batch))
+                with self._cache_lock:
+                    written = set(batch)
+                    self._pending = [r for r in self._pending if r not in written]
+            for ev in events:
+                ev.set()
+
+    # ── 讀取：前 N 名，依時間失效 ──
+    def top(self, n: int = 10, variant: str | None = None,
+            classroom: str | None = None) -> list[dict]:
+        key = (n, variant, classroom)
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit and hit[0] > now:
+                return hit[1]
+        where, params = [], []
+        if variant:
+            where.append("variant = ?")
+            params.append(variant)
+        if classroom:
+            where.append("classroom = ?")
+            params.append(classroom)
+        sql = (
+            f"SELECT {', '.join(_TOP_COLUMNS)} FROM rounds"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + " ORDER BY score DESC, submits, duration_s LIMIT ?"
+        )
+        # 先取佇列中的紀錄再查：寫入若剛好在中間完成，同一筆會兩邊都有，下面依欄位去重
+        with self._cache_lock:
+            generation = self._generation
+            pending = [dict(zip(_COLUMNS, r)) for r in self._pending
+                       if (not variant or r[1] == variant) and (not classroom or r[2] == classroom)]
+        with self._read_lock:
+            if self._read_conn is None:
+                self._read_conn = _connect(self.path)
+                self._read_conn.row_factory = sqlite3.Row
+            rows = [dict(r) for r in self._read_conn.execute(sql, (*params, n))]
+        if pending:
+            seen = {_row_id(r) for r in rows}
+            rows += [{k: r[k] for k in _TOP_COLUMNS} for r in pending if _row_id(r) not in seen]
+            rows.sort(key=lambda r: (-r["score"], r["submits"], r["duration_s"]))
+            del rows[n:]
+        with self._cache_lock:
+            if generation == self._generation:
+                self._cache[key] = (now + TOP_TTL_S, rows)
+        return rows
+
+
+@st.cache_resource
+def get_leaderboard() -> Leaderboard:
+    return Leaderboard(DB_PATH)
+
+
+def leaderboard_html(rows: list[dict]) -> str:
+    if not rows:
+        return '<div class="cat-empty">還沒有紀錄</div>'
+    medals = {0: "🥇", 1: "🥈", 2: "🥉"}
+    body = "".join(
+        f'<tr><td>{medals.get(i, i + 1)}</td><td>{html.escape(r["player"] or "匿名")}</td>'
+        f'<td><b>{r["score"]}</b></td><td>{r["submits"]}</td><td>{int(r["duration_s"] // 60)}:{int(r["duration_s"] % 60):02d}</td></tr>'
+        for i, r in enumerate(rows)
+    )
+    return (
+        '<table class="lb-table"><thead><tr><th></th><th>玩家</th><th>分數</th><th>提交</th><th>用時</th></tr></thead>'
+        f'<tbody>{body}</tbody></table>'
+    )
+
+
+LEADERBOARD_CSS = """
+<style>
+.lb-table { width: 100%; border-collapse: collapse; font-size: 0.85rem; }
+.lb-table th { text-align: left; color: #6B7280; font-weight: 700; padding: 4px 8px; border-bottom: 2px solid #D1D5DB; }
+.lb-table td { padding: 5px 8px; color: #111827; font-weight: 600; border-bottom: 1px solid #E5E7EB; }
+</style>
+"""
+
+
+def render_leaderboard(variant: str, classroom: str | None = None, n: int = 10):
+    """過關後顯示；有班級時只列同班"""
+    rows = get_leaderboard().top(n, variant=variant, classroom=classroom)
+    title = "🏆 本班排行榜" if classroom else "🏆 排行榜"
+    with st.expander(title, expanded=True):
+        st.markdown(LEADERBOARD_CSS + leaderboard_html(rows), unsafe_allow_html=True)
@@ -0,0 +1,503 @@
+# ══════════════════════════════════════════════
+# 同時玩家壓力測試：N 位模擬玩家依「選牌 → 放入 → 提交 → 處理錯誤」的節奏遊玩，
+# 逐步加大 N，回報每次 rerun 的延遲百分位、CPU 使用率與 RSS
+#   python -m food_game.loadtest --players 1,5,10,20
+#   python -m food_game.loadtest --script food_game_v8.py --players 10 --games 2 --json out.json
+#   python -m food_game.loadtest --mode apptest --players 1,5
+#   python -m food_game.loadtest --script food_game_v8.py --flags=-eggs,-win_egg   ← 功能開關 A/B
+# 兩種驅動方式：
+#   server （預設）：起一個本機 streamlit run，玩家以 websocket 連線、送出與瀏覽器相同的 BackMsg，
+#                    CPU／RSS 量的是伺服器行程本身
+#   apptest：streamlit.testing.v1.AppTest 在本行程內跑；AppTest 會替換全域 Runtime，不能多執行緒，
+#            所以 N 個 session 輪流動作，量的是「N 個 session 同時存在時」單次 rerun 的成本與記憶體
+# 玩家只看畫面上的元素（按鈕 key／標籤、手牌元件參數）決定動作，兩種驅動共用同一套策略；
+# with_eggs 以 ?hand=buttons 逐張點選（最吃 rerun 的模式），v8 照前端元件的做法把選取寫進 ?sel=
+# ══════════════════════════════════════════════
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from urllib.parse import parse_qsl, urlencode
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+SEP          = "|||"     # 與 v8 引擎的 SEP 相同
+RSS_SAMPLE_S = 0.2
+STARTUP_S    = 60
+
+LBL_SUBMIT   = "✅ 提交答案"
+LBL_RESTART  = "🔄 重新開始"
+LBL_DISMISS  = ("🙈 關閉彩蛋", "🎊 太棒了！")
+
+
+def _variant(script: str):
+    from food_game.variants import variant_for_script
+
+    variant = variant_for_script(script)
+    if variant is None:
+        raise SystemExit(f"{script} 不是登錄在 food_game/variants.py 的版本")
+    return variant
+
+
+def load_cards(script: str) -> dict[str, dict]:
+    """該版本預設牌組的卡片規則（不執行腳本）"""
+    from food_game.catalog import get_catalog
+
+    variant = _variant(script)
+    cards = get_catalog(variant.deck, variant.exclude).cards
+    return {n: {"valid": list(c["valid"]), "special": c["special"]} for n, c in cards.items()}
+
+
+def is_v8(script: str, ff: str = "") -> bool:
+    """套用 ?ff= 之後實際跑的是不是 v8 引擎（iframe_hand 開關決定）"""
+    from food_game.flags import resolve_flags
+
+    return resolve_flags(_variant(script), url=ff).iframe_hand
+
+
+def pct(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    s = sorted(values)
+    return s[min(len(s) - 1, int(round(p / 100 * (len(s) - 1))))]
+
+
+# ─────────────── 畫面快照：兩種驅動都整理成同一個結構 ───────────────
+class View:
+    def __init__(self):
+        self.buttons: dict[str, dict] = {}      # key（沒有 key 時用標籤）→ {id, disabled, label}
+        self.hand: list[str] = []
+        self.selected: set[str] = set()
+        self.placed: dict[str, set[str]] = {}   # 只看得到還能退回的卡（rm_ 按鈕）
+
+    def add_button(self, wid: str, label: str, disabled: bool):
+        key = wid.split("-", 2)[2] if wid.count("-") >= 2 else "None"
+        self.buttons[label if key == "None" else key] = {"id": wid, "disabled": disabled, "label": label}
+        if key.startswith("hand_") and key not in ("hand_prev", "hand_next"):
+            self.hand.append(key[len("hand_"):])
+            if label == "選取中":
+                self.selected.add(key[len("hand_"):])
+        elif key.startswith("rm_"):
+            name, cat = key[len("rm_"):].rsplit("_", 1)
+            self.placed.setdefault(cat, set()).add(name)
+
+    def add_component(self, json_args: str):
+        args = json.loads(json_args)
+        if args.get("view") == "hand":
+            self.hand = [c["name"] for c in args.get("cards", [])]
+            self.selected = {c["name"] for c in args.get("cards", []) if c.get("selected")}
+
+    def enabled(self, key: str) -> str | None:
+        b = self.buttons.get(key)
+        return b["id"] if b and not b["disabled"] else None
+
+
+# ─────────────── 模擬玩家（策略）───────────────
+class Player:
+    """每次 decide() 回傳一個動作：(按鈕 id, 要寫進 ?sel= 的選取或 None)；回傳 None 代表玩完"""
+
+    def __init__(self, cards: dict, categories: list[str], *, v8: bool, seed: int,
+                 accuracy: float, think_s: float, games: int, max_actions: int):
+        self.cards = cards
+        self.categories = categories
+        self.v8 = v8
+        self.rng = random.Random(seed)
+        self.accuracy = accuracy
+        self.think_s = think_s
+        self.games = games
+        self.max_actions = max_actions
+        self.plan: list[str] = []           # with_eggs：待點的選牌按鈕，最後一個是放入
+        self.actions = 0
+        self.wins = 0
+        self.errors = 0
+        self.latencies: list[float] = []
+
+    def think(self) -> float:
+        return self.rng.uniform(0.5, 1.5) * self.think_s if self.think_s else 0.0
+
+    def _choose(self, view: View) -> tuple[list[str], str]:
+        first = self.rng.choice(view.hand)
+        valid = [c for c in self.cards[first]["valid"] if first not in view.placed.get(c, ())]
+        if valid and self.rng.random() < self.accuracy:
+            target = self.rng.choice(valid)
+        else:
+            target = self.rng.choice(self.categories)
+        group = [first] + [n for n in dict.fromkeys(view.hand)
+                           if n != first and target in self.cards[n]["valid"]]
+        return group[:self.rng.randint(1, 3)], target
+
+    def decide(self, view: View) -> tuple[str, str | None] | None:
+        if self.actions >= self.max_actions:
+            return None
+        self.actions += 1
+        for lbl in LBL_DISMISS:
+            if (wid := view.enabled(lbl)):
+                return wid, None
+        submit = view.buttons.get(LBL_SUBMIT)
+        if submit and submit["disabled"]:           # 提交鈕停用＝已全對鎖定
+            self.wins += 1
+            self.plan = []
+            if self.wins >= self.games:
+                return None
+            return view.buttons[LBL_RESTART]["id"], None
+        if (wid := view.enabled("return_wrong_btn")):
+            return wid, None
+        # 照計畫點下一步（計畫中的按鈕不見了就重排）
+        while self.plan:
+            key = self.plan.pop(0)
+            if (wid := view.enabled(key)):
+                return wid, None
+        if view.hand:
+            group, target = self._choose(view)
+            if self.v8:
+                return view.buttons[f"put_{target}"]["id"], SEP.join(sorted(set(group)))
+            # 先取消不在這組的已選卡，再逐張選取，最後放入
+            self.plan = [f"hand_{n}" for n in view.selected if n not in group]
+            self.plan += [f"hand_{n}" for n in group if n not in view.selected]
+            self.plan.append(f"put_{target}")
+            return self.decide(view) if self.plan else None
+        for nav in ("hand_next", "hand_prev"):
+            if (wid := view.enabled(nav)):
+                return wid, None
+        if submit:
+            return submit["id"], None
+        return None
+
+
+def _categories(cards: dict) -> list[str]:
+    return list(dict.fromkeys(c for info in cards.values() for c in info["valid"]))
+
+
+# ─────────────── 行程量測 ───────────────
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def proc_cpu_s(pid: int | None = None) -> float:
+    if pid is None:
+        return time.process_time()
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / _CLK_TCK
+
+
+def proc_rss(pid: int | None = None) -> int:
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _RssSampler:
+    def __init__(self, pid: int | None):
+        self.pid = pid
+        self.base = self.peak = proc_rss(pid)
+        self._stop = threading.Event()
+        self._t = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(RSS_SAMPLE_S):
+            self.peak = max(self.peak, proc_rss(self.pid))
+
+    def __enter__(self):
+        self._t.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self.peak = max(self.peak, proc_rss(self.pid))
+
+
+def summarize(n: int, players: list[Player], wall: float, cpu: float, rss: _RssSampler) -> dict:
+    lat = [x for p in players for x in p.latencies]
+    return {
+        "players":      n,
+        "reruns":       len(lat),
+        "wall_s":       round(wall, 2),
+        "reruns_per_s": round(len(lat) / wall, 1) if wall else 0,
+        "p50_ms":       round(pct(lat, 50), 1),
+        "p90_ms":       round(pct(lat, 90), 1),
+        "p99_ms":       round(pct(lat, 99), 1),
+        "max_ms":       round(max(lat, default=0), 1),
+        "mean_ms":      round(statistics.fmean(lat), 1) if lat else 0,
+        "cpu_pct":      round(cpu / wall * 100, 1) if wall else 0,
+        "rss_base_mb":  round(rss.base / 2**20, 1),
+        "rss_peak_mb":  round(rss.peak / 2**20, 1),
+        "wins":         sum(p.wins for p in players),
+        "errors":       sum(p.errors for p in players),
+    }
+
+
+# ─────────────── 驅動一：AppTest（同一行程、輪流動作）───────────────
+def _apptest_view(at) -> View:
+    view = View()
+    for b in at.button:
+        view.add_button(b.proto.id, b.label, b.disabled)
+
+    def walk(node):
+        for c in getattr(node, "children", {}).values():
+            if getattr(c, "type", None) == "component_instance":
+                view.add_component(c.proto.json_args)
+            walk(c)
+    walk(at.main)
+    return view
+
+
+def run_apptest_step(script: str, cards: dict, n: int, args) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    v8 = is_v8(script, args.flags)
+    players = [_make_player(cards, v8, i, args) for i in range(n)]
+    tests = []
+    for p in players:
+        at = AppTest.from_file(script, default_timeout=60)
+        at.query_params.update(_base_query(v8, args.flags))
+        tests.append(at)
+    with _RssSampler(None) as rss:
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        for p, at in zip(players, tests):
+            _timed(p, at, at.run)
+        active = list(zip(players, tests))
+        while active:
+            still = []
+            for p, at in active:
+                action = p.decide(_apptest_view(at))
+                if action is None:
+                    continue
+                wid, sel = action
+                if sel is not None:
+                    at.query_params["sel"] = sel
+                button = next(b for b in at.button if b.proto.id == wid)
+                _timed(p, at, lambda: button.click().run())
+                still.append((p, at))
+            active = still
+        wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    return summarize(n, players, wall, cpu, rss)
+
+
+def _timed(p: Player, at, fn):
+    t = time.perf_counter()
+    fn()
+    p.latencies.append((time.perf_counter() - t) * 1000)
+    if at.exception:
+        p.errors += 1
+
+
+# ─────────────── 驅動二：本機伺服器 + websocket ───────────────
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(script: str, env: dict, poll_s: float = 0.2) -> tuple[subprocess.Popen, int]:
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", script,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_S
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return proc, port
+        except OSError:
+            if proc.poll() is not None:
+                break
+            time.sleep(poll_s)
+    proc.kill()
+    raise RuntimeError(f"streamlit 伺服器沒有起來：{script}")
+
+
+class _WsSession:
+    """一個瀏覽器分頁：送 BackMsg、收 ForwardMsg，把一次 rerun 的元素整理成 View"""
+
+    def __init__(self, ws, query: dict):
+        self.ws = ws
+        self.query = query
+        self.elements: dict[tuple, object] = {}
+        self.cache: dict[str, ForwardMsg] = {}      # 伺服器對重複大訊息只送 ref_hash
+
+    async def rerun(self, widget_id: str | None = None) -> bool:
+        m = BackMsg()
+        m.rerun_script.query_string = urlencode(self.query)
+        m.rerun_script.page_script_hash = ""
+        if widget_id:
+            m.rerun_script.widget_states.widgets.add(id=widget_id, trigger_value=True)
+        await self.ws.send(m.SerializeToString())
+        ok = True
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.ws.recv())
+            if msg.WhichOneof("type") == "ref_hash":
+                msg = self.cache.get(msg.ref_hash, msg)
+            elif msg.hash:
+                self.cache[msg.hash] = msg
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                self.elements = {}
+            elif kind == "delta" and msg.delta.HasField("new_element"):
+                self.elements[tuple(msg.metadata.delta_path)] = msg.delta.new_element
+            elif kind == "page_info_changed":
+                self.query = dict(parse_qsl(msg.page_info_changed.query_string))
+            elif kind == "session_event" and msg.session_event.WhichOneof("type") == "script_compilation_exception":
+                ok = False
+            elif kind == "script_finished":
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return ok
+
+    def view(self) -> View:
+        view = View()
+        for el in self.elements.values():
+            kind = el.WhichOneof("type")
+            if kind == "button":
+                view.add_button(el.button.id, el.button.label, el.button.disabled)
+            elif kind == "component_instance":
+                view.add_component(el.component_instance.json_args)
+            elif kind == "exception":
+                view.buttons["__exception__"] = {"id": "", "disabled": True, "label": el.exception.message}
+        return view
+
+
+async def _ws_player(p: Player, url: str, query: dict):
+    import websockets
+
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        sess = _WsSession(ws, dict(query))
+
+        async def timed(wid: str | None):
+            t = time.perf_counter()
+            await sess.rerun(wid)
+            p.latencies.append((time.perf_counter() - t) * 1000)
+            if "__exception__" in sess.view().buttons:
+                p.errors += 1
+
+        await timed(None)
+        while (action := p.decide(sess.view())) is not None:
+            await asyncio.sleep(p.think())
+            wid, sel = action
+            if sel is not None:
+                sess.query["sel"] = sel
+            await timed(wid)
+
+
+def run_server_step(script: str, cards: dict, n: int, args, env: dict) -> dict:
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        raise SystemExit("server 模式需要 websockets 套件（pip install websockets），或改用 --mode apptest")
+
+    v8 = is_v8(script, args.flags)
+    query = _base_query(v8, args.flags)
+    proc, port = start_server(script, env)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    players = [_make_player(cards, v8, i, args) for i in range(n)]
+
+    async def run_all():
+        res = await asyncio.gather(*(_ws_player(p, url, query) for p in players), return_exceptions=True)
+        for p, r in zip(players, res):
+            if isinstance(r, Exception):
+                p.errors += 1
+                print(f"  玩家連線錯誤：{type(r).__name__}: {r}", file=sys.stderr)
+
+    try:
+        with _RssSampler(proc.pid) as rss:
+            cpu0, t0 = proc_cpu_s(proc.pid), time.perf_counter()
+            asyncio.run(run_all())
+            wall, cpu = time.perf_counter() - t0, proc_cpu_s(proc.pid) - cpu0
+    finally:
+        proc.terminate()
+        proc.wait(10)
+    return summarize(n, players, wall, cpu, rss)
+
+
+def _base_query(v8: bool, ff: str) -> dict:
+    """每位玩家一開始的網址參數：with_eggs 逐張按鈕，再加上要 A/B 的功能開關"""
+    query = {} if v8 else {"hand": "buttons"}
+    if ff:
+        query["ff"] = ff
+    return query
+
+
+def _make_player(cards: dict, v8: bool, i: int, args) -> Player:
+    return Player(cards, _categories(cards), v8=v8, seed=args.seed * 1000 + i,
+                  accuracy=args.accuracy, think_s=args.think_ms / 1000,
+                  games=args.games, max_actions=args.max_actions)
+
+
+# ─────────────── 輸出 ───────────────
+COLUMNS = ("players", "reruns", "reruns_per_s", "p50_ms", "p90_ms", "p99_ms", "max_ms",
+           "cpu_pct", "rss_base_mb", "rss_peak_mb", "wins", "errors")
+
+
+def print_table(rows: list[dict]):
+    widths = [max(len(c), *(len(str(r[c])) for r in rows)) for c in COLUMNS]
+    print("  ".join(c.rjust(w) for c, w in zip(COLUMNS, widths)))
+    for r in rows:
+        print("  ".join(str(r[c]).rjust(w) for c, w in zip(COLUMNS, widths)))
+
+
+def main(argv: list[str] | None = None):
+    ap = argparse.ArgumentParser(description="食物分類遊戲：同時玩家壓力測試")
+    ap.add_argument("--script", action="append",
+                    help="要測的腳本，可重複；預設 food_game_with_eggs.py 與 food_game_v8.py")
+    ap.add_argument("--mode", choices=("server", "apptest"), default="server")
+    ap.add_argument("--players", default="1,5,10", help="逐步測試的同時玩家數，逗號分隔")
+    ap.add_argument("--games", type=int, default=1, help="每位玩家要完成幾局")
+    ap.add_argument("--max-actions", type=int, default=300, help="每位玩家最多動作數（防止卡住）")
+    ap.add_argument("--accuracy", type=float, default=0.8, help="玩家放對類別的機率")
+    ap.add_argument("--think-ms", type=float, default=0, help="兩次操作之間的平均思考時間（server 模式）")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--flags", default="",
+                    help="功能開關覆寫，同網址 ?ff=（例如 -eggs,+phonetic）；拖放手牌玩家不會操作，勿開 dnd_hand")
+    ap.add_argument("--json", help="把結果另存成 JSON")
+    args = ap.parse_args(argv)
+
+    # 排行榜等副作用寫到暫存目錄，不污染工作目錄
+    env = dict(os.environ)
+    env.setdefault("FOOD_GAME_DB", os.path.join(tempfile.mkdtemp(prefix="fg-load-"), "lb.db"))
+    os.environ["FOOD_GAME_DB"] = env["FOOD_GAME_DB"]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    scripts = args.script or ["food_game_with_eggs.py", "food_game_v8.py"]
+    steps = [int(x) for x in args.players.split(",") if x.strip()]
+
+    results = {}
+    for script in scripts:
+        path = script if os.path.isabs(script) else os.path.join(root, script)
+        cards = load_cards(path)
+        print(f"\n▶ {os.path.basename(path)}（{args.mode}"
+              + (f"，ff={args.flags}" if args.flags else "") + "）")
+        rows = []
+        for n in steps:
+            if args.mode == "server":
+                rows.append(run_server_step(path, cards, n, args, env))
+            else:
+                rows.append(run_apptest_step(path, cards, n, args))
+            print(f"  N={n}：{rows[-1]['reruns']} 次 rerun，p90 {rows[-1]['p90_ms']} ms", file=sys.stderr)
+        print_table(rows)
+        results[os.path.basename(path)] = rows
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "python": sys.version.split()[0], "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# ══════════════════════════════════════════════
+# session_state 記憶體剖析（選用）：環境變數 FOOD_GAME_MEMPROF=1 開啟；
+# 網址 ?memprof=1 只在 FOOD_GAME_MEMPROF=url 或開發環境（FOOD_GAME_DEV=1）才有效
+# 每次 rerun 結束時記下 session_state 每個 key 的大小與項目數、widget 狀態筆數，
+# 以及 tracemalloc 與上一次快照相比成長最多的配置位置（整個行程共用，多人同時開時會混在一起）
+# 偵測三種洩漏：
+#   stale widget：狀態裡的 widget（或 key→id 對照）連續 STALE_RUNS 次 rerun 都沒有畫出來
+#   孤兒 key    ：引擎說某個 dict／set 只該有哪些 key（例如 result 只該有盤面上的卡），多出來的
+#   持續成長    ：某個 key 的項目數在最近 GROWTH_RUNS 次 rerun 只增不減，且超過 GROWTH_MIN
+# 結果顯示在頁尾可收合面板，並逐次 rerun 追加到 profiles/memory-日期.jsonl
+# ══════════════════════════════════════════════
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Collection
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from food_game.compat import supported
+from food_game.profiler import _append_trace, _trace_path, url_allowed
+from food_game.sessions import SESSION_TTL_S, approx_size
+
+MEMPROF_ENV  = "FOOD_GAME_MEMPROF"
+TRACE_FRAMES = 1        # tracemalloc 每筆配置記幾層呼叫（越多越準也越慢）
+TOP_N        = 10
+STALE_RUNS   = 3
+GROWTH_RUNS  = 20
+GROWTH_MIN   = 200
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LOGGER = logging.getLogger(__name__)
+_lock = threading.Lock()
+_histories: dict[str, "_History"] = {}
+_last_snapshot: list = [None]       # 上一次 tracemalloc 快照（行程共用）
+
+
+def memprof_enabled() -> bool:
+    if os.environ.get(MEMPROF_ENV) == "1":
+        return True
+    return url_allowed(MEMPROF_ENV) and st.query_params.get("memprof") == "1"
+
+
+class _History:
+    """同一個 session 跨 rerun 的紀錄：各 key 的項目數與 widget 連續沒畫出來的次數"""
+    __slots__ = ("seen", "items", "stale", "reported")
+
+    def __init__(self):
+        self.seen = time.time()
+        self.items: dict[str, deque[int]] = {}
+        self.stale: dict[str, int] = {}
+        self.reported: set[str] = set()
+
+
+def _history(session_id: str) -> _History:
+    now = time.time()
+    with _lock:
+        for sid in [s for s, h in _histories.items() if now - h.seen > SESSION_TTL_S]:
+            del _histories[sid]
+        hist = _histories.get(session_id)
+        if hist is None:
+            hist = _histories[session_id] = _History()
+        hist.seen = now
+        return hist
+
+
+def widget_state() -> tuple[dict[str, str], set[str], set[str]]:
+    """（widget id → 使用者 key、狀態裡有值的 widget id、這次 rerun 畫出來的 widget id）；
+    都是 Streamlit 內部結構，版本不合時回傳空的，剖析其他部分照常"""
+    from streamlit.runtime.state import get_session_state
+
+    ctx = get_script_run_ctx()
+    state = getattr(get_session_state(), "_state", None)
+    if ctx is None or not supported("widget_state"):
+        return {}, set(), set()
+    try:
+        id_key = dict(state._key_id_mapper.id_key_mapping)
+        stored = set(state._new_widget_state.states) | {k for k in state._old_state if k.startswith("$$ID-")}
+        active = set(ctx.shared.widget_ids_this_run.snapshot())
+    except AttributeError:
+        return {}, set(), set()
+    return id_key, stored, active
+
+
+def _where(frame) -> str:
+    path = frame.filename
+    if path.startswith(ROOT):
+        path = os.path.relpath(path, ROOT)
+    elif "site-packages" in path:
+        path = path.split("site-packages" + os.sep, 1)[1]
+    return f"{path}:{frame.lineno}"
+
+
+def tracemalloc_top() -> dict:
+    """與上一次快照相比成長最多的配置位置；第一次呼叫才開始追蹤"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES)
+    snap = tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+    with _lock:
+        prev, _last_snapshot[0] = _last_snapshot[0], snap
+    current, peak = tracemalloc.get_traced_memory()
+    if prev is None:
+        stats = snap.statistics("lineno")[:TOP_N]
+        top = [[_where(s.traceback[0]), round(s.size / 1024, 1), round(s.size / 1024, 1), s.count]
+               for s in stats]
+    else:
+        stats = snap.compare_to(prev, "lineno")[:TOP_N]
+        top = [[_where(s.traceback[0]), round(s.size_diff / 1024, 1), round(s.size / 1024, 1), s.count_diff]
+               for s in stats]
+    return {"traced_kb": round(current / 1024), "peak_kb": round(peak / 1024), "top": top}
+
+
+class MemProfiler:
+    def __init__(self):
+        self.t_start = time.perf_counter()
+
+    def _keys(self, widget_keys: set[str]) -> list[dict]:
+        rows = []
+        for key, value in st.session_state.to_dict().items():
+            if key in widget_keys:
+                continue
+            rows.append({
+                "key":   key,
+                "bytes": approx_size(value),
+                "items": len(value) if isinstance(value, (dict, list, set, tuple, deque)) else None,
+            })
+        return sorted(rows, key=lambda r: -r["bytes"])
+
+    def _leaks(self, hist: _History, rows: list[dict], stale: list[str],
+               expect: dict[str, Collection[str]]) -> list[str]:
+        leaks = []
+        for key in stale:
+            hist.stale[key] = hist.stale.get(key, 0) + 1
+        for key in [k for k in hist.stale if k not in stale]:
+            del hist.stale[key]
+        old = sorted(k for k, n in hist.stale.items() if n >= STALE_RUNS)
+        if old:
+            shown = "、".join(old[:5]) + ("…" if len(old) > 5 else "")
+            leaks.append(f"stale widget：{len(old)} 個 key 連續 {STALE_RUNS} 次以上沒有畫出來（{shown}）")
+        for key, allowed in expect.items():
+            value = st.session_state.get(key)
+            if value is None:
+                continue
+            orphans = set(value) - set(allowed)
+            if orphans:
+                shown = "、".join(sorted(orphans)[:5]) + ("…" if len(orphans) > 5 else "")
+                leaks.append(f"{key}：{len(orphans)} 個 key 已不在盤面上（{shown}）")
+        for r in rows:
+            if r["items"] is None:
+                continue
+            window = hist.items.setdefault(r["key"], deque(maxlen=GROWTH_RUNS))
+            window.append(r["items"])
+            if (len(window) == GROWTH_RUNS and window[-1] >= GROWTH_MIN and window[-1] > window[0]
+                    and all(a <= b for a, b in zip(window, list(window)[1:]))):
+                leaks.append(f"{r['key']}：最近 {GROWTH_RUNS} 次 rerun 只增不減，已有 {window[-1]} 項")
+        return leaks
+
+    def finish(self, expect: Callable[[], dict[str, Collection[str]]] | None = None):
+        """在頁尾拍快照；expect 回傳 {key: 允許的 key}，用來抓 result 之類的孤兒 key"""
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx else "-"
+        id_key, stored, active = widget_state()
+        widget_keys = set(id_key.values())
+        rows = self._keys(widget_keys)
+        stale = sorted(id_key.get(w, w) for w in (stored | set(id_key)) - active)
+        hist = _history(session_id)
+        leaks = self._leaks(hist, rows, stale, expect() if expect else {})
+        traced = tracemalloc_top()
+        state_bytes = sum(r["bytes"] for r in rows)
+        record = {
+            "ts":          round(time.time(), 3),
+            "session":     session_id,
+            "state_bytes": state_bytes,
+            "keys":        rows,
+            "widgets":     {"stored": len(stored), "mapped": len(id_key), "active": len(active),
+                            "stale": stale},
+            "tracemalloc": traced,
+            "leaks":       leaks,
+            "ms":          round((time.perf_counter() - self.t_start) * 1000, 2),
+        }
+        _append_trace(record, "memory")
+        for leak in leaks:
+            kind = leak.split("：", 1)[0]      # 同一種洩漏每個 session 只記一次 log，數量變了不重複記
+            if kind not in hist.reported:
+                hist.reported.add(kind)
+                _LOGGER.warning("[%s] 疑似洩漏：%s", session_id, leak)
+
+        label = (f"🧠 記憶體剖析：session_state {state_bytes / 1024:.1f} KB、"
+                 f"widget 狀態 {len(stored)} 筆（{len(stale)} 筆這次沒畫出來）"
+                 + (f"、⚠️ {len(leaks)} 個疑似洩漏" if leaks else ""))
+        with st.expander(label):
+            for leak in leaks:
+                st.warning(leak)
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+            st.caption(f"tracemalloc：目前 {traced['traced_kb']} KB、峰值 {traced['peak_kb']} KB；"
+                       "與上一次快照相比成長最多的位置（KB）")
+            st.dataframe([{"位置": w, "成長": d, "大小": s, "筆數變化": c} for w, d, s, c in traced["top"]],
+                         hide_index=True, use_container_width=True)
+            st.caption(f"追蹤檔：{_trace_path('memory')}")
+
+
+class _NullMemProfiler:
+    def finish(self, expect=None):
+        pass
+
+
+def start_memprof():
+    """關閉時回傳空物件，finish 幾乎零成本"""
+    if memprof_enabled():
+        return MemProfiler()
+    return _NullMemProfiler()
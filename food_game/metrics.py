@@ -0,0 +1,347 @@
+# ══════════════════════════════════════════════
+# 互動延遲指標：每個 callback（提交、放入、退回…）的延遲直方圖與錯誤數、
+# 「按下去到畫面更新完」的互動延遲、每次 rerun 的腳本時間，以及每個 session 的 rerun 次數
+# 由行程內的小 HTTP 伺服器提供，上課時可以用 Prometheus／Grafana 畫 p95 互動延遲
+#   http://127.0.0.1:9464/metrics        Prometheus 文字格式（秒）
+#   http://127.0.0.1:9464/metrics.json   JSON（毫秒，含 p50/p95/p99 估計值與各 session）
+#   FOOD_GAME_METRICS_PORT：埠（預設 9464，0＝不開端點，指標照樣累計）
+#   FOOD_GAME_METRICS_HOST：綁定位址（預設 127.0.0.1，只給本機）
+# 終端機查看：python -m food_game.metrics [--url http://127.0.0.1:9464] [--watch 5]
+# ══════════════════════════════════════════════
+import bisect
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from food_game.sessions import SESSION_TTL_S
+
+METRICS_HOST = os.environ.get("FOOD_GAME_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("FOOD_GAME_METRICS_PORT", 9464))
+BUCKETS_MS   = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_LOGGER = logging.getLogger(__name__)
+_local = threading.local()      # 同一個 script 執行緒上：callback → 接著的 rerun
+
+
+class Histogram:
+    """固定桶的延遲直方圖（毫秒）；分位數照 Prometheus histogram_quantile 的線性內插估計"""
+    __slots__ = ("counts", "sum", "count", "errors")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.sum = 0.0
+        self.count = self.errors = 0
+
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.sum += ms
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                if i == len(BUCKETS_MS):
+                    return float(BUCKETS_MS[-1])
+                lo = BUCKETS_MS[i - 1] if i else 0.0
+                return round(lo + (BUCKETS_MS[i] - lo) * (rank - seen) / n, 2)
+            seen += n
+        return float(BUCKETS_MS[-1])
+
+    def summary(self) -> dict:
+        return {
+            "count":   self.count,
+            "errors":  self.errors,
+            "mean_ms": round(self.sum / self.count, 2) if self.count else None,
+            "p50_ms":  self.quantile(0.50),
+            "p95_ms":  self.quantile(0.95),
+            "p99_ms":  self.quantile(0.99),
+        }
+
+
+class _SessionStats:
+    __slots__ = ("variant", "reruns", "callbacks", "errors", "last_seen")
+
+    def __init__(self, now: float):
+        self.variant = ""
+        self.reruns = self.callbacks = self.errors = 0
+        self.last_seen = now
+
+
+class Metrics:
+    def __init__(self, ttl_s: float = SESSION_TTL_S):
+        self.ttl_s = ttl_s
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.callbacks: dict[tuple[str, str], Histogram] = {}      # (版本, callback)
+        self.interactions: dict[tuple[str, str], Histogram] = {}   # (版本, callback)
+        self.reruns: dict[str, Histogram] = {}                     # 版本 → 完整跑完的 rerun
+        self.rerun_counts: dict[str, int] = {}                     # 版本 → 開始的 rerun（含被打斷的）
+        self.sessions: dict[str, _SessionStats] = {}
+
+    def _session(self, session_id: str, now: float) -> _SessionStats:
+        s = self.sessions.get(session_id)
+        if s is None:
+            s = self.sessions[session_id] = _SessionStats(now)
+        s.last_seen = now
+        return s
+
+    # ── 記錄（請求路徑上，只做加法）──
+    def observe_callback(self, session_id: str, name: str, ms: float, ok: bool):
+        with self._lock:
+            s = self._session(session_id, time.time())
+            h = self.callbacks.setdefault((s.variant, name), Histogram())
+            h.observe(ms)
+            s.callbacks += 1
+            if not ok:
+                h.errors += 1
+                s.errors += 1
+
+    def rerun_started(self, session_id: str, variant: str):
+        with self._lock:
+            s = self._session(session_id, time.time())
+            s.variant = variant
+            s.reruns += 1
+            self.rerun_counts[variant] = self.rerun_counts.get(variant, 0) + 1
+
+    def rerun_finished(self, variant: str, ms: float, interaction: tuple[str, float] | None):
+        with self._lock:
+            self.reruns.setdefault(variant, Histogram()).observe(ms)
+            if interaction is not None:
+                name, total_ms = interaction
+                self.interactions.setdefault((variant, name), Histogram()).observe(total_ms)
+
+    def prune(self, now: float):
+        if self.ttl_s <= 0:
+            return
+        with self._lock:
+            for sid in [sid for sid, s in self.sessions.items() if now - s.last_seen > self.ttl_s]:
+                del self.sessions[sid]
+
+    # ── 輸出 ──
+    def snapshot(self) -> dict:
+        from food_game.coalesce import coalesce_stats
+
+        now = time.time()
+        self.prune(now)
+        with self._lock:
+            def rows(table: dict) -> list[dict]:
+                return [{"variant": v, "callback": n, **h.summary()} for (v, n), h in sorted(table.items())]
+
+            return {
+                "uptime_s":     round(now - self.started),
+                "sessions":     len(self.sessions),
+                "callbacks":    rows(self.callbacks),
+                "interactions": rows(self.interactions),
+                "reruns": [
+                    {"variant": v, "started": self.rerun_counts.get(v, 0), **h.summary()}
+                    for v, h in sorted(self.reruns.items())
+                ],
+                "per_session": [
+                    {"session": sid[:8], "variant": s.variant, "reruns": s.reruns,
+                     "callbacks": s.callbacks, "errors": s.errors, "idle_s": round(now - s.last_seen)}
+                    for sid, s in sorted(self.sessions.items(), key=lambda kv: -kv[1].reruns)
+                ],
+                "coalesce": coalesce_stats(),
+            }
+
+    def prometheus(self) -> str:
+        from food_game.coalesce import coalesce_stats
+
+        self.prune(time.time())
+        out: list[str] = []
+
+        def header(name: str, kind: str, text: str):
+            out.append(f"# HELP {name} {text}")
+            out.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, labels: str, h: Histogram):
+            cum = 0
+            for bound, n in zip((*BUCKETS_MS, None), h.counts):
+                cum += n
+                le = "+Inf" if bound is None else f"{bound / 1000:g}"
+                out.append(f'{name}_bucket{{{labels}le="{le}"}} {cum}')
+            out.append(f"{name}_sum{{{labels.rstrip(',')}}} {h.sum / 1000:.6f}")
+            out.append(f"{name}_count{{{labels.rstrip(',')}}} {h.count}")
+
+        with self._lock:
+            header("food_game_callback_duration_seconds", "histogram", "callback 本身的執行時間")
+            for (v, n), h in sorted(self.callbacks.items()):
+                histogram("food_game_callback_duration_seconds", f'variant="{_esc(v)}",callback="{_esc(n)}",', h)
+            header("food_game_callback_errors_total", "counter", "callback 丟出例外的次數")
+            for (v, n), h in sorted(self.callbacks.items()):
+                out.append(f'food_game_callback_errors_total{{variant="{_esc(v)}",callback="{_esc(n)}"}} {h.errors}')
+            header("food_game_interaction_duration_seconds", "histogram",
+                   "從 callback 開始到接著的 rerun 跑完（使用者感受到的延遲）")
+            for (v, n), h in sorted(self.interactions.items()):
+                histogram("food_game_interaction_duration_seconds", f'variant="{_esc(v)}",callback="{_esc(n)}",', h)
+            header("food_game_rerun_duration_seconds", "histogram", "完整跑完的 rerun 腳本時間")
+            for v, h in sorted(self.reruns.items()):
+                histogram("food_game_rerun_duration_seconds", f'variant="{_esc(v)}",', h)
+            header("food_game_reruns_total", "counter", "開始的 rerun（含被打斷的）")
+            for v, n in sorted(self.rerun_counts.items()):
+                out.append(f'food_game_reruns_total{{variant="{_esc(v)}"}} {n}')
+            header("food_game_session_reruns_total", "counter", "各 session 的 rerun 次數（閒置超過 TTL 就移除）")
+            for sid, s in sorted(self.sessions.items()):
+                out.append(f'food_game_session_reruns_total{{session="{sid[:8]}",variant="{_esc(s.variant)}"}} {s.reruns}')
+            header("food_game_sessions", "gauge", "最近有活動的 session 數")
+            out.append(f"food_game_sessions {len(self.sessions)}")
+        c = coalesce_stats()
+        header("food_game_coalesced_reruns_total", "counter", "被重複點擊合併掉的 rerun")
+        out.append(f"food_game_coalesced_reruns_total {c['dropped']}")
+        return "\n".join(out) + "\n"
+
+
+def _esc(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# ══════════════════════════════════════════════
+# HTTP 端點
+# ══════════════════════════════════════════════
+def _handler(metrics: Metrics):
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body, ctype = metrics.prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8"
+            elif path == "/metrics.json":
+                body = json.dumps(metrics.snapshot(), ensure_ascii=False).encode()
+                ctype = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+@st.cache_resource
+def get_metrics() -> Metrics:
+    """行程共用；埠被占用（同機器上另一個行程）時只累計、不開端點"""
+    metrics = Metrics()
+    if METRICS_PORT:
+        from http.server import ThreadingHTTPServer    # 有開端點才載入
+
+        try:
+            server = ThreadingHTTPServer((METRICS_HOST, METRICS_PORT), _handler(metrics))
+        except OSError as e:
+            _LOGGER.info("指標端點埠 %d 已被占用，不開端點：%s", METRICS_PORT, e)
+        else:
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return metrics
+
+
+# ══════════════════════════════════════════════
+# 引擎使用的介面
+# ══════════════════════════════════════════════
+def _session_id() -> str:
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else ""
+
+
+def traced(fn):
+    """callback 計時：記錄延遲與是否丟出例外（例外照樣往外丟）"""
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        t = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            ms = (time.perf_counter() - t) * 1000
+            _local.pending = (name, t)
+            try:
+                get_metrics().observe_callback(_session_id(), name, ms, ok)
+            except Exception:
+                _LOGGER.debug("callback 指標記錄失敗", exc_info=True)
+
+    return wrapper
+
+
+class _RerunTimer:
+    __slots__ = ("variant", "t0", "interaction")
+
+    def __init__(self, variant: str, interaction: tuple[str, float] | None):
+        self.variant = variant
+        self.t0 = time.perf_counter()
+        self.interaction = interaction
+
+    def end(self):
+        """rerun 跑完時呼叫（被 st.rerun 打斷的只算次數、不算時間）"""
+        now = time.perf_counter()
+        interaction = None
+        if self.interaction is not None:
+            name, t_cb = self.interaction
+            interaction = (name, (now - t_cb) * 1000)
+        get_metrics().rerun_finished(self.variant, (now - self.t0) * 1000, interaction)
+
+
+def begin_rerun(variant: str) -> _RerunTimer:
+    """每次 rerun 在腳本開頭呼叫；接上同一執行緒上剛跑完的 callback，算出互動延遲"""
+    pending = getattr(_local, "pending", None)
+    _local.pending = None
+    get_metrics().rerun_started(_session_id(), variant)
+    return _RerunTimer(variant, pending)
+
+
+# ══════════════════════════════════════════════
+# 終端機查看
+# ══════════════════════════════════════════════
+def print_snapshot(snap: dict):
+    print(f"上線 {snap['uptime_s']} 秒，{snap['sessions']} 個 session；"
+          f"重複點擊合併省下 {snap['coalesce']['dropped']} 次 rerun")
+    cols = ("count", "errors", "mean_ms", "p50_ms", "p95_ms", "p99_ms")
+    for title, rows, key in (("callback", snap["callbacks"], "callback"),
+                             ("互動（按下到畫面更新完）", snap["interactions"], "callback"),
+                             ("rerun", snap["reruns"], None)):
+        print(f"\n── {title} ──")
+        print(f"{'版本':<20}{'名稱':<22}" + "".join(f"{c:>10}" for c in cols))
+        for r in rows:
+            cells = "".join(f"{'-' if r[c] is None else r[c]:>10}" for c in cols)
+            print(f"{r['variant']:<20}{(r[key] if key else ''):<22}{cells}")
+
+
+def main():
+    import argparse
+    import urllib.request
+
+    ap = argparse.ArgumentParser(description="查看遊戲行程的互動延遲指標")
+    ap.add_argument("--url", default=f"http://127.0.0.1:{METRICS_PORT}")
+    ap.add_argument("--watch", type=float, default=0, help="每幾秒重新整理一次（0＝只看一次）")
+    a = ap.parse_args()
+    while True:
+        with urllib.request.urlopen(f"{a.url.rstrip('/')}/metrics.json", timeout=5) as r:
+            snap = json.load(r)
+        if a.watch:
+            print("\033[2J\033[H", end="")
+        print_snapshot(snap)
+        if not a.watch:
+            break
+        time.sleep(a.watch)
+
+
+if __name__ == "__main__":
+    main()
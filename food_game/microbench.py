@@ -0,0 +1,297 @@
+# ══════════════════════════════════════════════
+# 遊戲邏輯熱點微基準：get_remaining_cards、get_wrong_pairs、place_selected（多選）、
+# submit_answers（整盤批改）、hand_card_html（整手牌）、placed_card_html（最滿的類別）
+# 函式直接從引擎原始碼取出（不是複製一份），所以之後改了引擎，這裡量到的就是改過的版本；
+# 卡片 HTML 來自 catalog 的共用快取，每批先清空快取，量的是第一次組字串的成本；
+# 以固定亂數種子產生 43／500／5000 張的牌局，看每個函式隨牌組大小怎麼成長：
+# 「成長指數」＝ log(t大/t小) / log(N大/N小)，約 1 是線性，接近 2 就是有人寫出了 O(N²)
+#   python -m food_game.microbench
+#   python -m food_game.microbench --sizes 43,500,5000,20000 --json bench.json
+#   python -m food_game.microbench --check                ← 指數超過 --max-exponent 時結束碼為 1
+#   python -m food_game.microbench --compare bench.json   ← 和之前的結果對照
+# ══════════════════════════════════════════════
+import argparse
+import ast
+import copy
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+SIZES        = (43, 500, 5000)
+MULTI_SELECT = 8        # 一次多選放入的張數（小朋友實際會選的量，不隨牌組放大）
+MIN_BATCH_S  = 0.002    # 不改狀態的函式一批至少跑這麼久，計時才準
+SAMPLE_S     = 0.25     # 每個函式、每個大小總共量這麼久
+MIN_SAMPLES  = 7
+
+# 要量的函式：（名稱, 要用的牌局, 是否會改狀態）
+CASES = (
+    ("get_remaining_cards", "mid",  False),
+    ("get_wrong_pairs",     "mid",  False),
+    ("place_selected",      "pick", True),
+    ("submit_answers",      "full", True),
+    ("hand_card_html",      "mid",  False),
+    ("placed_card_html",    "mid",  False),
+)
+
+
+class _State(dict):
+    """代替 st.session_state：引擎函式只用到屬性與 get()"""
+    __setattr__ = dict.__setitem__
+
+    def __getattr__(self, key: str):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+def load_engine(engine: str, cards: dict, categories: tuple, state: _State) -> dict:
+    """執行引擎檔的 import 與函式定義（不跑頁面本身；traced 計時層拿掉，量的是函式本身），
+    再把 st、牌組常數與會寫檔／放特效的副作用換成基準用的版本"""
+    from food_game import catalog
+    from food_game.flags import Flags
+    from food_game.variants import ENGINE_DIR
+
+    path = os.path.join(ENGINE_DIR, f"{engine}.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    tree.body = [
+        n for n in tree.body
+        if isinstance(n, (ast.Import, ast.ImportFrom))
+        or (isinstance(n, ast.FunctionDef)
+            and all(isinstance(d, ast.Name) and d.id == "traced" for d in n.decorator_list))
+    ]
+    for n in tree.body:
+        if isinstance(n, ast.FunctionDef):
+            n.decorator_list = []
+    ns = {"__name__": "food_game_microbench", "__file__": path}
+    exec(compile(tree, path, "exec"), ns)
+    ns.update(
+        st=SimpleNamespace(session_state=state),
+        CARDS=cards, CATEGORIES=categories,
+        TOTAL_NEEDED=sum(len(c["valid"]) if c["special"] else 1 for c in cards.values()),
+        BASE_SCORE=50, VARIANT="microbench", flags=Flags(),
+        track=lambda *a, **k: None, fire=lambda *a, **k: None,
+        hand_card_html=catalog.hand_card_html, placed_card_html=catalog.placed_card_html,
+        placed_state=catalog.placed_state,
+    )
+    return ns
+
+
+# ─────────────── 固定種子的牌局 ───────────────
+def make_deck(n: int) -> tuple[dict, list[str], tuple]:
+    """前 43 張就是真正的牌組，更大的牌組循環複製並加上 #編號"""
+    from food_game.catalog import get_catalog
+
+    catalog = get_catalog("with_eggs")
+    base = list(catalog.cards.items())
+    cards = {}
+    for i in range(n):
+        name, info = base[i % len(base)]
+        cards[name if i < len(base) else f"{name}#{i // len(base)}"] = info
+    return cards, list(cards), catalog.categories
+
+
+def make_state(cards: dict, deck: list[str], categories: tuple, rng: random.Random, *,
+               placed_frac: float, wrong_frac: float, judged: bool) -> _State:
+    placed = {c: [] for c in categories}
+    result, scored = {}, set()
+    for name in deck[:round(len(deck) * placed_frac)]:
+        info = cards[name]
+        targets = list(info["valid"]) if info["special"] else [rng.choice(info["valid"])]
+        for cat in targets:
+            if rng.random() < wrong_frac:
+                others = [c for c in categories if c not in info["valid"] and name not in placed[c]]
+                cat = rng.choice(others) if others else cat
+            if name in placed[cat]:
+                continue
+            placed[cat].append(name)
+            if judged:
+                key = f"{name}|{cat}"
+                if cat in info["valid"]:
+                    result[key] = "correct"
+                    scored.add(key)
+                else:
+                    result[key] = "wrong"
+    if not judged and wrong_frac and not any(n for c in categories for n in placed[c]
+                                             if c not in cards[n]["valid"]):
+        # 整盤批改要走「有錯」的分支（全對會寫排行榜），保證至少一張放錯
+        name = next(n for n in deck if not cards[n]["special"])
+        for c in categories:
+            if name in placed[c]:
+                placed[c].remove(name)
+        placed[next(c for c in categories if c not in cards[name]["valid"])].append(name)
+    rng.shuffle(deck)
+    return _State(
+        deck=deck, placed=placed, result=result, scored_keys=scored, selected=set(),
+        locked=False, submit_count=1 if judged else 0, score=0, started_at=time.time(),
+        message="", message_type="info", return_wrong_avail=None,
+        show_egg=False, egg_submit_count=0, show_win_egg=False,
+    )
+
+
+def build_boards(n: int, seed: int) -> tuple[dict, tuple, dict[str, _State]]:
+    cards, deck, categories = make_deck(n)
+    rng = random.Random(seed * 1_000_003 + n)
+    mid = make_state(cards, list(deck), categories, rng, placed_frac=0.5, wrong_frac=0.2, judged=True)
+    full = make_state(cards, list(deck), categories, rng, placed_frac=1.0, wrong_frac=0.1, judged=False)
+    pick = copy.deepcopy(mid)
+    placed_now = {name for names in pick.placed.values() for name in names}
+    hand = [name for name in pick.deck if name not in placed_now]
+    pick.selected = set(rng.sample(hand, min(MULTI_SELECT, len(hand))))
+    pick.target = rng.choice(categories)
+    return cards, categories, {"mid": mid, "full": full, "pick": pick}
+
+
+# ─────────────── 計時 ───────────────
+def _call(ns: dict, name: str, board: _State):
+    """依函式簽名準備參數；回傳無參數的呼叫"""
+    fn = ns[name]
+    if name == "place_selected":
+        return lambda: fn(board.target)
+    if name == "hand_card_html":
+        rem = ns["get_remaining_cards"]()
+
+        def hand():
+            fn.cache_clear()
+            return [fn(n, n in board.selected) for n in rem]
+        return hand
+    if name == "placed_card_html":
+        cat = max(ns["CATEGORIES"], key=lambda c: len(board.placed[c]))
+        state = ns["placed_state"]
+
+        def placed():
+            fn.cache_clear()
+            return [fn(n, state(f"{n}|{cat}" in board.scored_keys, board.result.get(f"{n}|{cat}")))
+                    for n in board.placed[cat]]
+        return placed
+    return fn
+
+
+def measure(ns: dict, state: _State, name: str, board: _State, mutates: bool) -> list[float]:
+    """回傳每次呼叫的微秒數；會改狀態的函式每次都從同一個牌局的複本開始（複製不計時）"""
+    samples = []
+    deadline = time.perf_counter() + SAMPLE_S
+    if mutates:
+        while len(samples) < MIN_SAMPLES or time.perf_counter() < deadline:
+            state.clear()
+            state.update(copy.deepcopy(board))
+            fn = _call(ns, name, state)
+            t = time.perf_counter_ns()
+            fn()
+            samples.append((time.perf_counter_ns() - t) / 1000)
+        return samples
+    state.clear()
+    state.update(board)
+    fn = _call(ns, name, state)
+    loops = 1
+    while True:
+        t = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        dt = time.perf_counter_ns() - t
+        if dt >= MIN_BATCH_S * 1e9:
+            break
+        loops *= 2
+    while len(samples) < MIN_SAMPLES or time.perf_counter() < deadline:
+        t = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter_ns() - t) / 1000 / loops)
+    return samples
+
+
+def growth(sizes: list[int], medians: list[float]) -> float | None:
+    """最大兩個牌組之間的成長指數"""
+    if len(sizes) < 2 or not medians[-2] or not medians[-1]:
+        return None
+    return round(math.log(medians[-1] / medians[-2]) / math.log(sizes[-1] / sizes[-2]), 2)
+
+
+def run(engine: str, sizes: list[int], seed: int) -> dict:
+    results: dict[str, dict] = {}
+    for n in sizes:
+        cards, categories, boards = build_boards(n, seed)
+        state = _State()
+        ns = load_engine(engine, cards, categories, state)
+        for name, board, mutates in CASES:
+            if name not in ns:
+                continue        # 另一個引擎沒有這個函式（例如 v8 的放入寫在 action 處理裡）
+            samples = measure(ns, state, name, boards[board], mutates)
+            results.setdefault(name, {})[str(n)] = {
+                "median_us": round(statistics.median(samples), 2),
+                "min_us":    round(min(samples), 2),
+                "samples":   len(samples),
+            }
+        print(f"  N={n} 完成", file=sys.stderr)
+    for name, by_size in results.items():
+        by_size["exponent"] = growth(sizes, [by_size[str(n)]["median_us"] for n in sizes])
+    return results
+
+
+# ─────────────── 輸出 ───────────────
+def print_table(results: dict, sizes: list[int]):
+    head = f"{'函式':<22}" + "".join(f"{f'N={n} (µs)':>16}" for n in sizes) + f"{'成長指數':>10}"
+    print(head)
+    for name, by_size in results.items():
+        exp = by_size["exponent"]
+        cells = "".join(f"{by_size[str(n)]['median_us']:>16.1f}" for n in sizes)
+        print(f"{name:<22}{cells}{exp if exp is not None else '-':>10}")
+
+
+def compare(old: dict, new: dict, threshold: float):
+    print(f"\n── 對照 {old.get('ts', '?')} → {new['ts']} ──")
+    for name, by_size in new["results"].items():
+        before = old.get("results", {}).get(name, {})
+        for n, cur in by_size.items():
+            if n == "exponent" or n not in before:
+                continue
+            a, b = before[n]["median_us"], cur["median_us"]
+            pct = (b - a) / a * 100 if a else 0.0
+            flag = "⚠️" if pct > threshold else "  "
+            print(f"{flag} {name:<22}N={n:<7}{a:>12.1f}{b:>12.1f}{pct:>+9.1f}%")
+
+
+def main(argv: list[str] | None = None):
+    ap = argparse.ArgumentParser(description="遊戲邏輯熱點微基準（43／500／5000 張）")
+    ap.add_argument("--engine", default="with_eggs", choices=("with_eggs", "v8"))
+    ap.add_argument("--sizes", default=",".join(map(str, SIZES)), help="牌組大小，逗號分隔")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", help="把結果另存成 JSON")
+    ap.add_argument("--compare", help="和之前的結果 JSON 對照")
+    ap.add_argument("--threshold", type=float, default=20.0, help="對照時變慢超過幾 %% 要標出來")
+    ap.add_argument("--check", action="store_true", help="成長指數超過 --max-exponent 時結束碼為 1")
+    ap.add_argument("--max-exponent", type=float, default=1.5)
+    args = ap.parse_args(argv)
+
+    sizes = sorted({int(x) for x in args.sizes.split(",") if x.strip()})
+    results = run(args.engine, sizes, args.seed)
+    report = {
+        "ts":      time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python":  sys.version.split()[0],
+        "engine":  args.engine,
+        "seed":    args.seed,
+        "sizes":   sizes,
+        "results": results,
+    }
+    print_table(results, sizes)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report, args.threshold)
+    if args.check:
+        bad = [n for n, r in results.items() if r["exponent"] is not None and r["exponent"] > args.max_exponent]
+        if bad:
+            print(f"\n成長指數超過 {args.max_exponent}：{', '.join(bad)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
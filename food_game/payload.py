@@ -0,0 +1,252 @@
+# ══════════════════════════════════════════════
+# 每次 rerun 送出的位元組計量與預算：學校網路很慢，每次 rerun 都要重送 CSS 與幾十段 HTML，
+# 這裡依元素統計 delta ForwardMsg 的位元組（markdown／html 再依第一個 class 細分，
+# 例如 "markdown .hand-card"），超過預算就記 log；測試模式直接丟例外，讓 AppTest／CI 失敗
+#   FOOD_GAME_PAYLOAD=1                      計量並逐次 rerun 寫 JSONL
+#   FOOD_GAME_PAYLOAD=url                    只有網址帶 ?payload=1 的 session 才計量（FOOD_GAME_DEV=1 亦同）
+#   FOOD_GAME_PAYLOAD=count                  只計量、留在行程內（離線報告用）
+#   FOOD_GAME_PAYLOAD_BUDGET=60000           每次 rerun 的 delta 位元組上限（設了就會計量）
+#   FOOD_GAME_PAYLOAD_ELEMENT_BUDGET=20000   單一元素的位元組上限
+#   FOOD_GAME_PAYLOAD_STRICT=1               超過預算丟 PayloadBudgetError（測試用）
+# 離線報告：用 AppTest 讓一位模擬玩家玩完一局，列出每次 rerun 的位元組與最大的元素
+#   python -m food_game.payload
+#   python -m food_game.payload --script food_game_v8.py --budget 60000 --check
+# 量的是壓縮前的 protobuf 大小（websocket 可能再壓縮），但各元素之間的比例就是瘦身的目標
+# ══════════════════════════════════════════════
+import logging
+import os
+import re
+import sys
+import time
+from collections import deque
+
+import streamlit as st
+
+from food_game.profiler import _append_trace, tap_context, untap, url_allowed
+
+PAYLOAD_ENV = "FOOD_GAME_PAYLOAD"
+BUDGET_ENV  = "FOOD_GAME_PAYLOAD_BUDGET"
+ELEMENT_ENV = "FOOD_GAME_PAYLOAD_ELEMENT_BUDGET"
+STRICT_ENV  = "FOOD_GAME_PAYLOAD_STRICT"
+TOP_N       = 12
+RECENT_N    = 1000      # 行程內保留最近幾次 rerun 的紀錄（離線報告在同一行程讀）
+
+_LOGGER = logging.getLogger(__name__)
+_CLASS_RE = re.compile(r"""class=["']([\w-]+)""")
+
+RECENT: deque[dict] = deque(maxlen=RECENT_N)
+
+
+class PayloadBudgetError(RuntimeError):
+    """測試模式下，單次 rerun 送出的位元組超過預算"""
+
+
+def budgets() -> tuple[int, int]:
+    """（整次 rerun、單一元素）的位元組上限，0 表示不限；每次讀環境變數，測試可中途改"""
+    return int(os.environ.get(BUDGET_ENV) or 0), int(os.environ.get(ELEMENT_ENV) or 0)
+
+
+def element_label(el) -> str:
+    """元素分類：一般元素用型別，markdown／html 加上第一個 class（或標明是 <style>）"""
+    kind = el.WhichOneof("type")
+    if kind not in ("markdown", "html"):
+        return kind or "?"
+    body = getattr(el, kind).body
+    if "<style" in body:
+        return f"{kind} <style>"
+    m = _CLASS_RE.search(body)
+    return f"{kind} .{m.group(1)}" if m else kind
+
+
+class PayloadMeter:
+    def __init__(self, variant: str, *, record: bool):
+        self.variant = variant
+        self.record = record
+        self.bytes = self.messages = 0
+        self.items: dict[str, list[int]] = {}     # label → [個數, 位元組, 單一最大]
+        self.tap = tap_context("payload", self._on_msg)
+
+    def _on_msg(self, msg):
+        if not msg.HasField("delta"):
+            return
+        size = msg.ByteSize()
+        self.bytes += size
+        self.messages += 1
+        delta = msg.delta
+        kind = delta.WhichOneof("type")
+        label = element_label(delta.new_element) if kind == "new_element" else kind
+        item = self.items.get(label)
+        if item is None:
+            item = self.items[label] = [0, 0, 0]
+        item[0] += 1
+        item[1] += size
+        if size > item[2]:
+            item[2] = size
+
+    def over_budget(self) -> list[str]:
+        total, element = budgets()
+        over = []
+        if total and self.bytes > total:
+            over.append(f"整次 rerun {self.bytes:,} B > {total:,} B")
+        if element:
+            over += [f"{label} 單一元素 {mx:,} B > {element:,} B"
+                     for label, (_, _, mx) in self.items.items() if mx > element]
+        return over
+
+    def finish(self):
+        """停止計量、檢查預算；要放在頁尾的剖析面板之前，面板本身不計入"""
+        if self.tap is not None:
+            self.tap.sinks.pop("payload", None)
+        over = self.over_budget()
+        record = {
+            "ts":       round(time.time(), 3),
+            "variant":  self.variant,
+            "bytes":    self.bytes,
+            "messages": self.messages,
+            "elements": {k: v for k, v in sorted(self.items.items(), key=lambda kv: -kv[1][1])},
+            "over":     over,
+        }
+        RECENT.append(record)
+        if self.record:
+            _append_trace(record, "payload")
+        if not over:
+            return
+        top = "、".join(f"{k} {v[1]:,} B" for k, v in list(record["elements"].items())[:3])
+        text = f"[{self.variant}] 送出位元組超過預算：{'；'.join(over)}（最大：{top}）"
+        if os.environ.get(STRICT_ENV) == "1":
+            raise PayloadBudgetError(text)
+        _LOGGER.warning(text)
+
+
+class _NullMeter:
+    def finish(self):
+        pass
+
+
+def start_meter(variant: str):
+    """沒開計量也沒設預算時回傳空物件，finish 幾乎零成本"""
+    mode = os.environ.get(PAYLOAD_ENV)
+    record = mode == "1" or (url_allowed(PAYLOAD_ENV) and st.query_params.get("payload") == "1")
+    if record or mode == "count" or any(budgets()):
+        return PayloadMeter(variant, record=record)
+    untap("payload")
+    return _NullMeter()
+
+
+# ─────────────── 離線報告（AppTest 玩一局）───────────────
+def play_one_game(script: str, args) -> list[dict]:
+    """一位模擬玩家在 AppTest 裡玩完一局，回傳每次完整 rerun 的紀錄"""
+    from streamlit.testing.v1 import AppTest
+
+    from food_game import payload       # 以 -m 執行時本檔是 __main__，遊戲寫的是這一份的 RECENT
+    from food_game.loadtest import _apptest_view, _base_query, _make_player, is_v8, load_cards
+
+    v8 = is_v8(script, args.flags)
+    player = _make_player(load_cards(script), v8, 0, args)
+    at = AppTest.from_file(script, default_timeout=60)
+    at.query_params.update(_base_query(v8, args.flags))
+    payload.RECENT.clear()
+    at.run()
+    while not at.exception:
+        action = player.decide(_apptest_view(at))
+        if action is None:
+            break
+        wid, sel = action
+        if sel is not None:
+            at.query_params["sel"] = sel
+        next(b for b in at.button if b.proto.id == wid).click().run()
+    if at.exception:
+        raise RuntimeError(f"{os.path.basename(script)} 執行失敗：{at.exception[0].message}")
+    return list(payload.RECENT)
+
+
+def summarize(records: list[dict]) -> dict:
+    import statistics
+
+    totals = [r["bytes"] for r in records]
+    by_label: dict[str, list[int]] = {}
+    for r in records:
+        for label, (n, b, mx) in r["elements"].items():
+            agg = by_label.setdefault(label, [0, 0, 0])
+            agg[0] += n
+            agg[1] += b
+            agg[2] = max(agg[2], mx)
+    n = len(records) or 1
+    grand = sum(totals) or 1
+    rows = [{
+        "label":        label,
+        "per_rerun":    round(cnt / n, 1),
+        "bytes_avg":    round(b / n),
+        "share_pct":    round(b / grand * 100, 1),
+        "max_element":  mx,
+    } for label, (cnt, b, mx) in sorted(by_label.items(), key=lambda kv: -kv[1][1])]
+    return {
+        "reruns":     len(records),
+        "first":      totals[0] if totals else 0,
+        "p50":        round(statistics.median(totals)) if totals else 0,
+        "max":        max(totals, default=0),
+        "over":       sum(1 for r in records if r["over"]),
+        "elements":   rows,
+    }
+
+
+def print_report(name: str, s: dict, top: int):
+    print(f"\n▶ {name}：{s['reruns']} 次 rerun，第一次 {s['first']:,} B，"
+          f"中位數 {s['p50']:,} B，最大 {s['max']:,} B，超過預算 {s['over']} 次")
+    print(f"  {'元素':<28}{'每次個數':>10}{'每次位元組':>12}{'佔比':>8}{'單一最大':>10}")
+    for r in s["elements"][:top]:
+        print(f"  {r['label']:<28}{r['per_rerun']:>10}{r['bytes_avg']:>12,}"
+              f"{r['share_pct']:>7}%{r['max_element']:>10,}")
+
+
+def main(argv: list[str] | None = None):
+    import argparse
+    import json
+    import tempfile
+
+    ap = argparse.ArgumentParser(description="每次 rerun 送出的位元組：依元素分類與預算檢查")
+    ap.add_argument("--script", action="append",
+                    help="要測的腳本，可重複；預設 food_game_with_eggs.py 與 food_game_v8.py")
+    ap.add_argument("--flags", default="", help="功能開關覆寫，同網址 ?ff=")
+    ap.add_argument("--budget", type=int, default=int(os.environ.get(BUDGET_ENV) or 0),
+                    help="每次 rerun 的位元組上限（0＝不限）")
+    ap.add_argument("--element-budget", type=int, default=int(os.environ.get(ELEMENT_ENV) or 0),
+                    help="單一元素的位元組上限（0＝不限）")
+    ap.add_argument("--check", action="store_true", help="有任何 rerun 超過預算時結束碼為 1")
+    ap.add_argument("--top", type=int, default=TOP_N, help="列出前幾大的元素")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--json", help="把結果另存成 JSON")
+    args = ap.parse_args(argv)
+    # 給 loadtest 的玩家用：一局、照常的答對率、不思考
+    args.games, args.accuracy, args.think_ms, args.max_actions = 1, 0.8, 0, 300
+
+    # 報告自己統計超過預算的次數，遊戲照常跑完；排行榜等副作用寫到暫存目錄
+    os.environ.update({PAYLOAD_ENV: "count", STRICT_ENV: "0",
+                       BUDGET_ENV: str(args.budget), ELEMENT_ENV: str(args.element_budget)})
+    os.environ.setdefault("FOOD_GAME_DB", os.path.join(tempfile.mkdtemp(prefix="fg-payload-"), "lb.db"))
+    os.environ.setdefault("FOOD_GAME_STATE", "off")
+    os.environ.setdefault("FOOD_GAME_ANALYTICS", "0")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    scripts = args.script or ["food_game_with_eggs.py", "food_game_v8.py"]
+
+    results, failed = {}, False
+    for script in scripts:
+        path = script if os.path.isabs(script) else os.path.join(root, script)
+        s = summarize(play_one_game(path, args))
+        print_report(os.path.basename(path), s, args.top)
+        results[os.path.basename(path)] = s
+        failed |= bool(s["over"])
+    if args.budget or args.element_budget:
+        print(f"\n預算：每次 rerun {args.budget or '不限'} B、單一元素 {args.element_budget or '不限'} B")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "flags": args.flags,
+                       "budget": args.budget, "element_budget": args.element_budget,
+                       "results": results}, f, ensure_ascii=False, indent=2)
+    if args.check and failed:
+        print("有 rerun 超過預算", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# ══════════════════════════════════════════════
+# 每次 rerun 的渲染剖析（選用）：環境變數 FOOD_GAME_PROFILE=1 開啟
+#   網址 ?profile=1 只在 FOOD_GAME_PROFILE=url 或開發環境（FOOD_GAME_DEV=1）才有效，
+#   正式上課時任何訪客都不能自己打開（會包住送出佇列、寫檔）
+#   追蹤檔每天一份，超過 FOOD_GAME_PROFILE_MAX_MB 就輪替，只留最近幾份與最近幾天
+# 依具名區段計時，並統計每段送出的元素數、ForwardMsg 位元組與 HTML 位元組；
+# 結果顯示在頁尾可收合面板，並逐次 rerun 追加一行 JSONL 供離線分析
+# ══════════════════════════════════════════════
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from food_game.compat import supported
+
+PROFILE_ENV = "FOOD_GAME_PROFILE"
+DEV_ENV     = "FOOD_GAME_DEV"
+PROFILE_DIR = os.environ.get("FOOD_GAME_PROFILE_DIR", "profiles")
+TRACE_MAX_BYTES = int(float(os.environ.get("FOOD_GAME_PROFILE_MAX_MB") or 20) * 1024 * 1024)
+TRACE_KEEP  = 3         # 同一天輪替後保留幾份舊檔（.1 最新）
+TRACE_DAYS  = 7         # 每種追蹤檔保留最近幾天
+OTHER       = "(其他)"
+LAUNCH      = "launch"
+
+_write_lock = threading.Lock()
+
+
+class _Tap:
+    """包住 ScriptRunContext._enqueue；沒有 sink 時直接放行。
+    ctx 跨 rerun 共用，所以只裝一次，之後只依名稱換 sink（剖析與位元組計量可同時掛），
+    中途 st.rerun/st.stop 也不會疊加"""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.sinks: dict[str, Callable] = {}
+
+    def __call__(self, msg):
+        for sink in self.sinks.values():
+            sink(msg)
+        self.inner(msg)
+
+
+def tap_context(name: str, sink: Callable):
+    """把 sink 以 name 掛到目前 session 的送出佇列上；回傳 tap（無 ctx 或 Streamlit 版本不支援時回傳 None）"""
+    ctx = get_script_run_ctx()
+    if ctx is None or not supported("enqueue"):
+        return None
+    tap = ctx._enqueue
+    if not isinstance(tap, _Tap):
+        tap = _Tap(tap)
+        ctx._enqueue = tap
+    tap.sinks[name] = sink
+    return tap
+
+
+def untap(name: str):
+    """拆掉上一次 rerun 在 finish 前被 st.rerun 打斷而留下的 sink"""
+    ctx = get_script_run_ctx()
+    if ctx is not None and isinstance(ctx._enqueue, _Tap):
+        ctx._enqueue.sinks.pop(name, None)
+
+
+def url_allowed(env: str) -> bool:
+    """網址參數能不能開這個剖析功能：開發環境，或該功能的環境變數設為 url"""
+    return os.environ.get(DEV_ENV) == "1" or os.environ.get(env) == "url"
+
+
+def profiling_enabled() -> bool:
+    if os.environ.get(PROFILE_ENV) == "1":
+        return True
+    return url_allowed(PROFILE_ENV) and st.query_params.get("profile") == "1"
+
+
+class _Section:
+    __slots__ = ("name", "ms", "elements", "blocks", "bytes", "html_bytes")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ms = 0.0
+        self.elements = self.blocks = self.bytes = self.html_bytes = 0
+
+    def as_dict(self) -> dict:
+        return {k: getattr(self, k) for k in self.__slots__}
+
+
+class Profiler:
+    def __init__(self):
+        from food_game.variants import script_started
+
+        self.sections: dict[str, _Section] = {OTHER: _Section(OTHER)}
+        self.current = self.sections[OTHER]
+        self.t_run = self.t_mark = time.perf_counter()
+        t_start = script_started()
+        if t_start is not None:
+            # 啟動器到這裡：版本／租戶／開關解析、取出編譯好的引擎、引擎頂層的 import
+            launch = self.sections[LAUNCH] = _Section(LAUNCH)
+            launch.ms = (self.t_run - t_start) * 1000
+            self.t_run = t_start
+        self.tags: dict[str, str] = {}
+        self.tap = tap_context("profile", self._on_msg)
+
+    def _on_msg(self, msg):
+        if not msg.HasField("delta"):
+            return
+        sec = self.current
+        sec.bytes += msg.ByteSize()
+        delta = msg.delta
+        if delta.HasField("new_element"):
+            sec.elements += 1
+            el = delta.new_element
+            kind = el.WhichOneof("type")
+            if kind == "markdown":
+                sec.html_bytes += len(el.markdown.body.encode())
+            elif kind == "html":
+                sec.html_bytes += len(el.html.body.encode())
+        elif delta.HasField("add_block"):
+            sec.blocks += 1
+
+    def annotate(self, **tags: str):
+        """附加到本次紀錄的欄位（例如功能開關組合），離線分析時據此分組"""
+        self.tags.update(tags)
+
+    def mark(self, name: str):
+        """結束目前區段、開始名為 name 的區段（同名區段累加）"""
+        now = time.perf_counter()
+        self.current.ms += (now - self.t_mark) * 1000
+        self.t_mark = now
+        self.current = self.sections.setdefault(name, _Section(name))
+
+    def finish(self):
+        """停止計量、寫出 JSONL，並在頁尾顯示面板（面板本身不計入）"""
+        self.mark(OTHER)
+        if self.tap is not None:
+            self.tap.sinks.pop("profile", None)
+        total_ms = (time.perf_counter() - self.t_run) * 1000
+        rows = [s.as_dict() for s in self.sections.values() if s.ms or s.elements or s.blocks]
+        for r in rows:
+            r["ms"] = round(r["ms"], 2)
+        ctx = get_script_run_ctx()
+        record = {
+            "ts":       round(time.time(), 3),
+            "session":  ctx.session_id if ctx else None,
+            "total_ms": round(total_ms, 2),
+            **self.tags,
+            "sections": rows,
+        }
+        _append_trace(record)
+        with st.expander(f"⏱️ 效能剖析：本次 rerun {total_ms:.1f} ms"):
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+            tags = "　".join(f"{k}={v}" for k, v in self.tags.items())
+            st.caption(f"追蹤檔：{_trace_path()}" + (f"　{tags}" if tags else ""))
+
+
+class _NullProfiler:
+    def annotate(self, **tags: str):
+        pass
+
+    def mark(self, name: str):
+        pass
+
+    def finish(self):
+        pass
+
+
+def start_profiler():
+    """關閉時回傳空物件，mark/finish 幾乎零成本"""
+    if profiling_enabled():
+        return Profiler()
+    # 上一次 rerun 若在 finish 前被 st.rerun 打斷，sink 還掛著，這裡順手拆掉
+    untap("profile")
+    return _NullProfiler()
+
+
+def _trace_path(kind: str = "trace") -> str:
+    return os.path.join(PROFILE_DIR, time.strftime(f"{kind}-%Y%m%d.jsonl"))
+
+
+def _rotate(path: str, kind: str):
+    """寫入前檢查：超過大小上限就輪替成 .1、.2…；開新的一天時清掉太舊的檔案"""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        _prune(kind)
+        return
+    if size < TRACE_MAX_BYTES:
+        return
+    for i in range(TRACE_KEEP - 1, 0, -1):
+        if os.path.exists(f"{path}.{i}"):
+            os.replace(f"{path}.{i}", f"{path}.{i + 1}")
+    os.replace(path, f"{path}.1")
+
+
+def _prune(kind: str):
+    import glob
+
+    days = sorted({os.path.basename(p)[len(kind) + 1:len(kind) + 9]
+                   for p in glob.glob(os.path.join(PROFILE_DIR, f"{kind}-*.jsonl*"))})
+    for day in days[:1 - TRACE_DAYS]:     # 今天的新檔案還沒建立，舊的留 TRACE_DAYS - 1 天
+        for p in glob.glob(os.path.join(PROFILE_DIR, f"{kind}-{day}.jsonl*")):
+            os.remove(p)
+
+
+def _append_trace(record: dict, kind: str = "trace"):
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+    with _write_lock:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = _trace_path(kind)
+        _rotate(path, kind)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
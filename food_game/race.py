@@ -0,0 +1,436 @@
+# ══════════════════════════════════════════════
+# 競賽模式：同一房間的學生拿到同一副（固定種子）牌，彼此的進度即時顯示
+#   學生：?race=3A&name=小明
+# 進度不靠 rerun 輪詢：頁面上的 race 元件自己連到 asyncio websocket hub，
+# 送出自己的進度、接收同房間其他人的變化；hub 只轉發精簡的差異，
+# 每個房間每 BROADCAST_MS 合併成一個封包，幾十個 30 人房間一顆核心就夠
+# hub 預設跟著 Streamlit 行程啟動（背景執行緒，只聽 127.0.0.1，前面要有反向代理；
+# 學生要直連時設 FOOD_GAME_RACE_HOST=0.0.0.0），也可以獨立執行：
+#   FOOD_GAME_RACE_SECRET=… python -m food_game.race --port 8765
+#   FOOD_GAME_RACE_SECRET=… FOOD_GAME_RACE_URL=wss://example.org/race streamlit run food_game_with_eggs.py
+# 進度以遊戲行程的批改結果為準（見下方 Hub 說明），瀏覽器無法冒名或自報進度
+# ══════════════════════════════════════════════
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+
+import streamlit as st
+
+from food_game.component import web_view
+
+RACE_HOST    = os.environ.get("FOOD_GAME_RACE_HOST", "127.0.0.1")   # 學生直連 hub 時才改成 0.0.0.0
+RACE_PORT    = int(os.environ.get("FOOD_GAME_RACE_PORT", 8765))
+RACE_URL     = os.environ.get("FOOD_GAME_RACE_URL", "")    # 有設定＝使用外部 hub，不在行程內啟動
+RACE_CONTROL_URL = os.environ.get("FOOD_GAME_RACE_CONTROL_URL", "") or RACE_URL   # 遊戲行程連 hub 的網址
+RACE_SECRET  = os.environ.get("FOOD_GAME_RACE_SECRET", "")  # 遊戲行程與外部 hub 共用；沒設定時 hub 不收控制連線
+BROADCAST_MS = 100      # 同房間的變化合併後再廣播
+JOIN_TIMEOUT_S = 10
+SEAT_TTL_S   = 4 * 3600 # 房間沒人連著、也這麼久沒進度，就連同座位一起丟掉
+MAX_NAME     = 20
+MAX_FRAME    = 512      # 瀏覽器只送加入訊息
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def race_seed(room: str) -> int:
+    """同一房間名稱永遠得到同一個種子（跨行程、跨重啟都一樣）"""
+    return int.from_bytes(hashlib.sha256(f"race:{room}".encode()).digest()[:8], "big")
+
+
+def race_deck(cards: list[str], room: str) -> list[str]:
+    deck = list(cards)
+    random.Random(race_seed(room)).shuffle(deck)
+    return deck
+
+
+# ══════════════════════════════════════════════
+# Hub
+# 座位（seat）由遊戲行程發給每位學生：token 隨元件參數交給瀏覽器，瀏覽器拿它加入後只收不送；
+# 進度由遊戲行程依批改結果回報，瀏覽器送來的東西一律不算數，同名的兩個人也是兩個座位
+# 瀏覽器 → hub：{"t":"join","seat":token}
+# 遊戲行程 → hub：行程內的 hub 直接呼叫 open_seat／report；
+#   外部 hub 走控制連線 {"t":"app","secret":..}，之後
+#   {"t":"seat","seat":..,"room":..,"name":..,"total":..}、{"t":"p","seat":..,"l":已鎖定,"k":提交,"d":完成}
+# hub → 瀏覽器：{"t":"snap","you":id,"total":..,"p":[[id,名字,l,k,d,在線],...]}
+#               {"t":"d","p":[[id,l,k,d,在線(,名字)],...]}   ← 只含有變化的人，新加入者附名字
+# ══════════════════════════════════════════════
+class _Room:
+    __slots__ = ("total", "players", "members", "dirty", "new", "scheduled", "next_id", "touched")
+
+    def __init__(self, total: int):
+        self.total = total
+        self.players: dict[int, list] = {}      # id → [名字, l, k, d, 在線]
+        self.members: dict = {}                 # websocket → id
+        self.dirty: set[int] = set()
+        self.new: set[int] = set()
+        self.scheduled = False
+        self.next_id = 0
+        self.touched = time.monotonic()
+
+
+class RaceHub:
+    def __init__(self, broadcast_ms: int = BROADCAST_MS, secret: str = RACE_SECRET):
+        self.flush_s = broadcast_ms / 1000
+        self.secret = secret
+        self.rooms: dict[str, _Room] = {}
+        self.seats: dict[str, tuple[str, int]] = {}     # token → (房間, id)
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.frames_out = 0
+
+    # ── 遊戲行程（Streamlit 執行緒）呼叫：排進 hub 的 event loop ──
+    def open_seat(self, token: str, room: str, name: str, total: int):
+        self.loop.call_soon_threadsafe(self._open_seat, token, room, name, total)
+
+    def report(self, token: str, locked: int, submits: int, done: bool):
+        self.loop.call_soon_threadsafe(self._report, token, locked, submits, done)
+
+    # ── 以下都在 hub 的 event loop 上執行 ──
+    def _open_seat(self, token: str, room_id: str, name: str, total: int):
+        if token in self.seats:
+            return
+        self._expire()
+        room_id = room_id[:40]
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.rooms[room_id] = _Room(int(total or 0))
+        room.next_id += 1
+        pid = room.next_id
+        room.players[pid] = [(name or "匿名")[:MAX_NAME], 0, 0, False, False]
+        room.new.add(pid)
+        room.touched = time.monotonic()
+        self.seats[token] = (room_id, pid)
+        self._dirty(room, pid)
+
+    def _report(self, token: str, locked: int, submits: int, done: bool):
+        seat = self.seats.get(token)
+        room = self.rooms.get(seat[0]) if seat else None
+        if room is None:
+            return
+        room.touched = time.monotonic()
+        self._set(room, seat[1], 1, int(locked))
+        self._set(room, seat[1], 2, int(submits))
+        self._set(room, seat[1], 3, bool(done))
+
+    def _expire(self):
+        """沒人連著、又很久沒有進度的房間連同座位一起丟掉"""
+        cutoff = time.monotonic() - SEAT_TTL_S
+        gone = {rid for rid, r in self.rooms.items() if not r.members and r.touched < cutoff}
+        if gone:
+            for rid in gone:
+                del self.rooms[rid]
+            self.seats = {t: s for t, s in self.seats.items() if s[0] not in gone}
+
+    async def handler(self, ws):
+        try:
+            hello = json.loads(await asyncio.wait_for(ws.recv(), JOIN_TIMEOUT_S))
+        except (asyncio.TimeoutError, ValueError):
+            return
+        if not isinstance(hello, dict):
+            return
+        if hello.get("t") == "app":
+            await self._control(ws, hello)
+            return
+        seat = self.seats.get(str(hello.get("seat"))) if hello.get("t") == "join" else None
+        room = self.rooms.get(seat[0]) if seat else None
+        if room is None:
+            await ws.close(4403, "unknown seat")
+            return
+        pid = seat[1]
+        room.members[ws] = pid
+        self._set(room, pid, 4, True)
+        await ws.send(json.dumps(
+            {"t": "snap", "you": pid, "total": room.total,
+             "p": [[i, *p] for i, p in room.players.items()]},
+            ensure_ascii=False, separators=(",", ":"),
+        ))
+        try:
+            async for _ in ws:      # 瀏覽器只收不送；送來的東西一律忽略
+                pass
+        finally:
+            room.members.pop(ws, None)
+            room.touched = time.monotonic()
+            if pid not in room.members.values():
+                self._set(room, pid, 4, False)
+
+    async def _control(self, ws, hello: dict):
+        """遊戲行程的控制連線：要有共用密碼，之後只收座位與進度"""
+        if not self.secret or not hmac.compare_digest(str(hello.get("secret", "")).encode(),
+                                                      self.secret.encode()):
+            _LOGGER.warning("拒絕未授權的競賽控制連線")
+            await ws.close(4403, "bad secret")
+            return
+        async for raw in ws:
+            try:
+                msg = json.loads(raw)
+                if msg.get("t") == "seat":
+                    self._open_seat(str(msg["seat"]), str(msg["room"]), str(msg.get("name") or ""),
+                                    int(msg.get("total") or 0))
+                elif msg.get("t") == "p":
+                    self._report(str(msg["seat"]), int(msg.get("l") or 0), int(msg.get("k") or 0),
+                                 bool(msg.get("d")))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+
+    def _set(self, room: _Room, pid: int, idx: int, value):
+        p = room.players[pid]
+        if p[idx] == value:
+            return
+        p[idx] = value
+        self._dirty(room, pid)
+
+    def _dirty(self, room: _Room, pid: int):
+        room.dirty.add(pid)
+        if not room.scheduled:
+            room.scheduled = True
+            asyncio.get_running_loop().call_later(self.flush_s, self._flush, room)
+
+    def _flush(self, room: _Room):
+        import websockets
+
+        room.scheduled = False
+        if not room.dirty or not room.members:
+            room.dirty.clear()
+            return
+        rows = []
+        for pid in room.dirty:
+            name, l, k, d, on = room.players[pid]
+            rows.append([pid, l, k, d, on, name] if pid in room.new else [pid, l, k, d, on])
+        room.dirty.clear()
+        room.new.clear()
+        frame = json.dumps({"t": "d", "p": rows}, ensure_ascii=False, separators=(",", ":"))
+        websockets.broadcast(list(room.members), frame)
+        self.frames_out += 1
+
+    async def serve(self, host: str = RACE_HOST, port: int = RACE_PORT, ready=None):
+        import websockets
+
+        self.loop = asyncio.get_running_loop()
+        async with websockets.serve(self.handler, host, port, max_size=MAX_FRAME * 4,
+                                    compression=None):
+            if ready is not None:
+                ready.set()
+            await asyncio.Future()
+
+
+class HubLink:
+    """遊戲行程 → 另一個行程的 hub 的控制連線（背景執行緒）；
+    斷線自動重連，重連後重送所有座位與最新進度，hub 重啟也能接上"""
+
+    def __init__(self, url: str, secret: str):
+        self.url = url
+        self.secret = secret
+        self._lock = threading.Lock()
+        self._seats: dict[str, tuple[float, dict]] = {}     # token → (登記時間, 座位訊息)
+        self._progress: dict[str, dict] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="race-link", daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._run(), self._loop)
+
+    def open_seat(self, token: str, room: str, name: str, total: int):
+        msg = {"t": "seat", "seat": token, "room": room, "name": name, "total": total}
+        now = time.monotonic()
+        with self._lock:
+            for old in [t for t, (ts, _) in self._seats.items() if now - ts > SEAT_TTL_S]:
+                del self._seats[old]
+                self._progress.pop(old, None)
+            self._seats[token] = (now, msg)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
+
+    def report(self, token: str, locked: int, submits: int, done: bool):
+        msg = {"t": "p", "seat": token, "l": locked, "k": submits, "d": done}
+        with self._lock:
+            self._progress[token] = msg
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
+
+    async def _run(self):
+        import websockets
+
+        retry = 0.5
+        while True:
+            try:
+                async with websockets.connect(self.url, compression=None) as ws:
+                    await ws.send(json.dumps({"t": "app", "secret": self.secret}))
+                    with self._lock:
+                        backlog = [m for _, m in self._seats.values()] + list(self._progress.values())
+                    for msg in backlog:
+                        await ws.send(json.dumps(msg, ensure_ascii=False))
+                    retry = 0.5
+                    while True:
+                        msg = await self._queue.get()
+                        await ws.send(json.dumps(msg, ensure_ascii=False))
+            except (OSError, websockets.exceptions.WebSocketException) as e:
+                _LOGGER.info("競賽 hub 控制連線中斷，%.1f 秒後重試：%s", retry, e)
+                await asyncio.sleep(retry)
+                retry = min(retry * 2, 10.0)
+
+
+def _start_hub() -> RaceHub | None:
+    """行程內啟動 hub；埠已被占用（另一個行程或獨立 hub 已在跑）時回傳 None"""
+    hub, ready, failed = RaceHub(), threading.Event(), []
+
+    def run():
+        try:
+            asyncio.run(hub.serve(ready=ready))
+        except OSError as e:
+            failed.append(e)
+            ready.set()
+
+    threading.Thread(target=run, name="race-hub", daemon=True).start()
+    ready.wait(5)
+    if failed:
+        _LOGGER.info("競賽 hub 埠 %d 已被占用，改連既有的 hub：%s", RACE_PORT, failed[0])
+        return None
+    return hub
+
+
+@st.cache_resource
+def get_race_hub() -> RaceHub | HubLink | None:
+    """座位與進度要回報給誰：行程內的 hub；設定了 FOOD_GAME_RACE_URL 或埠已被別的行程占用時，
+    改用帶 FOOD_GAME_RACE_SECRET 的控制連線回報給那個 hub"""
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        _LOGGER.warning("沒有安裝 websockets，競賽模式無法啟動 hub")
+        return None
+    if not RACE_URL:
+        hub = _start_hub()
+        if hub is not None:
+            return hub
+    if not RACE_SECRET:
+        _LOGGER.warning("競賽 hub 在別的行程，但沒有設定 FOOD_GAME_RACE_SECRET，無法回報進度")
+        return None
+    return HubLink(RACE_CONTROL_URL or f"ws://127.0.0.1:{RACE_PORT}", RACE_SECRET)
+
+
+def race_params() -> str | None:
+    return st.query_params.get("race") or None
+
+
+def race_panel(room: str, player: str, *, scored: int, total: int, submits: int, done: bool):
+    """每次 rerun 都渲染同一個元件（key 固定，iframe 與 websocket 連線不會重建）；
+    座位在第一次進房時由這裡發出，進度（已批改鎖定的張數）由遊戲行程回報給 hub，
+    其他人的變化由 websocket 推送，不觸發 rerun"""
+    hub  = get_race_hub()
+    seat = st.session_state.get("race_seat")
+    if seat is None or seat[:2] != (room, player):
+        seat = st.session_state.race_seat = (room, player, secrets.token_urlsafe(16))
+        if hub is not None:
+            hub.open_seat(seat[2], room, player, total)
+    progress = (seat[2], scored, submits, bool(done))
+    if hub is not None and st.session_state.get("race_sent") != progress:
+        hub.report(*progress)
+        st.session_state.race_sent = progress
+    web_view("race", key="race", hub_url=RACE_URL, hub_port=RACE_PORT, seat=seat[2], total=total)
+
+
+# ══════════════════════════════════════════════
+# 獨立執行與壓測：python -m food_game.race [--bench]
+# ══════════════════════════════════════════════
+async def _bench(host: str, port: int, secret: str, rooms: int, size: int, seconds: float, rate_s: float):
+    """rooms × size 個假學生，進度經控制連線回報（等同遊戲行程），每人約每 rate_s 秒一次；
+    量從回報到同房間其他人收到的延遲"""
+    import websockets
+
+    lat: list[float] = []
+    sent_at: dict[tuple[str, int], float] = {}
+    stop = time.monotonic() + seconds
+    control = await websockets.connect(f"ws://{host}:{port}", compression=None)
+    await control.send(json.dumps({"t": "app", "secret": secret}))
+    send_lock = asyncio.Lock()
+
+    async def report(msg: dict):
+        async with send_lock:
+            await control.send(json.dumps(msg))
+
+    async def join(token: str):
+        """座位登記與加入走不同連線，hub 還沒處理到登記時會被拒，稍等重試"""
+        for _ in range(50):
+            ws = await websockets.connect(f"ws://{host}:{port}", compression=None)
+            await ws.send(json.dumps({"t": "join", "seat": token}))
+            try:
+                return ws, json.loads(await ws.recv())["you"]
+            except websockets.exceptions.ConnectionClosed:
+                await asyncio.sleep(0.02)
+        raise RuntimeError("座位一直沒有登記成功")
+
+    async def pupil(room: str, name: str, idx: int):
+        token = secrets.token_urlsafe(9)
+        await report({"t": "seat", "seat": token, "room": room, "name": name, "total": 45})
+        ws, me = await join(token)
+        async with ws:
+            async def reader():
+                async for raw in ws:
+                    if idx:         # 每房只由第一位學生計時，其他人照樣收包
+                        continue
+                    now = time.monotonic()
+                    for row in json.loads(raw).get("p", ()):
+                        t = sent_at.pop((room, row[0]), None)
+                        if t is not None and row[0] != me:
+                            lat.append((now - t) * 1000)
+
+            task = asyncio.create_task(reader())
+            locked = 0
+            rng = random.Random(hash((room, name)))
+            await asyncio.sleep(rng.uniform(0, rate_s))
+            while time.monotonic() < stop:
+                locked += 1
+                sent_at[(room, me)] = time.monotonic()
+                await report({"t": "p", "seat": token, "l": locked, "k": locked // 5, "d": False})
+                await asyncio.sleep(rng.uniform(0.5, 1.5) * rate_s)
+            task.cancel()
+
+    cpu0 = time.process_time()
+    await asyncio.gather(*(pupil(f"r{r}", f"p{i}", i) for r in range(rooms) for i in range(size)))
+    await control.close()
+    return lat, time.process_time() - cpu0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="競賽模式 websocket hub")
+    ap.add_argument("--host", default=RACE_HOST)
+    ap.add_argument("--port", type=int, default=RACE_PORT)
+    ap.add_argument("--bench", action="store_true", help="在同一行程起 hub 並以假學生壓測")
+    ap.add_argument("--rooms", type=int, default=30)
+    ap.add_argument("--size", type=int, default=30)
+    ap.add_argument("--seconds", type=float, default=20)
+    ap.add_argument("--rate", type=float, default=2.0, help="每位學生平均幾秒回報一次")
+    a = ap.parse_args()
+    if not a.bench:
+        if not RACE_SECRET:
+            print("沒有設定 FOOD_GAME_RACE_SECRET：遊戲行程無法回報進度", file=sys.stderr)
+        hub = RaceHub()
+        print(f"競賽 hub：ws://{a.host}:{a.port}")
+        asyncio.run(hub.serve(a.host, a.port))
+        return
+
+    hub = RaceHub(secret=secrets.token_urlsafe(16))
+
+    async def bench():
+        ready = asyncio.Event()
+        server = asyncio.create_task(hub.serve("127.0.0.1", a.port, ready))
+        await ready.wait()
+        t0 = time.monotonic()
+        lat, cpu = await _bench("127.0.0.1", a.port, hub.secret, a.rooms, a.size, a.seconds, a.rate)
+        wall = time.monotonic() - t0
+        server.cancel()
+        lat.sort()
+        q = lambda p: lat[min(len(lat) - 1, int(p / 100 * len(lat)))] if lat else 0  # noqa: E731
+        print(f"{a.rooms} 房 × {a.size} 人，{wall:.1f} 秒：廣播 {hub.frames_out} 包，"
+              f"延遲 p50 {q(50):.0f} ms／p99 {q(99):.0f} ms（含合併間隔 {BROADCAST_MS} ms），"
+              f"CPU {cpu / wall * 100:.0f}%（hub 與假學生同一行程）")
+
+    asyncio.run(bench())
+
+
+if __name__ == "__main__":
+    main()
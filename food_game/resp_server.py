@@ -0,0 +1,113 @@
+# ══════════════════════════════════════════════
+# 本機 Redis 協定替身：只實作狀態 store 用得到的指令（PING / GET / SET [EX] / DEL /
+# EXPIRE / TTL / DBSIZE / FLUSHALL / SELECT），資料只放記憶體。
+# 開發、壓測時不必安裝 Redis：
+#   python -m food_game.resp_server --port 6390
+#   FOOD_GAME_STATE=redis://127.0.0.1:6390/0 streamlit run food_game_with_eggs.py
+# ══════════════════════════════════════════════
+import argparse
+import asyncio
+import time
+
+
+class _Db:
+    def __init__(self):
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+
+    def get(self, key: bytes) -> bytes | None:
+        hit = self.data.get(key)
+        if hit is None:
+            return None
+        if hit[1] is not None and hit[1] < time.time():
+            del self.data[key]
+            return None
+        return hit[0]
+
+
+def _bulk(b: bytes | None) -> bytes:
+    return b"$-1\r\n" if b is None else b"$%d\r\n%s\r\n" % (len(b), b)
+
+
+def _int(n: int) -> bytes:
+    return b":%d\r\n" % n
+
+
+OK = b"+OK\r\n"
+
+
+def _run(db: _Db, args: list[bytes]) -> bytes:
+    cmd = args[0].upper()
+    if cmd == b"PING":
+        return b"+PONG\r\n"
+    if cmd == b"GET":
+        return _bulk(db.get(args[1]))
+    if cmd == b"SET":
+        expires = None
+        if len(args) >= 5 and args[3].upper() == b"EX":
+            expires = time.time() + int(args[4])
+        db.data[args[1]] = (args[2], expires)
+        return OK
+    if cmd == b"DEL":
+        return _int(sum(db.data.pop(k, None) is not None for k in args[1:]))
+    if cmd == b"EXPIRE":
+        if db.get(args[1]) is None:
+            return _int(0)
+        db.data[args[1]] = (db.data[args[1]][0], time.time() + int(args[2]))
+        return _int(1)
+    if cmd == b"TTL":
+        if db.get(args[1]) is None:
+            return _int(-2)
+        exp = db.data[args[1]][1]
+        return _int(-1 if exp is None else int(exp - time.time()))
+    if cmd == b"DBSIZE":
+        return _int(len(db.data))
+    if cmd == b"FLUSHALL":
+        db.data.clear()
+        return OK
+    return b"-ERR unknown command '%s'\r\n" % args[0]
+
+
+async def _handle(dbs: dict[int, _Db], reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    db = dbs.setdefault(0, _Db())
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.startswith(b"*"):
+                writer.write(b"-ERR inline commands not supported\r\n")
+                continue
+            args = []
+            for _ in range(int(line[1:])):
+                n = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(n + 2))[:-2])
+            if args[0].upper() == b"SELECT":
+                db = dbs.setdefault(int(args[1]), _Db())
+                writer.write(OK)
+            else:
+                writer.write(_run(db, args))
+            await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 6390):
+    dbs: dict[int, _Db] = {}
+    server = await asyncio.start_server(lambda r, w: _handle(dbs, r, w), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Redis 協定替身（僅記憶體）")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=6390)
+    a = ap.parse_args()
+    print(f"RESP 替身：{a.host}:{a.port}")
+    asyncio.run(serve(a.host, a.port))
+
+
+if __name__ == "__main__":
+    main()
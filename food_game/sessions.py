@@ -0,0 +1,204 @@
+# ══════════════════════════════════════════════
+# Session 登錄表：記下每個 session 的最後活動時間與 session_state 約略大小，
+# 背景執行緒定時把閒置超過 TTL 的 session 關掉釋放記憶體，並提供總量供估算主機規模
+#   FOOD_GAME_SESSION_TTL_S：閒置多久就回收（預設一節課 45 分鐘，0＝不回收）
+# 外部狀態 store 開著時（預設為磁碟檢查點，見 state_store），遊戲每次 rerun 都已寫出，
+# 被回收的分頁重新整理後可憑網址 ?s= 接續；FOOD_GAME_STATE=off 時該局直接捨棄
+# ══════════════════════════════════════════════
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from food_game.compat import supported
+
+SESSION_TTL_S    = float(os.environ.get("FOOD_GAME_SESSION_TTL_S", 45 * 60))
+SWEEP_S          = min(60.0, max(1.0, SESSION_TTL_S / 2))   # 多久掃一次閒置 session
+MEASURE_EVERY_S  = 10      # 同一 session 多久重新估一次大小（每次 rerun 都估太浪費）
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def approx_size(obj, _seen: set | None = None) -> int:
+    """遞迴 sys.getsizeof：涵蓋 dict / list / set / tuple / deque 與其內容，同一物件只算一次；
+    session 登錄表與記憶體剖析（memprof）共用，兩邊的數字才對得起來"""
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, seen) + approx_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(approx_size(v, seen) for v in obj)
+    return size
+
+
+class _Entry:
+    __slots__ = ("created", "last_seen", "measured", "bytes", "state_keys", "runs")
+
+    def __init__(self, now: float):
+        self.created = self.last_seen = now
+        self.measured = 0.0
+        self.bytes = self.state_keys = self.runs = 0
+
+
+class SessionRegistry:
+    def __init__(self, ttl_s: float = SESSION_TTL_S):
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self.evicted = 0
+        self.evicted_bytes = 0
+        self.closed = 0     # 使用者自己關掉分頁、由 Streamlit 收掉的
+
+    def seen(self, session_id: str, now: float) -> bool:
+        """記錄一次活動；回傳這次是否該重新估算大小"""
+        with self._lock:
+            e = self._entries.get(session_id)
+            if e is None:
+                e = self._entries[session_id] = _Entry(now)
+            e.last_seen = now
+            e.runs += 1
+            return now - e.measured >= MEASURE_EVERY_S
+
+    def measured(self, session_id: str, now: float, nbytes: int, nkeys: int):
+        """nkeys：session_state 的 key 數（含 widget 的值，不是 widget 數）"""
+        with self._lock:
+            e = self._entries.get(session_id)
+            if e is not None:
+                e.measured, e.bytes, e.state_keys = now, nbytes, nkeys
+
+    def idle(self, now: float) -> list[str]:
+        if self.ttl_s <= 0:
+            return []
+        with self._lock:
+            return [sid for sid, e in self._entries.items() if now - e.last_seen > self.ttl_s]
+
+    def forget(self, session_id: str, *, evicted: bool):
+        with self._lock:
+            e = self._entries.pop(session_id, None)
+            if e is None:
+                return
+            if evicted:
+                self.evicted += 1
+                self.evicted_bytes += e.bytes
+            else:
+                self.closed += 1
+
+    def session_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def totals(self, now: float | None = None) -> dict:
+        """目前登錄中的 session 總量；runs 是這些 session 至今的 rerun 次數（含定時更新的 fragment）"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entries = list(self._entries.values())
+            evicted, evicted_bytes, closed = self.evicted, self.evicted_bytes, self.closed
+        sizes = [e.bytes for e in entries]
+        return {
+            "sessions":      len(entries),
+            "idle_5m":       sum(1 for e in entries if now - e.last_seen > 300),
+            "bytes":         sum(sizes),
+            "avg_bytes":     round(sum(sizes) / len(sizes)) if sizes else 0,
+            "max_bytes":     max(sizes, default=0),
+            "state_keys":    sum(e.state_keys for e in entries),
+            "runs":          sum(e.runs for e in entries),
+            "evicted":       evicted,
+            "evicted_bytes": evicted_bytes,
+            "closed":        closed,
+            "ttl_s":         self.ttl_s,
+        }
+
+    # ── 回收 ──
+    def sweep(self, now: float | None = None):
+        now = time.time() if now is None else now
+        if not Runtime.exists():
+            return
+        runtime = Runtime.instance()
+        for sid in self.session_ids():
+            if not runtime.is_active_session(sid):
+                self.forget(sid, evicted=False)
+        idle = self.idle(now)
+        if not idle or not supported("evict"):     # 版本對不上內部結構時只記錄、不回收
+            return
+        # close_session 只能在 Streamlit 的 event loop 執行緒上呼叫
+        loop = runtime._get_async_objs().eventloop
+        for sid in idle:
+            asyncio.run_coroutine_threadsafe(_close(runtime, sid), loop)
+            self.forget(sid, evicted=True)
+        _LOGGER.info("回收 %d 個閒置 session", len(idle))
+
+    def _run(self):
+        while True:
+            time.sleep(SWEEP_S)
+            try:
+                self.sweep()
+            except Exception:
+                _LOGGER.exception("閒置 session 回收失敗")
+
+
+async def _close(runtime: Runtime, session_id: str):
+    """關掉 session，再關掉它的 websocket：分頁回來時前端會自動重連成新 session，
+    （有外部 store 時）憑 ?s= 接續遊戲，而不是停在一個已經沒有後端的畫面"""
+    info = runtime._session_mgr.get_active_session_info(session_id)
+    runtime.close_session(session_id)
+    if info is None:
+        return
+    ws = getattr(info.client, "_websocket", info.client)
+    close = getattr(ws, "close", None)
+    if close is None:
+        return
+    try:
+        res = close(code=1001)      # 1001 = Going Away
+        if inspect.isawaitable(res):
+            await res
+    except Exception:
+        _LOGGER.debug("關閉閒置 session 的 websocket 失敗", exc_info=True)
+
+
+@st.cache_resource
+def get_session_registry() -> SessionRegistry:
+    reg = SessionRegistry()
+    threading.Thread(target=reg._run, name="session-sweeper", daemon=True).start()
+    return reg
+
+
+def track_session():
+    """每次 rerun 呼叫（含定時更新的 fragment）：更新最後活動時間，
+    每 MEASURE_EVERY_S 秒估一次 session_state 大小"""
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return
+    now = time.time()
+    reg = get_session_registry()
+    if reg.seen(ctx.session_id, now):
+        state = st.session_state.to_dict()
+        reg.measured(ctx.session_id, now, approx_size(state), len(state))
+
+
+def format_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def totals_caption() -> str:
+    t = get_session_registry().totals()
+    return (
+        f"伺服器：{t['sessions']} 個 session（閒置 5 分鐘以上 {t['idle_5m']}），"
+        f"狀態約 {format_bytes(t['bytes'])}，平均 {format_bytes(t['avg_bytes'])}／人；"
+        f"rerun {t['runs']} 次；"
+        f"已回收 {t['evicted']} 個"
+    )
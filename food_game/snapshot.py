@@ -0,0 +1,247 @@
+# ══════════════════════════════════════════════
+# 畫面快照回歸：渲染重構（批次 HTML、fragment、元件化…）不能讓小朋友看到的畫面偷偷變了
+# 用 AppTest 把幾個代表性的盤面直接塞進 session_state 渲染，記下元素樹與所有 HTML：
+#   empty   ：剛開局，手牌全滿
+#   mid     ：三分之一已批改鎖定、另有幾張剛放還可退回、手牌選了兩張
+#   wrong   ：全部放錯、批改後出現一鍵退回
+#   win     ：全對過關，特殊卡同時放在兩個類別
+# 快照存在 food_game/snapshots/<目標>/<盤面>.json（元素樹）與 .html（依序串起來的 HTML），
+# 跟原始碼一起進版控；同時量每個盤面的渲染時間，改寫前後可以對照「一樣的畫面、快了多少」
+#   python -m food_game.snapshot                 ← 與快照比對，有差異時印出 diff、結束碼為 1
+#   python -m food_game.snapshot --update        ← 畫面是刻意改的：重新錄製
+#   python -m food_game.snapshot --runs 20 --json render.json
+#   python -m food_game.snapshot --compare render.json   ← 和之前的渲染時間對照
+#   pytest tests/test_snapshot.py                        ← 同樣的比對，跟著其他測試一起跑
+# widget id 的雜湊只留使用者 key（雜湊隨參數變，畫面不一定變）；元件參數解成 JSON 方便看 diff
+# ══════════════════════════════════════════════
+import os
+import re
+import statistics
+import sys
+import time
+
+ROOT          = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+SCENES        = ("empty", "mid", "wrong", "win")
+RUNS          = 10      # 每個盤面量幾次渲染（取中位數）
+DIFF_LINES    = 40      # 每個檔案最多印幾行 diff
+
+# 目標：（名稱, 腳本, 網址參數）；with_eggs 的兩種手牌模式都要錄，渲染路徑完全不同
+TARGETS = (
+    ("with_eggs",         "food_game_with_eggs.py", {}),
+    ("with_eggs-buttons", "food_game_with_eggs.py", {"hand": "buttons"}),
+    ("v8",                "food_game_v8.py",        {}),
+)
+
+# 剖析、計量與開關覆寫都會改畫面（面板本身會進快照），錄製與比對時一律拿掉
+QUIET_ENV = ("FOOD_GAME_PROFILE", "FOOD_GAME_PAYLOAD", "FOOD_GAME_MEMPROF", "FOOD_GAME_FLAGS", "FOOD_GAME_DEV")
+
+_ID_RE = re.compile(r"^\$\$ID-[0-9a-f]+-")
+
+
+# ─────────────── 盤面 ───────────────
+def _load(script: str) -> tuple[dict, tuple, list[str]]:
+    """該版本預設牌組：（卡片規則, 類別, 未洗牌的牌組順序）"""
+    from food_game.catalog import get_catalog
+    from food_game.loadtest import _variant
+
+    variant = _variant(script)
+    catalog = get_catalog(variant.deck, variant.exclude)
+    return catalog.cards, catalog.categories, list(catalog.deck)
+
+
+def build_scene(scene: str, cards: dict, categories: tuple, deck: list[str]) -> tuple[dict, list[str]]:
+    """回傳（要寫進 session_state 的遊戲狀態, 手牌中選取的卡）；牌組固定用目錄順序，不洗牌"""
+    placed = {c: [] for c in categories}
+    result, scored, selected = {}, set(), []
+    state = {
+        "started_at": 0.0, "score": 0, "submit_count": 0, "locked": False,
+        "message": "", "message_type": "info", "return_wrong_avail": None,
+        "show_egg": False, "egg_submit_count": 0, "show_win_egg": False,
+        "hand_page": 0, "hand_filter": None, "dnd_ack": None, "round_id": "00000000",
+    }
+
+    def put(name: str, cat: str, judge: str | None):
+        placed[cat].append(name)
+        if judge:
+            result[f"{name}|{cat}"] = judge
+            if judge == "correct":
+                scored.add(f"{name}|{cat}")
+
+    if scene == "mid":
+        third = len(deck) // 3
+        for name in deck[:third]:
+            for cat in (cards[name]["valid"] if cards[name]["special"] else cards[name]["valid"][:1]):
+                put(name, cat, "correct")
+        for name in deck[third:third + 4]:
+            put(name, cards[name]["valid"][0], None)
+        selected = deck[third + 4:third + 6]
+        state.update(submit_count=1, score=25,
+                     message=f"批改完成：✅ 答對 {len(scored)} 題　❌ 答錯 0 題　＋25 分", message_type="info")
+    elif scene == "wrong":
+        for name in deck:
+            put(name, next(c for c in categories if c not in cards[name]["valid"]), "wrong")
+        state.update(submit_count=1, return_wrong_avail=True, message_type="warning",
+                     message=f"批改完成：✅ 答對 0 題　❌ 答錯 {len(result)} 題　＋0 分")
+    elif scene == "win":
+        for name in deck:
+            for cat in (cards[name]["valid"] if cards[name]["special"] else cards[name]["valid"][:1]):
+                put(name, cat, "correct")
+        state.update(submit_count=1, score=50, locked=True, message_type="success",
+                     message="🎉 完美全對！本次獲得 50 分，總分 50 分！")
+    state.update(placed=placed, result=result, scored_keys=scored, selected=set(selected), deck=deck)
+    return state, selected
+
+
+# ─────────────── 元素樹與 HTML ───────────────
+def _node(node) -> dict:
+    """AppTest 的節點整理成穩定的 dict：型別、proto 內容、子節點"""
+    import json
+
+    from google.protobuf.json_format import MessageToDict
+
+    out = {"type": type(node).__name__}
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        props = MessageToDict(proto)
+        if isinstance(props.get("id"), str):
+            props["id"] = _ID_RE.sub("", props["id"])
+        if isinstance(props.get("jsonArgs"), str):
+            props["jsonArgs"] = json.loads(props["jsonArgs"])
+        out["props"] = props
+    children = getattr(node, "children", None)
+    if children:
+        out["children"] = [_node(c) for _, c in sorted(children.items())]
+    return out
+
+
+def _html(tree: dict, path: str = "") -> list[str]:
+    """依畫面順序串起所有 markdown／html 內容，每段前面標上在樹裡的位置"""
+    parts = []
+    for i, child in enumerate(tree.get("children", [])):
+        where = f"{path}/{i}"
+        body = child.get("props", {}).get("body")
+        if child["type"] in ("Markdown", "Html") and body is not None:
+            parts.append(f"<!-- {where} {child['type']} -->\n{body}\n")
+        parts += _html(child, where)
+    return parts
+
+
+def render(script: str, query: dict, scene: str, runs: int) -> tuple[dict, str, list[float]]:
+    """渲染一個盤面：回傳（元素樹, HTML, 每次渲染的毫秒）"""
+    from streamlit.testing.v1 import AppTest
+
+    cards, categories, deck = _load(script)
+    state, selected = build_scene(scene, cards, categories, deck)
+    at = AppTest.from_file(script, default_timeout=60)
+    at.query_params.update(query)
+    at.run()        # 第一次讓引擎初始化（租戶、引擎代號等），之後整個盤面換成固定的
+    for key, value in state.items():
+        if key in at.session_state:
+            at.session_state[key] = value
+    if selected and "selected" not in at.session_state:
+        at.query_params["sel"] = "|||".join(sorted(selected))      # v8 的選取放在網址
+    times = []
+    for _ in range(max(1, runs)):
+        t = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t) * 1000)
+        if at.exception:
+            raise RuntimeError(f"{os.path.basename(script)}／{scene} 執行失敗：{at.exception[0].message}")
+    tree = _node(at._tree)
+    return tree, "".join(_html(tree)), times
+
+
+# ─────────────── 比對 ───────────────
+def _paths(target: str, scene: str) -> tuple[str, str]:
+    base = os.path.join(SNAPSHOT_DIR, target, scene)
+    return base + ".json", base + ".html"
+
+
+def _diff(path: str, new: str) -> list[str]:
+    import difflib
+
+    if not os.path.exists(path):
+        return [f"（沒有快照：{os.path.relpath(path, ROOT)}，先用 --update 錄製）"]
+    with open(path, encoding="utf-8") as f:
+        old = f.read()
+    if old == new:
+        return []
+    lines = list(difflib.unified_diff(old.splitlines(), new.splitlines(),
+                                      os.path.relpath(path, ROOT), "目前的畫面", lineterm="", n=2))
+    return lines[:DIFF_LINES] + ([f"…（還有 {len(lines) - DIFF_LINES} 行）"] if len(lines) > DIFF_LINES else [])
+
+
+def check(target: str, scene: str, tree: dict, html: str, update: bool) -> list[str]:
+    """與快照比對；update 時直接覆寫。回傳 diff（沒有差異時是空的）"""
+    import json
+
+    tree_path, html_path = _paths(target, scene)
+    files = ((tree_path, json.dumps(tree, ensure_ascii=False, indent=1) + "\n"), (html_path, html))
+    if update:
+        os.makedirs(os.path.dirname(tree_path), exist_ok=True)
+        for path, text in files:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return []
+    return [line for path, text in files for line in _diff(path, text)]
+
+
+def main(argv: list[str] | None = None):
+    import argparse
+    import json
+    import tempfile
+
+    ap = argparse.ArgumentParser(description="代表性盤面的畫面快照比對與渲染時間")
+    ap.add_argument("--target", action="append", choices=[t[0] for t in TARGETS],
+                    help="只跑這個目標，可重複；預設全部")
+    ap.add_argument("--scene", action="append", choices=SCENES, help="只跑這個盤面，可重複；預設全部")
+    ap.add_argument("--update", action="store_true", help="重新錄製快照（畫面是刻意改的）")
+    ap.add_argument("--runs", type=int, default=RUNS, help="每個盤面量幾次渲染")
+    ap.add_argument("--json", help="把渲染時間另存成 JSON")
+    ap.add_argument("--compare", help="和之前的渲染時間 JSON 對照")
+    args = ap.parse_args(argv)
+
+    # 排行榜寫到暫存目錄，過關盤面看到的是空榜
+    for env in QUIET_ENV:
+        os.environ.pop(env, None)
+    os.environ["FOOD_GAME_DB"] = os.path.join(tempfile.mkdtemp(prefix="fg-snapshot-"), "lb.db")
+    os.environ.update({"FOOD_GAME_STATE": "off", "FOOD_GAME_ANALYTICS": "0"})
+
+    before = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            before = json.load(f).get("results", {})
+
+    results, changed = {}, []
+    print(f"{'目標':<20}{'盤面':<8}{'中位數 ms':>10}{'最快 ms':>10}{'之前 ms':>10}  快照")
+    for target, script, query in TARGETS:
+        if args.target and target not in args.target:
+            continue
+        for scene in args.scene or SCENES:
+            tree, html, times = render(os.path.join(ROOT, script), query, scene, args.runs)
+            diff = check(target, scene, tree, html, args.update)
+            med = round(statistics.median(times), 2)
+            results.setdefault(target, {})[scene] = {"median_ms": med, "min_ms": round(min(times), 2),
+                                                     "html_bytes": len(html.encode())}
+            old = before.get(target, {}).get(scene, {}).get("median_ms")
+            status = "已更新" if args.update else ("✗ 不同" if diff else "✓")
+            print(f"{target:<20}{scene:<8}{med:>10.1f}{min(times):>10.1f}"
+                  f"{old if old is not None else '-':>10}  {status}")
+            if diff:
+                changed.append((target, scene, diff))
+
+    for target, scene, diff in changed:
+        print(f"\n── {target}／{scene} ──")
+        print("\n".join(diff))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "runs": args.runs, "results": results},
+                      f, ensure_ascii=False, indent=2)
+    if changed:
+        print(f"\n{len(changed)} 個盤面和快照不同；確定是刻意的改動就加 --update 重新錄製", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
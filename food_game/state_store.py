@@ -0,0 +1,454 @@
+# ══════════════════════════════════════════════
+# 外部遊戲狀態：把 session_state 裡的遊戲資料依 session token（網址 ?s=）
+# 存到可替換的 store，讓多個 Streamlit 行程可以放在負載平衡後面、重啟也不掉局
+#   FOOD_GAME_STATE        = disk:目錄（預設 disk:checkpoints）| memory | sqlite:路徑
+#                            | redis://主機:埠/庫號 | off
+#   FOOD_GAME_STATE_WRITE  = through（每次 rerun 結束同步寫）| behind（背景合併寫，disk 預設）
+# 還原後換新 token：同一個網址開在兩個分頁、或傳給同學，各自得到一份盤面，不會互相覆寫
+# 本機測試 Redis 協定可用 python -m food_game.resp_server 起一個替身
+# ══════════════════════════════════════════════
+import atexit
+import json
+import logging
+import os
+import re
+import secrets
+import socket
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+import streamlit as st
+
+STATE_ENV      = "FOOD_GAME_STATE"
+DEFAULT_STATE  = "disk:checkpoints"
+WRITE_ENV      = "FOOD_GAME_STATE_WRITE"
+STATE_TTL_S    = 24 * 3600     # 一個上課日，隔天自然失效
+WRITE_BEHIND_S = 1.0           # behind 模式的合併寫入間隔
+ZIP_MIN_BYTES  = 512           # 小於此長度不壓縮
+TOKEN_PARAM    = "s"
+KEY_PREFIX     = "fg:state:"
+COMPACT_BYTES  = 32 * 1024     # 單一檢查點檔超過就改寫成只剩最後一筆
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_-]{8,64}")   # token 來自網址，也是檔名，只收安全字元
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# ─────────────── 序列化：緊湊 JSON，set 以 {"$s": [...]} 標記，較大時 zlib ───────────────
+def _default(obj):
+    if isinstance(obj, (set, frozenset)):
+        return {"$s": sorted(obj)}
+    raise TypeError(f"無法序列化 {type(obj).__name__}")
+
+
+def _hook(d: dict):
+    if len(d) == 1 and "$s" in d:
+        return set(d["$s"])
+    return d
+
+
+def encode_state(state: dict) -> bytes:
+    raw = json.dumps(state, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+    if len(raw) >= ZIP_MIN_BYTES:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def decode_state(data: bytes) -> dict:
+    tag, body = data[:1], data[1:]
+    if tag == b"z":
+        body = zlib.decompress(body)
+    elif tag != b"j":
+        raise ValueError("未知的狀態格式")
+    return json.loads(body, object_hook=_hook)
+
+
+# ─────────────── Store 實作：get / put / delete ───────────────
+class MemoryStore:
+    """單一行程內共用；主要給開發與測試"""
+
+    def __init__(self, ttl_s: float = STATE_TTL_S):
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._data: dict[str, tuple[float, bytes]] = {}
+
+    def get(self, token: str) -> bytes | None:
+        with self._lock:
+            hit = self._data.get(token)
+            if hit is None:
+                return None
+            if hit[0] < time.time():
+                del self._data[token]
+                return None
+            return hit[1]
+
+    def put(self, token: str, data: bytes):
+        with self._lock:
+            self._data[token] = (time.time() + self.ttl_s, data)
+
+    def delete(self, token: str):
+        with self._lock:
+            self._data.pop(token, None)
+
+
+class SQLiteStore:
+    """同一台機器上的多個行程共用一個檔案；WAL 讓讀寫互不阻塞"""
+
+    def __init__(self, path: str, ttl_s: float = STATE_TTL_S):
+        self.path  = path
+        self.ttl_s = ttl_s
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS game_state ("
+                "token TEXT PRIMARY KEY, data BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            conn.execute("DELETE FROM game_state WHERE expires < ?", (time.time(),))
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, token: str) -> bytes | None:
+        row = self._conn().execute(
+            "SELECT data FROM game_state WHERE token = ? AND expires >= ?", (token, time.time())
+        ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def put(self, token: str, data: bytes):
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO game_state (token, data, expires) VALUES (?, ?, ?)",
+                (token, data, time.time() + self.ttl_s),
+            )
+
+    def delete(self, token: str):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM game_state WHERE token = ?", (token,))
+
+
+class DiskStore:
+    """每個 token 一個只追加的檢查點檔（目錄依 token 前兩碼分桶）：
+    每筆 = [長度 u32][crc32 u32][狀態]；還原時整檔讀一次、取最後一筆完整且校驗正確的，
+    寫到一半被中斷的尾巴自然略過。啟動時不掃描目錄，過期檔由背景執行緒慢慢清"""
+
+    _HEAD = struct.Struct("<II")
+
+    def __init__(self, directory: str, ttl_s: float = STATE_TTL_S):
+        self.directory = directory
+        self.ttl_s = ttl_s
+        os.makedirs(directory, exist_ok=True)
+        threading.Thread(target=self._sweep, name="checkpoint-sweeper", daemon=True).start()
+
+    def _path(self, token: str) -> str:
+        return os.path.join(self.directory, token[:2], f"{token}.ckpt")
+
+    def get(self, token: str) -> bytes | None:
+        path = self._path(token)
+        try:
+            with open(path, "rb") as f:
+                if time.time() - os.fstat(f.fileno()).st_mtime > self.ttl_s:
+                    return None
+                buf = f.read()
+        except FileNotFoundError:
+            return None
+        last, pos = None, 0
+        while pos + self._HEAD.size <= len(buf):
+            n, crc = self._HEAD.unpack_from(buf, pos)
+            body = buf[pos + self._HEAD.size:pos + self._HEAD.size + n]
+            if len(body) < n or zlib.crc32(body) != crc:
+                break
+            last = body
+            pos += self._HEAD.size + n
+        return last
+
+    def put(self, token: str, data: bytes):
+        path = self._path(token)
+        frame = self._HEAD.pack(len(data), zlib.crc32(data)) + data
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            size = 0
+        if size + len(frame) > COMPACT_BYTES:
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(frame)
+            os.replace(tmp, path)
+            return
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, frame)         # 單次 write，行程中途被砍也不會寫出半筆以外的東西
+        finally:
+            os.close(fd)
+
+    def delete(self, token: str):
+        try:
+            os.remove(self._path(token))
+        except FileNotFoundError:
+            pass
+
+    def _sweep(self):
+        time.sleep(60)
+        while True:
+            cutoff = time.time() - self.ttl_s
+            try:
+                for bucket in os.scandir(self.directory):
+                    if not bucket.is_dir():
+                        continue
+                    for entry in os.scandir(bucket.path):
+                        if entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+            except OSError:
+                _LOGGER.exception("清理過期檢查點失敗")
+            time.sleep(3600)
+
+
+class RespError(Exception):
+    pass
+
+
+class RedisStore:
+    """最小 RESP 用戶端（GET / SET EX / DEL），不需要額外套件；單一連線加鎖，斷線自動重連"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0,
+                 ttl_s: float = STATE_TTL_S, timeout: float = 2.0):
+        self.addr    = (host, port)
+        self.db      = db
+        self.ttl_s   = int(ttl_s)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: socket.socket | None = None
+        self._buf  = b""
+
+    # ── 協定 ──
+    def _connect(self):
+        self._sock = socket.create_connection(self.addr, timeout=self.timeout)
+        self._buf  = b""
+        if self.db:
+            self._send("SELECT", str(self.db))
+            self._read()
+
+    def _send(self, *args: str | bytes):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for a in args:
+            b = a if isinstance(a, bytes) else a.encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(b), b))
+        self._sock.sendall(b"".join(parts))
+
+    def _readline(self) -> bytes:
+        while b"\r\n" not in self._buf:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("連線中斷")
+            self._buf += chunk
+        line, self._buf = self._buf.split(b"\r\n", 1)
+        return line
+
+    def _read(self):
+        line = self._readline()
+        kind, rest = line[:1], line[1:]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RespError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            while len(self._buf) < n + 2:
+                chunk = self._sock.recv(65536)
+                if not chunk:
+                    raise ConnectionError("連線中斷")
+                self._buf += chunk
+            data, self._buf = self._buf[:n], self._buf[n + 2:]
+            return data
+        if kind == b"*":
+            return [self._read() for _ in range(int(rest))]
+        raise RespError(f"無法解析的回應：{line[:40]!r}")
+
+    def command(self, *args: str | bytes):
+        with self._lock:
+            for attempt in (0, 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._send(*args)
+                    return self._read()
+                except (OSError, ConnectionError):
+                    if self._sock is not None:
+                        self._sock.close()
+                    self._sock = None
+                    if attempt:
+                        raise
+
+    # ── store 介面 ──
+    def get(self, token: str) -> bytes | None:
+        return self.command("GET", KEY_PREFIX + token)
+
+    def put(self, token: str, data: bytes):
+        self.command("SET", KEY_PREFIX + token, data, "EX", str(self.ttl_s))
+
+    def delete(self, token: str):
+        self.command("DEL", KEY_PREFIX + token)
+
+
+class WriteBehind:
+    """包住任一 store：put 只記下最新值，背景執行緒每 WRITE_BEHIND_S 秒合併寫出；
+    同一 token 連續多次 rerun 只寫最後一次"""
+
+    def __init__(self, inner, interval_s: float = WRITE_BEHIND_S):
+        self.inner = inner
+        self.interval_s = interval_s
+        self._lock = threading.Lock()
+        self._pending: dict[str, bytes | None] = {}    # None＝待刪除
+        threading.Thread(target=self._run, name="state-write-behind", daemon=True).start()
+        atexit.register(self.flush)
+
+    def get(self, token: str) -> bytes | None:
+        with self._lock:
+            if token in self._pending:
+                return self._pending[token]
+        return self.inner.get(token)
+
+    def put(self, token: str, data: bytes):
+        with self._lock:
+            self._pending[token] = data
+
+    def delete(self, token: str):
+        with self._lock:
+            self._pending[token] = None
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        for token, data in batch.items():
+            try:
+                if data is None:
+                    self.inner.delete(token)
+                else:
+                    self.inner.put(token, data)
+            except Exception:
+                _LOGGER.exception("遊戲狀態寫入失敗：%s", token)
+                with self._lock:
+                    self._pending.setdefault(token, data)
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval_s)
+            self.flush()
+
+
+def open_store(url: str):
+    """依設定字串建立 store；空字串或 off 回傳 None（功能關閉）"""
+    if not url or url == "off":
+        return None
+    if url.startswith("disk:"):
+        return DiskStore(url[len("disk:"):] or "checkpoints")
+    if url == "memory":
+        return MemoryStore()
+    if url.startswith("sqlite:"):
+        path = url[len("sqlite:"):]
+        return SQLiteStore(path[2:] if path.startswith("//") else path)
+    if url.startswith("redis://"):
+        u = urlparse(url)
+        return RedisStore(u.hostname or "127.0.0.1", u.port or 6379, int((u.path or "/0")[1:] or 0))
+    raise ValueError(f"不支援的 {STATE_ENV}：{url}")
+
+
+@st.cache_resource
+def get_state_store():
+    store = open_store(os.environ.get(STATE_ENV, DEFAULT_STATE))
+    mode = os.environ.get(WRITE_ENV, "behind" if isinstance(store, DiskStore) else "through")
+    if store is not None and mode == "behind":
+        store = WriteBehind(store)
+    return store
+
+
+# ─────────────── 與 session_state 對接 ───────────────
+def _url_token() -> str | None:
+    token = st.query_params.get(TOKEN_PARAM)
+    return token if token and _TOKEN_RE.fullmatch(token) else None
+
+
+def restore_state(keys: tuple[str, ...]) -> bool:
+    """新 session 第一次執行時呼叫：網址帶 ?s= 且 store 裡有資料就還原，回傳是否成功；
+    資料損毀、截斷或是舊版格式時記 log、丟掉這個 token，回傳 False 讓引擎開新局。
+    還原後一律換一個新 token、把盤面複製過去：網址被複製到別的分頁或別人手上時，
+    每個 session 各玩各的一份，不會輪流覆寫同一盤"""
+    store = get_state_store()
+    token = _url_token()
+    if store is None or not token:
+        return False
+    try:
+        data = store.get(token)
+    except Exception:
+        _LOGGER.exception("遊戲狀態讀取失敗：%s", token)
+        return False
+    if data is None:
+        return False
+    try:
+        state = decode_state(data)
+        # 少了任何一個欄位＝舊版格式（之後才加的欄位），不能只還原一半
+        if not isinstance(state, dict) or not set(keys) <= state.keys():
+            raise ValueError("狀態欄位不符（舊版格式？）")
+    except Exception:
+        _LOGGER.warning("遊戲狀態無法還原，改開新局：%s", token, exc_info=True)
+        forget_state()
+        return False
+    st.session_state.update({k: v for k, v in state.items() if k in keys})
+    fresh, sig = secrets.token_urlsafe(9), zlib.crc32(data)
+    try:
+        store.put(fresh, data)
+    except Exception:
+        _LOGGER.exception("遊戲狀態寫入失敗：%s", fresh)
+        sig = None      # 這次 rerun 結束時 save_state 會再寫一次
+    st.query_params[TOKEN_PARAM]     = fresh
+    st.session_state["_state_token"] = fresh
+    st.session_state["_state_sig"]   = sig
+    return True
+
+
+def save_state(keys: tuple[str, ...]):
+    """每次 rerun 結束呼叫：內容有變才寫（write-through 或交給 WriteBehind）"""
+    store = get_state_store()
+    if store is None:
+        return
+    ss = st.session_state
+    token = ss.get("_state_token") or _url_token() or secrets.token_urlsafe(9)
+    if st.query_params.get(TOKEN_PARAM) != token:
+        st.query_params[TOKEN_PARAM] = token
+    data = encode_state({k: ss[k] for k in keys if k in ss})
+    sig  = zlib.crc32(data)
+    if ss.get("_state_token") == token and ss.get("_state_sig") == sig:
+        return
+    try:
+        store.put(token, data)
+    except Exception:
+        _LOGGER.exception("遊戲狀態寫入失敗：%s", token)
+        return
+    ss["_state_token"] = token
+    ss["_state_sig"]   = sig
+
+
+def forget_state():
+    """重新開始：刪掉這一局的外部狀態並換新 token"""
+    store = get_state_store()
+    token = st.session_state.get("_state_token") or _url_token()
+    if store is not None and token:
+        try:
+            store.delete(token)
+        except Exception:
+            _LOGGER.exception("遊戲狀態刪除失敗：%s", token)
+    st.query_params.pop(TOKEN_PARAM, None)
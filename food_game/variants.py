@@ -0,0 +1,122 @@
+# ══════════════════════════════════════════════
+# 版本登錄：歷來每一支遊戲腳本都只是「哪副牌＋哪些功能＋哪個引擎」的組合，
+# 根目錄的舊檔名只剩三行啟動器（run("版本")），遊戲本體只有兩份引擎：
+#   with_eggs：手牌在 Python 端（逐張按鈕或拖放元件）
+#   v8       ：手牌在 iframe 元件、選取存在網址參數
+# 版本只決定功能開關的預設值；租戶、環境變數與網址 ?ff= 可以再覆寫（food_game/flags.py），
+# 手牌開關 iframe_hand 決定實際跑哪個引擎。引擎原始碼每個行程只編譯一次，要用到時才載入
+#   streamlit run "food_game 7.py"         ← 舊網址照常可用
+#   python -m food_game.variants            ← 列出所有版本
+# ══════════════════════════════════════════════
+import functools
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from food_game.catalog import DECK_SPECS, current_tenant
+from food_game.flags import current_flags, variant_defaults
+
+ENGINE_DIR = os.path.join(os.path.dirname(__file__), "engines")
+ENGINES    = ("with_eggs", "v8")
+
+
+class Variant:
+    """一個歷史版本：牌組（基本牌組＋排除的卡）、引擎與功能開關的預設值"""
+    __slots__ = ("name", "file", "engine", "deck", "exclude", "hand", "eggs", "win_egg", "phonetic",
+                 "hand_filter")
+
+    def __init__(self, name: str, file: str, *, engine: str = "with_eggs", deck: str = "with_eggs",
+                 exclude: tuple[str, ...] = (), hand: str = "buttons", eggs: bool = False,
+                 win_egg: bool = False, phonetic: bool = False, hand_filter: bool = False):
+        assert engine in ENGINES and deck in DECK_SPECS, (engine, deck)
+        self.name = name
+        self.file = file
+        self.engine = engine
+        self.deck = deck
+        self.exclude = frozenset(exclude)
+        self.hand = hand            # with_eggs 引擎的預設手牌模式："buttons" 或 "dnd"
+        self.eggs = eggs            # 第 2、3、4 次提交的彩蛋
+        self.win_egg = win_egg      # 全對通關彩蛋
+        self.phonetic = phonetic    # 卡名改用注音圖
+        self.hand_filter = hand_filter  # 逐張按鈕手牌的類別篩選
+
+
+_EGGS = {"eggs": True, "win_egg": True}
+_SHORT = ("培根", "炸雞", "雞排", "糖葫蘆", "★藍莓起司蛋糕")   # 較短的牌組少了這五張
+
+VARIANTS = MappingProxyType({v.name: v for v in (
+    # 目前維護中的兩個版本（排行榜／統計沿用原本的代號）
+    Variant("with_eggs",   "food_game_with_eggs.py", hand="dnd", eggs=True),
+    Variant("v8",          "food_game_v8.py", engine="v8", deck="v8", **_EGGS),
+    # 歷史版本
+    Variant("v1_0",        "food_game_1.0.py", deck="v1"),
+    Variant("game_2",      "food_game 2.py", deck="classic", exclude=("★涼拌豆腐", "★滷肉飯")),
+    *(Variant(f"game_{n}", f"food_game {n}.py", deck="classic") for n in (3, 4, 5, 7, 8, 9, 10)),
+    Variant("game_11",     "food_game 11.py"),
+    *(Variant(f"with_eggs_{n}", f"food_game_with_eggs({n}).py", **_EGGS) for n in (1, 2, 3, 5)),
+    # (4) 是 iframe 手牌但選取不經網址；兩者都由 v8 引擎承接
+    *(Variant(f"with_eggs_{n}", f"food_game_with_eggs({n}).py", engine="v8", **_EGGS) for n in (4, 6)),
+    Variant("with_eggs_7", "food_game_with_eggs(7).py", engine="v8", exclude=_SHORT, **_EGGS),
+    Variant("v8_1",        "food_game_v8(1).py", engine="v8", deck="v8", phonetic=True, **_EGGS),
+    Variant("v8_2",        "food_game_v8(2).py", engine="v8", deck="v8", phonetic=True,
+            exclude=_SHORT, **_EGGS),
+)})
+
+_BY_FILE = MappingProxyType({v.file: v for v in VARIANTS.values()})
+
+
+def variant_for_script(path: str) -> Variant | None:
+    return _BY_FILE.get(os.path.basename(path))
+
+
+# ══════════════════════════════════════════════
+# 執行：啟動器呼叫 run()，引擎用 current_variant() 取得目前的版本
+# ══════════════════════════════════════════════
+_local = threading.local()
+
+
+def current_variant(default: str) -> Variant:
+    """由啟動器執行時回傳指定的版本；直接 streamlit run 引擎檔時用 default"""
+    return getattr(_local, "variant", None) or VARIANTS[default]
+
+
+def script_started() -> float | None:
+    """啟動器開始這次 rerun 的 perf_counter（剖析用：算出引擎頂層之前花了多久）"""
+    return getattr(_local, "t_start", None)
+
+
+def _engine_path(engine: str) -> str:
+    return os.path.join(ENGINE_DIR, f"{engine}.py")
+
+
+@functools.lru_cache(maxsize=8)
+def _engine_code(path: str, mtime: float):
+    """引擎原始碼依修改時間快取編譯結果：整個行程、所有版本共用"""
+    with open(path, encoding="utf-8") as f:
+        return compile(f.read(), path, "exec")
+
+
+def run(name: str):
+    _local.t_start = time.perf_counter()
+    variant = VARIANTS[name]
+    flags = current_flags(variant, current_tenant(variant.deck, variant.exclude))
+    path = _engine_path(flags.engine)
+    code = _engine_code(path, os.stat(path).st_mtime)
+    _local.variant = variant
+    try:
+        exec(code, {"__name__": "__main__", "__file__": path})
+    finally:
+        _local.variant = _local.t_start = None
+
+
+def main():
+    print(f"{'版本':<14}{'檔案':<28}{'引擎':<11}{'牌組':<11}{'張數':>4}  預設開啟的功能")
+    for v in VARIANTS.values():
+        n = len(DECK_SPECS[v.deck][1]) - len(v.exclude)
+        feats = [f for f, on in variant_defaults(v).items() if on]
+        print(f"{v.name:<14}{v.file:<28}{v.engine:<11}{v.deck:<11}{n:>4}  {' '.join(feats)}")
+
+
+if __name__ == "__main__":
+    main()
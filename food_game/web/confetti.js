@@ -0,0 +1,85 @@
+// ══════════════════════════════════════════════
+// 彩帶特效：一張全螢幕 canvas + requestAnimationFrame，
+// 播完即移除；Streamlit 版與 HTML 版共用同一份
+// ══════════════════════════════════════════════
+(function (global){
+  const COLORS   = ["#FF6B6B", "#51CF66", "#FF922B", "#CC5DE8", "#4DABF7", "#FDE68A"];
+  const GRAVITY  = 900;    // px/s²
+  const MAX_MS   = 4500;
+
+  function launch(doc, count){
+    doc = doc || document;
+    count = count || 80;
+    const win = doc.defaultView;
+    const canvas = doc.createElement("canvas");
+    canvas.style.cssText = "position:fixed;inset:0;width:100%;height:100%;pointer-events:none;z-index:99999;";
+    doc.body.appendChild(canvas);
+    const ctx = canvas.getContext("2d");
+
+    let w = 0, h = 0;
+    function resize(){
+      const dpr = win.devicePixelRatio || 1;
+      w = win.innerWidth; h = win.innerHeight;
+      canvas.width = w * dpr; canvas.height = h * dpr;
+      ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    }
+    resize();
+    win.addEventListener("resize", resize);
+
+    const parts = [];
+    for (let i = 0; i < count; i++){
+      parts.push({
+        x: Math.random() * w,
+        y: -20 - Math.random() * h * 0.3,
+        vx: (Math.random() - 0.5) * 160,
+        vy: 60 + Math.random() * 180,
+        size: 6 + Math.random() * 8,
+        rot: Math.random() * Math.PI,
+        vr: (Math.random() - 0.5) * 10,
+        delay: Math.random() * 0.5,
+        color: COLORS[Math.floor(Math.random() * COLORS.length)],
+        round: Math.random() > 0.5,
+      });
+    }
+
+    const start = win.performance.now();
+    let last = start;
+    function frame(now){
+      const dt = Math.min((now - last) / 1000, 0.05);
+      const t  = (now - start) / 1000;
+      last = now;
+      ctx.clearRect(0, 0, w, h);
+      let alive = 0;
+      for (const p of parts){
+        if (t < p.delay) { alive++; continue; }
+        p.vy  += GRAVITY * 0.25 * dt;
+        p.x   += (p.vx + Math.sin(t * 3 + p.rot) * 40) * dt;
+        p.y   += p.vy * dt;
+        p.rot += p.vr * dt;
+        if (p.y > h + 20) continue;
+        alive++;
+        ctx.save();
+        ctx.translate(p.x, p.y);
+        ctx.rotate(p.rot);
+        ctx.fillStyle = p.color;
+        if (p.round){
+          ctx.beginPath();
+          ctx.arc(0, 0, p.size / 2, 0, Math.PI * 2);
+          ctx.fill();
+        } else {
+          ctx.fillRect(-p.size / 2, -p.size / 2, p.size, p.size);
+        }
+        ctx.restore();
+      }
+      if (alive && now - start < MAX_MS){
+        win.requestAnimationFrame(frame);
+      } else {
+        win.removeEventListener("resize", resize);
+        canvas.remove();
+      }
+    }
+    win.requestAnimationFrame(frame);
+  }
+
+  global.FoodGameConfetti = {launch};
+})(window);
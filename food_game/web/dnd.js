@@ -0,0 +1,144 @@
+// ══════════════════════════════════════════════
+// 拖放手牌：移動先在瀏覽器端樂觀套用，
+// 累積成一批後（按「確認放入」或停手一段時間）才一次送回 Python
+// ══════════════════════════════════════════════
+(() => {
+const NONCE = Math.random().toString(36).slice(2, 10);
+let args     = null;
+let round    = null;
+let seq      = 0;
+let pending  = [];      // 尚未送出的 [name, cat]
+let inflight = null;    // 已送出、等待伺服器確認的 {id, moves}
+let selected = new Set();
+let timer    = null;
+let dragName = null;
+
+// ── 樂觀狀態：伺服器的剩餘需求扣掉尚未確認的移動 ──
+function queuedMoves(){
+  return (inflight ? inflight.moves : []).concat(pending);
+}
+function remainingNeed(card){
+  let n = card.need;
+  for (const [name] of queuedMoves()) if (name === card.name) n--;
+  return n;
+}
+function alreadyIn(card, cat){
+  if (card.placed_in.includes(cat)) return true;
+  return queuedMoves().some(([n, c]) => n === card.name && c === cat);
+}
+
+function queue(names, cat){
+  if (args.locked) return;
+  const byName = Object.fromEntries(args.cards.map(c => [c.name, c]));
+  for (const name of names){
+    const card = byName[name];
+    if (!card || remainingNeed(card) <= 0) continue;
+    // 特殊卡不能重複放進同一類別
+    if (card.special && alreadyIn(card, cat)) continue;
+    pending.push([name, cat]);
+    selected.delete(name);
+  }
+  render();
+  schedule();
+}
+
+function schedule(){
+  clearTimeout(timer);
+  if (pending.length) timer = setTimeout(commit, args.debounce_ms);
+}
+
+function commit(){
+  clearTimeout(timer);
+  if (inflight || !pending.length) return;
+  inflight = {id: NONCE + "-" + (++seq), moves: pending};
+  pending  = [];
+  Streamlit.setValue(inflight);
+  render();
+}
+
+function render(){
+  const root = document.getElementById("root");
+  const cards = args.cards.filter(c => remainingNeed(c) > 0);
+  let html = "";
+  if (!cards.length){
+    html += '<div class="empty">🎉 手牌已清空！' + (queuedMoves().length ? "正在放入…" : "請點「提交答案」") + '</div>';
+  } else {
+    html += '<div class="hint">拖曳卡片到下方類別，或點卡片（可多選）再點類別</div><div class="grid">';
+    for (const c of cards){
+      const isSel = selected.has(c.name);
+      html += `<div class="card${isSel ? " sel" : ""}${c.special ? " sp" : ""}" draggable="${!args.locked}" data-name="${esc(c.name)}">`
+        + (isSel ? '<div class="badge-sel">✓</div>' : "")
+        + (c.special ? '<div class="badge-star">★特殊</div>' : "")
+        + (c.url ? `<div class="img-wrap"><img src="${esc(c.url)}" loading="lazy"></div>`
+              : `<div class="img-wrap"><div class="tile" style="background:${esc(c.tile)}">${esc(c.name.replace(/^★/, ""))}</div></div>`)
+        + `<div class="card-name${c.special ? " sp-name" : ""}">${esc(c.name)}</div></div>`;
+    }
+    html += "</div>";
+  }
+  html += '<div class="zones">';
+  for (const z of args.categories){
+    const chips = [];
+    if (inflight) for (const [n, c] of inflight.moves) if (c === z.name) chips.push(`<span class="chip sent">${esc(n)}</span>`);
+    for (const [n, c] of pending) if (c === z.name) chips.push(`<span class="chip">${esc(n)}</span>`);
+    html += `<div class="zone" style="--c:${esc(z.color)}" data-cat="${esc(z.name)}">`
+      + `<div class="zone-hdr"><span>${esc(z.name)}</span><span class="zone-cnt">${z.count + chips.length} 張</span></div>`
+      + `<div class="zone-body">${chips.join("")}</div></div>`;
+  }
+  html += "</div>";
+  const waiting = pending.length + (inflight ? inflight.moves.length : 0);
+  html += '<div class="bar"><div class="status">'
+    + (inflight ? "⏳ 正在送出…" : pending.length ? `${pending.length} 張待送出，稍後自動放入` : "")
+    + `</div><button class="flush"${pending.length && !inflight ? "" : " disabled"}>📥 確認放入${waiting ? " (" + waiting + ")" : ""}</button></div>`;
+  root.innerHTML = html;
+  bind();
+}
+
+function bind(){
+  document.querySelectorAll(".card").forEach(el => {
+    const name = el.dataset.name;
+    el.addEventListener("click", () => {
+      if (args.locked) return;
+      selected.has(name) ? selected.delete(name) : selected.add(name);
+      render();
+    });
+    el.addEventListener("dragstart", e => {
+      dragName = name;
+      el.classList.add("dragging");
+      e.dataTransfer.effectAllowed = "move";
+      e.dataTransfer.setData("text/plain", name);
+    });
+    el.addEventListener("dragend", () => { dragName = null; el.classList.remove("dragging"); });
+  });
+  document.querySelectorAll(".zone").forEach(el => {
+    const cat = el.dataset.cat;
+    el.addEventListener("dragover", e => { e.preventDefault(); el.classList.add("over"); });
+    el.addEventListener("dragleave", () => el.classList.remove("over"));
+    el.addEventListener("drop", e => {
+      e.preventDefault();
+      el.classList.remove("over");
+      // 拖曳已選取的卡片時，一起帶走所有選取的卡片
+      const name = dragName || e.dataTransfer.getData("text/plain");
+      queue(selected.has(name) ? [...selected] : [name], cat);
+    });
+    el.addEventListener("click", () => { if (selected.size) queue([...selected], cat); });
+  });
+  const btn = document.querySelector(".flush");
+  if (btn) btn.addEventListener("click", commit);
+}
+
+VIEWS.dnd = {render(next){
+  args = next;
+  // 新的一局：清掉上一局殘留的樂觀狀態
+  if (args.round !== round){
+    round = args.round; pending = []; inflight = null; selected.clear(); clearTimeout(timer);
+  }
+  const inHand = new Set(args.cards.map(c => c.name));
+  for (const n of [...selected]) if (!inHand.has(n)) selected.delete(n);
+  // 伺服器已套用這一批 → 改以伺服器狀態為準，再送出期間累積的下一批
+  if (inflight && args.ack === inflight.id){
+    inflight = null;
+    schedule();
+  }
+  render();
+}};
+})();
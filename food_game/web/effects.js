@@ -0,0 +1,29 @@
+// ══════════════════════════════════════════════
+// 特效播放器：高度為 0，只負責把特效丟到父頁面播放；
+// 以 id 去重，同一個事件即使 args 重送也只播一次
+// ══════════════════════════════════════════════
+(() => {
+const played = new Set();
+const KINDS = {
+  confetti: doc => doc.defaultView.FoodGameConfetti.launch(doc),
+};
+
+// 在父頁面載入 confetti.js：動畫跑在父頁面的 realm，
+// 之後 rerun 就算卸載了這個 iframe 也不會中斷
+function withParentScript(file, fn){
+  const doc = window.parent.document;
+  if (doc.defaultView.FoodGameConfetti) return fn(doc);
+  const s = doc.createElement("script");
+  s.src = new URL(file, window.location.href).href;
+  s.onload = () => fn(doc);
+  doc.head.appendChild(s);
+}
+
+VIEWS.effects = {render(args){
+  for (const fx of args.effects){
+    if (played.has(fx.id) || !KINDS[fx.kind]) continue;
+    played.add(fx.id);
+    withParentScript("confetti.js", KINDS[fx.kind]);
+  }
+}};
+})();
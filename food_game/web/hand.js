@@ -0,0 +1,40 @@
+// ══════════════════════════════════════════════
+// 選取手牌：點卡片只切換 class，不重建 DOM（圖片不重載），
+// 選取清單寫入父頁面網址 ?sel=，按「放入」時 Python 才讀取
+// ══════════════════════════════════════════════
+(() => {
+let selected = new Set();
+let sep = "|||";
+
+function syncQP(){
+  try{
+    const url = new URL(window.parent.location.href);
+    if (selected.size > 0) url.searchParams.set("sel", [...selected].join(sep));
+    else url.searchParams.delete("sel");
+    window.parent.history.replaceState(null, "", url.toString());
+  }catch(e){}
+}
+
+VIEWS.hand = {render(args){
+  sep = args.sep;
+  selected = new Set(args.cards.filter(c => c.selected).map(c => c.name));
+  let html = '<div class="hint">點卡片選取（可多選）→ 點右方 📥 放入</div><div class="grid">';
+  for (const c of args.cards){
+    html += `<div class="card${c.selected ? " sel" : ""}${c.special ? " sp" : ""}${args.locked ? " locked" : ""}" data-name="${esc(c.name)}">`
+      + '<div class="badge-sel">✓</div>'
+      + (c.special ? '<div class="badge-star">★特殊</div>' : "")
+      + (c.url ? `<div class="img-wrap"><img src="${esc(c.url)}" loading="lazy"></div>`
+              : `<div class="img-wrap"><div class="tile" style="background:${esc(c.tile)}">${esc(c.name.replace(/^★/, ""))}</div></div>`)
+      + `<div class="card-name${c.special ? " sp-name" : ""}">`
+      + (c.phonetic ? `<img src="${esc(c.phonetic)}" alt="${esc(c.name)}" loading="lazy">` : esc(c.name)) + "</div></div>";
+  }
+  document.getElementById("root").innerHTML = html + "</div>";
+  if (args.locked) return;
+  document.querySelectorAll(".card").forEach(el => el.addEventListener("click", () => {
+    const name = el.dataset.name;
+    selected.has(name) ? selected.delete(name) : selected.add(name);
+    el.classList.toggle("sel", selected.has(name));
+    syncQP();
+  }));
+}};
+})();
@@ -0,0 +1,49 @@
+// ══════════════════════════════════════════════
+// Streamlit 元件協定（postMessage）＋ 高度同步
+// 高度由 ResizeObserver 驅動：內容有變（含圖片晚到）才回報，
+// 同一個 frame 內多次變化合併成一次，數值沒變就不送
+// ══════════════════════════════════════════════
+const Streamlit = (() => {
+  let lastHeight = -1;
+  let queued = false;
+
+  function send(type, extra){
+    window.parent.postMessage(Object.assign({isStreamlitMessage: true, type}, extra), "*");
+  }
+
+  function reportHeight(){
+    queued = false;
+    const h = Math.ceil(document.documentElement.getBoundingClientRect().height);
+    if (h === lastHeight) return;
+    lastHeight = h;
+    send("streamlit:setFrameHeight", {height: h});
+  }
+
+  function autosize(){
+    new ResizeObserver(() => {
+      if (queued) return;
+      queued = true;
+      requestAnimationFrame(reportHeight);
+    }).observe(document.body);
+  }
+
+  function onRender(fn){
+    window.addEventListener("message", e => {
+      if (e.data && e.data.type === "streamlit:render") fn(e.data.args);
+    });
+  }
+
+  return {
+    send,
+    autosize,
+    onRender,
+    ready: () => send("streamlit:componentReady", {apiVersion: 1}),
+    setValue: value => send("streamlit:setComponentValue", {value, dataType: "json"}),
+  };
+})();
+
+// 卡名、類別名來自租戶設定（tenants.json，可由老師編輯），拼進 innerHTML 前一律跳脫
+const ESC = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"};
+function esc(text){
+  return String(text).replace(/[&<>"']/g, ch => ESC[ch]);
+}
@@ -0,0 +1,92 @@
+// ══════════════════════════════════════════════
+// 競賽面板：拿遊戲行程發的座位 token 連到 hub，只接收同房間的差異封包；
+// 自己的進度由遊戲行程依批改結果回報，這裡不送。
+// 其他人的變化直接更新 DOM，不回傳值給 Streamlit（不觸發 rerun）
+// ══════════════════════════════════════════════
+(() => {
+const root = document.getElementById("root");
+const players = new Map();      // id → {name, l, k, d, on}
+let ws = null, me = null, total = 0, args0 = null, seat = null;
+let retry = 500;
+let drawQueued = false;
+
+root.innerHTML = '<div class="race"><div class="race-title">🏁 競賽進度 <span class="race-state"></span></div><div class="race-list"></div></div>';
+const list  = root.querySelector(".race-list");
+const state = root.querySelector(".race-state");
+
+function hubUrl(args){
+  if (args.hub_url) return args.hub_url;
+  const proto = window.location.protocol === "https:" ? "wss" : "ws";
+  return `${proto}://${window.location.hostname}:${args.hub_port}`;
+}
+
+function connect(){
+  seat = args0.seat;
+  ws = new WebSocket(hubUrl(args0));
+  state.textContent = "連線中…";
+  ws.onopen = () => {
+    retry = 500;
+    ws.send(JSON.stringify({t: "join", seat}));
+  };
+  ws.onmessage = e => {
+    const msg = JSON.parse(e.data);
+    if (msg.t === "snap"){
+      me = msg.you;
+      total = msg.total || args0.total;
+      players.clear();
+      for (const [id, name, l, k, d, on] of msg.p) players.set(id, {name, l, k, d, on});
+      state.textContent = "";
+    } else if (msg.t === "d"){
+      for (const [id, l, k, d, on, name] of msg.p){
+        const p = players.get(id) || {name: name || "?"};
+        Object.assign(p, {l, k, d, on});
+        players.set(id, p);
+      }
+    }
+    queueDraw();
+  };
+  ws.onclose = () => {
+    state.textContent = "連線中斷，重試中…";
+    setTimeout(connect, retry);
+    retry = Math.min(retry * 2, 10000);
+  };
+}
+
+// 同一個 frame 內多個封包只重畫一次
+function queueDraw(){
+  if (drawQueued) return;
+  drawQueued = true;
+  requestAnimationFrame(draw);
+}
+
+function draw(){
+  drawQueued = false;
+  const rows = [...players.entries()].sort((a, b) =>
+    (b[1].d - a[1].d) || (b[1].l - a[1].l) || (a[1].k - b[1].k) || a[1].name.localeCompare(b[1].name));
+  const frag = document.createDocumentFragment();
+  rows.forEach(([id, p], i) => {
+    const pct = total ? Math.round(p.l / total * 100) : 0;
+    const row = document.createElement("div");
+    row.className = "race-row" + (id === me ? " me" : "") + (p.on ? "" : " off") + (p.d ? " done" : "");
+    row.innerHTML = '<span class="rank"></span><span class="name"></span>' +
+      '<span class="bar"><span class="fill"></span></span><span class="meta"></span>';
+    row.querySelector(".rank").textContent = p.d ? "🏆" : String(i + 1);
+    row.querySelector(".name").textContent = p.name;
+    row.querySelector(".fill").style.width = pct + "%";
+    row.querySelector(".meta").textContent = `${p.l}/${total}・${p.k} 次`;
+    frag.appendChild(row);
+  });
+  list.replaceChildren(frag);
+}
+
+VIEWS.race = {render(args){
+  const first = args0 === null;
+  args0 = args;
+  if (first){
+    total = args.total;
+    connect();
+  } else if (args.seat !== seat && ws){
+    ws.close();     // 換了座位（換房間或名字）：onclose 會用新座位重連
+  }
+}};
+})();
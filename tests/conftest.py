@@ -0,0 +1,14 @@
+# 測試共用設定：從專案根目錄 import food_game，並把會寫檔的功能指到暫存目錄
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_TMP = tempfile.mkdtemp(prefix="fg-tests-")
+os.environ.setdefault("FOOD_GAME_DB", os.path.join(_TMP, "lb.db"))
+os.environ.setdefault("FOOD_GAME_EVENTS_DIR", os.path.join(_TMP, "events"))
+os.environ.setdefault("FOOD_GAME_PROFILE_DIR", os.path.join(_TMP, "profiles"))
+os.environ.setdefault("FOOD_GAME_ANALYTICS", "0")
+os.environ.setdefault("FOOD_GAME_STATE", "off")
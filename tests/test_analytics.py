@@ -0,0 +1,76 @@
+# 遊戲數據報表：同一局同一張卡放在同一類只算一次、第一次提交的錯誤率、Wilson 下界
+import math
+
+import pandas as pd
+import pytest
+
+from food_game.analytics import COLUMNS, _wilson_low, error_report
+
+
+def _events() -> pd.DataFrame:
+    rows = [
+        # ts, round, submit_no, kind, card, category, correct
+        (1, "r1", 0, "place", "蘋果", "蔬菜", False),
+        (2, "r1", 1, "judge", "蘋果", "蔬菜", False),
+        (2, "r1", 1, "judge", "香蕉", "水果", True),
+        (3, "r1", 2, "judge", "蘋果", "蔬菜", False),     # 沒退回的錯卡，舊版紀錄再記一次
+        (4, "r1", 3, "judge", "蘋果", "蔬菜", False),     # 第三次還是同一筆
+        (5, "r1", 4, "judge", "蘋果", "水果", True),
+        (6, "r2", 1, "judge", "蘋果", "水果", True),
+        (6, "r2", 1, "judge", "香蕉", "蔬菜", False),
+        (7, "r2", 2, "judge", "香蕉", "水果", True),
+        (8, "r3", 1, "judge", "香蕉", "蔬菜", False),
+    ]
+    df = pd.DataFrame(
+        [(pd.Timestamp(ts, unit="s"), "v", f"s-{rnd}", rnd, no, kind, card, cat, ok)
+         for ts, rnd, no, kind, card, cat, ok in rows],
+        columns=list(COLUMNS),
+    )
+    for c in ("card", "category", "kind"):       # load_events 讀回來的是 dictionary → category
+        df[c] = df[c].astype("category")
+    return df
+
+
+def _wilson(errors: int, n: int, z: float = 1.96) -> float:
+    p = errors / n
+    return (p + z * z / (2 * n) - z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))) / (1 + z * z / n)
+
+
+def test_wilson_low():
+    low = _wilson_low([0, 1, 2, 5], [0, 1, 4, 5])
+    assert low[0] == 0.0                                    # 沒有樣本
+    assert low[1] == pytest.approx(0.2065, abs=1e-4)        # 1／1 的 95% 下界
+    assert low[2] == pytest.approx(_wilson(2, 4))
+    assert low[3] == pytest.approx(_wilson(5, 5))
+    assert low[2] < 0.5 and low[3] < 1
+
+
+def test_rejudged_wrong_card_counted_once():
+    rep = error_report(_events())
+    cards = rep["cards"]
+    assert cards.loc["蘋果", ["judged", "errors"]].tolist() == [3, 1]
+    assert cards.loc["香蕉", ["judged", "errors"]].tolist() == [4, 2]
+    assert cards.loc["蘋果", "error_rate"] == pytest.approx(0.3333)
+    assert cards.loc["香蕉", "error_rate"] == 0.5
+    assert cards.loc["香蕉", "error_low95"] == pytest.approx(round(_wilson(2, 4), 4))
+    assert list(cards.index) == ["香蕉", "蘋果"]              # 依下界排序
+
+    # 每局每張卡最早的一次批改：蘋果 r1 錯、r2 對；香蕉 r1 對、r2 錯、r3 錯
+    assert cards.loc["蘋果", "first_try_error_rate"] == 0.5
+    assert cards.loc["香蕉", "first_try_error_rate"] == pytest.approx(0.6667)
+
+
+def test_category_and_confusion_counts():
+    rep = error_report(_events())
+    cats = rep["categories"]
+    assert cats.loc["蔬菜", ["judged", "errors"]].tolist() == [3, 3]
+    assert cats.loc["水果", ["judged", "errors"]].tolist() == [4, 0]
+    assert cats.loc["蔬菜", "error_rate"] == 1.0
+    assert cats.loc["水果", "error_low95"] == 0.0
+
+    conf = {(r.card, r.category): r.errors for r in rep["confusions"].itertuples()}
+    assert conf == {("香蕉", "蔬菜"): 2, ("蘋果", "蔬菜"): 1}
+
+    s = rep["summary"].iloc[0]
+    assert (s["events"], s["rounds"], s["sessions"], s["judged"]) == (10, 3, 3, 7)
+    assert s["error_rate"] == pytest.approx(0.4286)
@@ -0,0 +1,79 @@
+# 離線包：在擋掉所有對外連線的子行程裡用 AppTest 渲染，畫面、元件參數與前端檔案
+# （HTML／CSS／JS，瀏覽器自己會去抓的 <img src>、<script src>、@import）都不能留下 http(s):// 外部網址
+import json
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from food_game import bundle
+from food_game.variants import VARIANTS
+
+# localhost／127.0.0.1 是離線包自己的伺服器，其他一律算外部網址
+EXTERNAL_RE = re.compile(r"https?://(?!localhost[:/]|127\.0\.0\.1[:/])[^\s\"'<>)\\]+")
+
+# 每個引擎的代表性網址參數：預設手牌、按鈕手牌、注音圖
+QUERIES = {
+    "with_eggs": ({}, {"hand": "buttons"}, {"ff": "+phonetic"}),
+    "v8":        ({}, {"ff": "+phonetic"}),
+}
+
+# 子行程（cwd＝離線包）：渲染每個盤面，把元素樹（含 markdown／html 與元件參數）和前端檔案原文寫成 JSON
+_RENDER = '''\
+import json, os, sys
+from food_game.component import WEB_DIR
+from food_game.snapshot import SCENES, render
+
+script, queries, dump = sys.argv[1], json.loads(sys.argv[2]), sys.argv[3]
+emitted = {}
+for query in queries:
+    for scene in SCENES:
+        tree, _, _ = render(os.path.abspath(script), query, scene, 1)
+        emitted[f"{scene} {query}"] = json.dumps(tree, ensure_ascii=False)
+for name in sorted(os.listdir(WEB_DIR)):
+    with open(os.path.join(WEB_DIR, name), encoding="utf-8", errors="ignore") as f:
+        emitted[f"web/{name}"] = f.read()
+with open(dump, "w", encoding="utf-8") as f:
+    json.dump(emitted, f, ensure_ascii=False)
+'''
+
+
+def build_bundle(variant, out: str):
+    """照 python -m food_game.bundle --no-font 的步驟產生離線包（不釘套件、不下載安裝檔）"""
+    os.makedirs(out)
+    bundle.copy_app(variant, out, None)
+    _, _, missing = bundle.copy_assets(out, bundle.asset_files(bundle.reachable_decks(variant, None)))
+    bundle.write_config(out, variant, bundle.font_face_css(None), missing)
+
+
+@pytest.mark.parametrize("name", sorted(QUERIES))
+def test_bundle_renders_without_external_urls(name, tmp_path):
+    variant = VARIANTS[name]
+    out = str(tmp_path / f"food-game-{name}")
+    build_bundle(variant, out)
+
+    guard = tmp_path / "guard"
+    guard.mkdir()
+    (guard / "sitecustomize.py").write_text(bundle._NETGUARD, encoding="utf-8")
+    blocked, dump = tmp_path / "blocked.log", tmp_path / "emitted.json"
+    env = {k: v for k, v in os.environ.items() if not k.startswith("FOOD_GAME_")}
+    env.update({
+        "PYTHONPATH":            str(guard),
+        bundle.NET_LOG_ENV:      str(blocked),
+        "FOOD_GAME_DB":          str(tmp_path / "lb.db"),
+        "FOOD_GAME_EVENTS_DIR":  str(tmp_path / "events"),
+        "FOOD_GAME_STATE":       "off",
+        "FOOD_GAME_ANALYTICS":   "0",
+    })
+    res = subprocess.run([sys.executable, "-c", _RENDER, variant.file, json.dumps(QUERIES[name]), str(dump)],
+                         cwd=out, env=env, capture_output=True, text=True, timeout=600)
+    assert res.returncode == 0, res.stderr[-2000:]
+
+    assert not blocked.exists(), blocked.read_text(encoding="utf-8")
+    with open(dump, encoding="utf-8") as f:
+        emitted = json.load(f)
+    assert any(k.startswith("web/") for k in emitted)
+    found = {where: sorted(set(EXTERNAL_RE.findall(text))) for where, text in emitted.items()}
+    assert {where: urls for where, urls in found.items() if urls} == {}
@@ -0,0 +1,104 @@
+# 重複點擊合併：窗口內同一個按鈕、其他元件值都沒變的請求才丟掉；翻頁與值有變的請求一律放行
+import pytest
+from streamlit.proto.ClientState_pb2 import ClientState
+
+from food_game import coalesce
+from food_game.coalesce import _Coalescer
+
+SUBMIT = "$$ID-4f2a-submit"
+PLACE  = "$$ID-9c1b-place_0"
+NEXT   = "$$ID-77aa-hand_next"
+PREV   = "$$ID-77ab-hand_prev"
+FILTER = "$$ID-0d3e-hand_filter"
+WINDOW = 0.4
+
+
+def client(*triggers: str, filter_value: str = "全部", query: str = "") -> ClientState:
+    cs = ClientState(query_string=query, page_script_hash="main")
+    for wid in triggers:
+        cs.widget_states.widgets.add(id=wid, trigger_value=True)
+    cs.widget_states.widgets.add(id=FILTER, string_value=filter_value)
+    return cs
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = Clock()
+    monkeypatch.setattr(coalesce.time, "monotonic", c)
+    return c
+
+
+@pytest.fixture
+def rerun():
+    calls = []
+    c = _Coalescer(calls.append, WINDOW)
+    c.calls = calls
+    return c
+
+
+def test_duplicate_trigger_within_window_dropped(rerun, clock):
+    rerun(client(SUBMIT))
+    clock.now += 0.1
+    rerun(client(SUBMIT))
+    assert len(rerun.calls) == 1
+    assert (rerun.accepted, rerun.dropped) == (1, 1)
+
+
+def test_rapid_triple_click_extends_window(rerun, clock):
+    for _ in range(3):
+        rerun(client(PLACE))
+        clock.now += 0.3            # 每一下都在上一下的窗口內，合計超過一個窗口
+    assert len(rerun.calls) == 1
+    clock.now += WINDOW
+    rerun(client(PLACE))
+    assert len(rerun.calls) == 2
+
+
+def test_same_trigger_after_window_goes_through(rerun, clock):
+    rerun(client(SUBMIT))
+    clock.now += WINDOW + 0.01
+    rerun(client(SUBMIT))
+    assert len(rerun.calls) == 2
+
+
+@pytest.mark.parametrize("trigger", [NEXT, PREV])
+def test_repeatable_page_buttons_go_through(rerun, clock, trigger):
+    for _ in range(3):
+        rerun(client(trigger))
+        clock.now += 0.05
+    assert len(rerun.calls) == 3 and rerun.dropped == 0
+
+
+def test_changed_widget_value_goes_through(rerun, clock):
+    rerun(client(PLACE, filter_value="全部"))
+    clock.now += 0.05
+    rerun(client(PLACE, filter_value="水果"))
+    clock.now += 0.05
+    rerun(client(PLACE, filter_value="水果", query="sel=蘋果"))
+    assert len(rerun.calls) == 3
+
+
+def test_different_trigger_goes_through(rerun, clock):
+    rerun(client(PLACE))
+    clock.now += 0.05
+    rerun(client(SUBMIT))
+    assert len(rerun.calls) == 2
+
+
+def test_value_only_and_one_shot_requests_never_dropped(rerun, clock):
+    rerun(client())                 # 沒有按鈕觸發（例如只改了下拉選單）
+    rerun(client())
+    chat = client(SUBMIT)
+    chat.widget_states.widgets.add(id="$$ID-1-chat", string_trigger_value={"data": "hi"})
+    rerun(chat)
+    rerun(chat)
+    rerun(None)
+    assert len(rerun.calls) == 5 and rerun.dropped == 0
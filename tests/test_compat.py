@@ -0,0 +1,44 @@
+# Streamlit 內部結構相容性：釘住的版本每一項都要可用；缺項時效能工具關掉、遊戲照常
+import logging
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from food_game import compat, profiler
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def fresh_internals():
+    compat.internals.cache_clear()
+    yield
+    compat.internals.cache_clear()
+
+
+def test_pinned_streamlit_has_every_internal(fresh_internals):
+    assert compat.internals() == {"enqueue": True, "coalesce": True, "evict": True, "widget_state": True}
+
+
+def test_missing_internals_turn_hooks_off(fresh_internals, monkeypatch, caplog):
+    monkeypatch.setattr(compat, "_check", lambda: {"enqueue": False, "coalesce": False,
+                                                    "evict": True, "widget_state": False})
+    with caplog.at_level(logging.WARNING, logger=compat.__name__):
+        assert not compat.supported("enqueue")
+        assert compat.supported("evict")
+        assert not compat.supported("no_such_feature")
+    assert "enqueue、coalesce、widget_state" in caplog.text
+    assert profiler.tap_context("test", lambda msg: None) is None
+
+
+def test_game_runs_without_internals(fresh_internals, monkeypatch):
+    def broken():
+        raise AttributeError("_enqueue")
+    monkeypatch.setattr(compat, "_check", broken)
+    monkeypatch.setenv("FOOD_GAME_PROFILE", "1")
+    monkeypatch.setenv("FOOD_GAME_PAYLOAD", "1")
+    at = AppTest.from_file(os.path.join(ROOT, "food_game_with_eggs.py"), default_timeout=60)
+    at.run()
+    assert not at.exception
+    assert compat.internals() == {"enqueue": False, "coalesce": False, "evict": False, "widget_state": False}
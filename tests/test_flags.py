@@ -0,0 +1,72 @@
+# 功能開關：版本 → 租戶 → FOOD_GAME_FLAGS → ?hand= → ?ff= 依序覆寫，寫錯的名稱與格式一律略過
+import pytest
+
+from food_game import flags
+from food_game.catalog import Tenant
+from food_game.flags import FLAGS, parse_flags, resolve_flags
+from food_game.variants import Variant
+
+VARIANT = Variant("test", "food_game_with_eggs.py", hand="dnd", eggs=True)
+
+
+@pytest.fixture(autouse=True)
+def no_env_flags(monkeypatch):
+    monkeypatch.setattr(flags, "ENV_FLAGS", "")
+
+
+def test_variant_defaults():
+    f = resolve_flags(VARIANT)
+    assert (f.eggs, f.dnd_hand, f.phonetic, f.iframe_hand) == (True, True, False, False)
+    assert f.engine == "with_eggs"
+
+
+def test_precedence(monkeypatch):
+    tenant = Tenant("school", None, hand_mode="buttons", flags={"phonetic": True, "eggs": False})
+    f = resolve_flags(VARIANT, tenant)
+    assert (f.dnd_hand, f.phonetic, f.eggs) == (False, True, False)     # 租戶蓋過版本
+
+    monkeypatch.setattr(flags, "ENV_FLAGS", "+eggs,-phonetic,+dnd_hand")
+    f = resolve_flags(VARIANT, tenant)
+    assert (f.dnd_hand, f.phonetic, f.eggs) == (True, False, True)      # 環境變數蓋過租戶
+
+    f = resolve_flags(VARIANT, tenant, hand="buttons")
+    assert f.dnd_hand is False                                          # ?hand= 蓋過環境變數
+
+    f = resolve_flags(VARIANT, tenant, hand="buttons", url="dnd_hand,-eggs")
+    assert (f.dnd_hand, f.eggs) == (True, False)                        # ?ff= 最後決定
+
+    f = resolve_flags(VARIANT, tenant, hand="iframe")
+    assert f.engine == "v8"
+
+
+def test_tenant_unknown_flags_ignored():
+    tenant = Tenant("school", None, flags={"no_such_flag": True, "phonetic": 1})
+    f = resolve_flags(VARIANT, tenant)
+    assert f.phonetic is True
+    assert not hasattr(f, "no_such_flag")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("-eggs,+phonetic",       {"eggs": False, "phonetic": True}),
+    ("phonetic",              {"phonetic": True}),
+    (" -eggs , +win_egg ",    {"eggs": False, "win_egg": True}),
+    ("+eggs,-eggs",           {"eggs": False}),                 # 同一個名稱以最後一次為準
+    ("no_such_flag,+bogus",   {}),
+    ("",                      {}),
+    (",,,+,-",                {}),
+    ("++eggs,+-phonetic,--x", {}),
+    ("eggs=1,EGGS,eggs;-x",   {}),
+    ("%2Beggs,+eggs%00",      {}),
+])
+def test_parse_flags(text, expected):
+    assert parse_flags(text) == expected
+
+
+@pytest.mark.parametrize("url", ["+-eggs", ",,", "eggs=0", "hand=buttons", "+" * 1000])
+def test_malformed_url_keeps_defaults(url):
+    assert resolve_flags(VARIANT, url=url).key == resolve_flags(VARIANT).key
+
+
+def test_unknown_hand_mode_ignored():
+    assert resolve_flags(VARIANT, hand="sideways").key == resolve_flags(VARIANT).key
+    assert set(resolve_flags(VARIANT).key.split(",")) <= set(FLAGS)
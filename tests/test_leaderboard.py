@@ -0,0 +1,66 @@
+# 排行榜：剛記錄、還在佇列裡的回合馬上出現在前 N 名，寫入後不重複；新紀錄讓該版本與全部版本的快取失效
+import sqlite3
+
+import pytest
+
+from food_game import leaderboard
+from food_game.leaderboard import _COLUMNS, Leaderboard
+
+
+@pytest.fixture
+def lb(tmp_path, monkeypatch):
+    monkeypatch.setattr(leaderboard, "BATCH_WAIT_S", 1.0)    # 背景寫入先等一下，查詢時紀錄還在佇列
+    return Leaderboard(str(tmp_path / "lb.db"))
+
+
+def _players(rows: list[dict]) -> list[str]:
+    return [r["player"] for r in rows]
+
+
+def test_pending_round_visible_before_and_after_flush(lb):
+    lb.record(variant="v", score=30, submits=2, duration_s=61, player="舊")
+    assert lb.flush()
+    lb.record(variant="v", score=50, submits=1, duration_s=42.04, player="新")
+    assert lb._pending
+    rows = lb.top(10, variant="v")
+    assert _players(rows) == ["新", "舊"]
+    assert rows[0]["duration_s"] == 42.0
+
+    assert lb.flush()
+    assert not lb._pending
+    lb._cache.clear()
+    assert _players(lb.top(10, variant="v")) == ["新", "舊"]
+
+
+def test_write_finishing_mid_query_is_not_duplicated(lb):
+    lb.record(variant="v", score=50, submits=1, duration_s=10, player="甲")
+    # 模擬查詢途中寫入剛好完成：同一筆同時在資料庫與佇列裡
+    with sqlite3.connect(lb.path) as conn:
+        conn.execute(f"INSERT INTO rounds ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)", lb._pending[0])
+    assert _players(lb.top(10, variant="v")) == ["甲"]
+    assert _players(lb.top(10)) == ["甲"]
+
+
+def test_pending_rows_respect_filters_and_limit(lb):
+    lb.record(variant="v", score=50, submits=1, duration_s=10, classroom="3A", player="甲")
+    lb.record(variant="v", score=40, submits=1, duration_s=10, classroom="3B", player="乙")
+    lb.record(variant="w", score=60, submits=1, duration_s=10, classroom="3A", player="丙")
+    assert _players(lb.top(10, variant="v", classroom="3A")) == ["甲"]
+    assert _players(lb.top(10, variant="v")) == ["甲", "乙"]
+    assert _players(lb.top(2)) == ["丙", "甲"]
+
+
+def test_record_invalidates_cached_top(lb):
+    lb.record(variant="v", score=30, submits=1, duration_s=10, player="甲")
+    lb.record(variant="w", score=30, submits=1, duration_s=10, player="乙")
+    assert lb.flush()
+    assert _players(lb.top(10, variant="v")) == ["甲"]
+    assert _players(lb.top(10)) == ["甲", "乙"]
+    assert _players(lb.top(10, variant="w")) == ["乙"]
+    assert set(lb._cache) == {(10, "v", None), (10, None, None), (10, "w", None)}
+
+    lb.record(variant="v", score=90, submits=1, duration_s=10, player="丙")
+    assert set(lb._cache) == {(10, "w", None)}          # 別的版本的快取不受影響
+    assert _players(lb.top(10, variant="v")) == ["丙", "甲"]
+    assert _players(lb.top(10)) == ["丙", "甲", "乙"]
+    assert _players(lb.top(10, variant="w")) == ["乙"]
@@ -0,0 +1,46 @@
+# Session 登錄表：總量裡的 key 數是 session_state 的 key、rerun 次數照實回報，閒置的才回收
+import sys
+from collections import deque
+
+from food_game.sessions import SessionRegistry, approx_size
+
+
+def test_totals_report_state_keys_and_runs():
+    reg = SessionRegistry(ttl_s=60)
+    assert reg.seen("a", 100.0)
+    reg.measured("a", 100.0, 1000, 12)
+    assert not reg.seen("a", 101.0)           # MEASURE_EVERY_S 內不重估
+    reg.seen("b", 102.0)
+    reg.measured("b", 102.0, 3000, 5)
+
+    t = reg.totals(now=110.0)
+    assert t["sessions"] == 2
+    assert t["state_keys"] == 17
+    assert t["runs"] == 3
+    assert (t["bytes"], t["avg_bytes"], t["max_bytes"]) == (4000, 2000, 3000)
+    assert "widget_keys" not in t
+
+
+def test_idle_and_forget():
+    reg = SessionRegistry(ttl_s=60)
+    reg.seen("a", 0.0)
+    reg.measured("a", 0.0, 500, 3)
+    reg.seen("b", 50.0)
+    assert reg.idle(100.0) == ["a"]
+    reg.forget("a", evicted=True)
+    reg.forget("b", evicted=False)
+    t = reg.totals(now=100.0)
+    assert (t["sessions"], t["evicted"], t["evicted_bytes"], t["closed"]) == (0, 1, 500, 1)
+    assert SessionRegistry(ttl_s=0).idle(1e9) == []
+
+
+def test_approx_size_counts_shared_objects_once():
+    inner = ["x" * 100]
+    assert approx_size({"a": inner, "b": inner}) < approx_size({"a": inner, "b": ["x" * 100]})
+
+
+def test_approx_size_counts_deque_contents():
+    items = [str(i) * 200 for i in range(5)]
+    d = deque(items, maxlen=10)
+    assert approx_size(d) == sys.getsizeof(d) + sum(sys.getsizeof(x) for x in items)
+    assert approx_size({"hist": d}) > approx_size({"hist": deque(maxlen=10)}) + 1000
@@ -0,0 +1,26 @@
+# 畫面快照回歸：每個目標×盤面都要和 food_game/snapshots/ 的快照一模一樣
+# 畫面是刻意改的就用 python -m food_game.snapshot --update 重新錄製
+import os
+
+import pytest
+
+from food_game import flags, leaderboard, snapshot
+
+
+@pytest.fixture
+def quiet(tmp_path, monkeypatch):
+    for env in snapshot.QUIET_ENV:
+        monkeypatch.delenv(env, raising=False)
+    monkeypatch.setattr(flags, "ENV_FLAGS", "")
+    monkeypatch.setattr(leaderboard, "DB_PATH", str(tmp_path / "lb.db"))    # 過關盤面看到的是空榜
+    leaderboard.get_leaderboard.clear()
+    yield
+    leaderboard.get_leaderboard.clear()
+
+
+@pytest.mark.parametrize("target, script, query", snapshot.TARGETS, ids=[t[0] for t in snapshot.TARGETS])
+@pytest.mark.parametrize("scene", snapshot.SCENES)
+def test_scene_matches_snapshot(quiet, target, script, query, scene):
+    tree, html, _ = snapshot.render(os.path.join(snapshot.ROOT, script), dict(query), scene, 1)
+    diff = snapshot.check(target, scene, tree, html, update=False)
+    assert not diff, "\n".join(diff)
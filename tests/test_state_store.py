@@ -0,0 +1,132 @@
+# 外部遊戲狀態：store 裡的資料壞掉（截斷、亂碼、舊版格式）時，頁面要照常開新局
+import os
+import socket
+import subprocess
+import sys
+import time
+import zlib
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from food_game import state_store
+from food_game.state_store import TOKEN_PARAM, encode_state, open_store
+
+ROOT  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOKEN = "brokenstate01"
+
+BLOBS = {
+    "truncated": b"z" + zlib.compress(b'{"score":1,"placed":{}}' * 40)[:20],
+    "garbage":   b"\x00\xff not a state",
+    "bad-json":  b'j{"score":',
+    "not-dict":  b"j[1,2,3]",
+    "old":       encode_state({"game_init": True, "score": 30}),    # 少了後來才加的欄位
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, "-m", "food_game.resp_server", "--port", str(port)],
+                            cwd=ROOT, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    yield f"redis://127.0.0.1:{port}/0"
+    proc.terminate()
+    proc.wait(5)
+
+
+@pytest.fixture(params=["disk", "sqlite", "redis"])
+def store_url(request, tmp_path):
+    if request.param == "disk":
+        return f"disk:{tmp_path / 'checkpoints'}"
+    if request.param == "sqlite":
+        return f"sqlite:{tmp_path / 'state.db'}"
+    return request.getfixturevalue("redis_url")
+
+
+@pytest.mark.parametrize("blob", sorted(BLOBS))
+def test_corrupt_state_starts_fresh_game(store_url, blob, monkeypatch):
+    monkeypatch.setenv("FOOD_GAME_STATE", store_url)
+    monkeypatch.setenv("FOOD_GAME_STATE_WRITE", "through")
+    state_store.get_state_store.clear()
+    store = open_store(store_url)
+    store.put(TOKEN, BLOBS[blob])
+
+    at = AppTest.from_file(os.path.join(ROOT, "food_game_with_eggs.py"), default_timeout=60)
+    at.query_params[TOKEN_PARAM] = TOKEN
+    at.run()
+
+    assert not at.exception
+    assert at.session_state["score"] == 0 and at.session_state["submit_count"] == 0
+    assert store.get(TOKEN) is None                         # 壞掉的 token 被丟掉
+    assert at.session_state["_state_token"] != TOKEN        # 換了新 token 重新存
+    state_store.get_state_store.clear()
+
+
+def test_valid_state_is_restored(tmp_path, monkeypatch):
+    url = f"disk:{tmp_path / 'checkpoints'}"
+    monkeypatch.setenv("FOOD_GAME_STATE", url)
+    monkeypatch.setenv("FOOD_GAME_STATE_WRITE", "through")
+    state_store.get_state_store.clear()
+
+    at = AppTest.from_file(os.path.join(ROOT, "food_game_with_eggs.py"), default_timeout=60)
+    at.run()
+    token = at.session_state["_state_token"]
+    deck = at.session_state["deck"]
+
+    again = AppTest.from_file(os.path.join(ROOT, "food_game_with_eggs.py"), default_timeout=60)
+    again.query_params[TOKEN_PARAM] = token
+    again.run()
+    assert not again.exception
+    assert again.session_state["deck"] == deck
+    assert again.session_state["_state_token"] != token     # 還原後改用新 token
+    assert again.query_params[TOKEN_PARAM] == again.session_state["_state_token"]
+    state_store.get_state_store.clear()
+
+
+def _open(token: str | None = None) -> AppTest:
+    at = AppTest.from_file(os.path.join(ROOT, "food_game_with_eggs.py"), default_timeout=60)
+    if token:
+        at.query_params[TOKEN_PARAM] = token
+    at.run()
+    assert not at.exception
+    return at
+
+
+def test_shared_url_sessions_do_not_overwrite_each_other(tmp_path, monkeypatch):
+    """同一個 ?s= 網址開在兩個分頁（或傳給同學）：兩邊都從同一盤開始，之後各存各的"""
+    monkeypatch.setenv("FOOD_GAME_STATE", f"disk:{tmp_path / 'checkpoints'}")
+    monkeypatch.setenv("FOOD_GAME_STATE_WRITE", "through")
+    state_store.get_state_store.clear()
+
+    first = _open()
+    first.session_state["score"] = 7
+    first.run()
+    shared = first.session_state["_state_token"]
+
+    second = _open(shared)
+    assert second.session_state["score"] == 7
+    own = second.session_state["_state_token"]
+    assert own != shared
+
+    second.session_state["score"] = 99
+    second.run()
+    first.session_state["score"] = 8
+    first.run()
+    assert first.session_state["_state_token"] == shared
+
+    assert _open(shared).session_state["score"] == 8
+    assert _open(own).session_state["score"] == 99
+    state_store.get_state_store.clear()